@@ -0,0 +1,40 @@
+"""
+tba
+"""
+from rest_framework import status, viewsets
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from api.utils.db_pool_handler import get_pool_stats
+from api.utils.invalidation_bus_handler import get_invalidation_bus_stats
+from api.utils.prepared_statement_handler import (
+    get_prepared_statement_stats
+)
+from api.utils.reference_data_handler import get_reference_stats
+from api.utils.representation_cache_handler import get_representation_cache
+
+
+class DatabaseStatsViewSet(viewsets.ViewSet):
+    """
+    API endpoint that reports connection pool, prepared statement,
+    representation cache, reference data and invalidation bus statistics for
+    the worker serving the request.
+
+    Restricted to admin users. Prepared statements belong to a database
+    session, so the figures describe the pooled connection the request was
+    given.
+    """
+    permission_classes = [IsAdminUser]
+    swagger_tags = ['Admin']
+
+    def list(self, request: Request) -> Response:
+        """Return pool and prepared statement stats for `default`."""
+        cache = get_representation_cache()
+        return Response({
+            'pool': get_pool_stats('default'),
+            'prepared_statements': get_prepared_statement_stats('default'),
+            'representation_cache': cache.stats() if cache else None,
+            'reference_data': get_reference_stats(),
+            'invalidation_bus': get_invalidation_bus_stats(),
+        }, status=status.HTTP_200_OK)
@@ -1,9 +1,23 @@
 """
 tba
 """
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.conf import settings
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiResponse
+)
 from rest_framework import serializers
 
+from api.utils.hateoas_mixin import (
+    LINKS_FULL,
+    LINKS_HEADER,
+    LINKS_MODES,
+    LINKS_NONE,
+    LINKS_QUERY_PARAM,
+    HATEOASMixin
+)
+
 DEFAULT_SCHEMA_OPTIONS = {
     
 }
@@ -20,6 +34,73 @@ DEFAULT_ERROR_RESPONSES = {
     500: OpenApiResponse(description='Internal Server Error:  an unexpected condition on the server that prevented it from fulfilling the request.'),    
 }
 
+LINKS_DESCRIPTION = (
+    'Verbosity of `_links`: `none` omits them, `compact` keeps only each '
+    'object\'s `self` link, `full` returns every link. In lists, collection '
+    'links (list, create, options, head, next, previous) appear once in the '
+    'page\'s `_links`. Defaults to `{default}`.'
+)
+
+
+def build_links_parameters(default: str) -> list[OpenApiParameter]:
+    """
+    Parameters choosing the verbosity of `_links`, defaulting to `default`.
+    """
+    return [
+        OpenApiParameter(
+            name=LINKS_QUERY_PARAM,
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            enum=list(LINKS_MODES),
+            default=default,
+            description=LINKS_DESCRIPTION.format(default=default)
+        ),
+        OpenApiParameter(
+            name=LINKS_HEADER,
+            type=str,
+            location=OpenApiParameter.HEADER,
+            required=False,
+            enum=list(LINKS_MODES),
+            description=(
+                f'Same as `?{LINKS_QUERY_PARAM}=`; the query parameter '
+                'wins.'
+            )
+        ),
+    ]
+
+
+def has_hateoas_links(serializer: type[serializers.Serializer]) -> bool:
+    """
+    Whether a response serializer, or a serializer it nests, adds `_links`.
+    """
+    if issubclass(serializer, HATEOASMixin):
+        return True
+    for field in getattr(serializer, '_declared_fields', {}).values():
+        if isinstance(getattr(field, 'child', field), HATEOASMixin):
+            return True
+    return False
+
+
+SPARSE_FIELDS_OPERATIONS = ("list", "retrieve")
+
+SPARSE_FIELDS_PARAMETERS = [
+    OpenApiParameter(
+        name='fields',
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description='Comma-separated fields to return; nested fields use `__` (e.g. `name,country_region__name`). Unknown fields return 400.'
+    ),
+    OpenApiParameter(
+        name='exclude',
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description='Comma-separated fields to leave out; nested fields use `__`. Unknown fields return 400.'
+    ),
+]
+
 
 def build_schema_extension(
     *,
@@ -29,7 +110,8 @@ def build_schema_extension(
     success_code: int = 200,
     extra_responses: dict[int, OpenApiResponse] = None,
     request_serializer: type[serializers.Serializer] = None,
-    tags: list[str] = None
+    tags: list[str] = None,
+    parameters: list[OpenApiParameter] = None
 ):
     """
     Factory for generating a full extend_schema decorator for DRF endpoints.
@@ -42,6 +124,9 @@ def build_schema_extension(
         extra_responses (dict): Optional additional error responses.
         request_serializer (Serializer): Optional request body serializer.
         tags (list): Optional OpenAPI tags.
+        parameters (list): Optional extra parameters. Operations returning
+            HATEOAS resources also document the `links` verbosity option, and
+            list/retrieve the `fields`/`exclude` sparse fieldsets.
         summary (str): Optional short summary.
         description (str): Optional long-form description.
 
@@ -56,10 +141,21 @@ def build_schema_extension(
     error_responses = {**DEFAULT_ERROR_RESPONSES, **(extra_responses or {})}
     all_responses = {**success_response, **error_responses}
 
+    all_parameters = list(parameters or [])
+    if operation_id != "destroy" and has_hateoas_links(serializer):
+        if operation_id == "list":
+            default = getattr(settings, 'HATEOAS_LIST_LINKS_DEFAULT', LINKS_NONE)
+        else:
+            default = getattr(settings, 'HATEOAS_LINKS_DEFAULT', LINKS_FULL)
+        all_parameters.extend(build_links_parameters(default))
+    if operation_id in SPARSE_FIELDS_OPERATIONS:
+        all_parameters.extend(SPARSE_FIELDS_PARAMETERS)
+
     return extend_schema(
         operation_id=operation_id,
         responses=all_responses,
         request=request_serializer,
+        parameters=all_parameters,
         tags=tags,
         summary=summary,
         description=description
@@ -0,0 +1,189 @@
+"""
+Precomputed OpenAPI schema, served from memory.
+
+Generating the drf-spectacular schema walks every viewset and every
+`build_schema_extension` decorator, which is far too much work to repeat for
+each docs page view. The schema is instead produced once per process:
+
+- loaded from `OPENAPI_SCHEMA_FILE` when set, a file written at build time
+  by drf-spectacular's own command:
+
+      python manage.py spectacular --format openapi-json --file openapi.json
+
+- otherwise generated when the worker starts (`core.wsgi`/`core.asgi`), or
+  on the first request if that failed.
+
+Each format is rendered once into a `SchemaDocument`: the bytes, their gzip
+compression and a strong ETag. `SchemaView` answers `If-None-Match` with
+`304 Not Modified` and sends the gzip bytes as-is to clients accepting them,
+so serving the schema costs no more than serving a static file. The Swagger
+UI and Redoc pages load it from `SchemaView` instead of regenerating it.
+
+Example:
+    path("<format>", SchemaView.as_view(), name="schema-json")
+"""
+
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views import View
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import (
+    OpenApiJsonRenderer,
+    OpenApiYamlRenderer
+)
+
+from api.utils.logging_handler import log_event
+
+
+FORMATS = {
+    '.json': ('json', OpenApiJsonRenderer),
+    '.yaml': ('yaml', OpenApiYamlRenderer),
+    '.yml': ('yaml', OpenApiYamlRenderer),
+}
+
+
+class SchemaDocument:
+    """
+    One rendering of the schema, ready to be sent.
+
+    Attributes:
+        - content (bytes): The rendered schema.
+        - gzipped (bytes): `content`, gzip-compressed.
+        - content_type (str): Media type of `content`.
+        - etag (str): Strong ETag of `content`.
+        - gzip_etag (str): Strong ETag of `gzipped`.
+    """
+
+    def __init__(self, content: bytes, content_type: str):
+        self.content = content
+        self.gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+        self.content_type = content_type
+        digest = hashlib.sha256(content).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+
+def load_schema() -> Dict[str, Any]:
+    """
+    Read the schema from `OPENAPI_SCHEMA_FILE`, or generate it.
+    """
+    path = getattr(settings, 'OPENAPI_SCHEMA_FILE', '')
+    if path:
+        text = Path(path).read_text(encoding='utf-8')
+        if path.endswith('.json'):
+            return json.loads(text)
+        return yaml.safe_load(text)
+    return SchemaGenerator().get_schema(request=None, public=True)
+
+
+@lru_cache(maxsize=None)
+def get_schema_documents() -> Dict[str, SchemaDocument]:
+    """
+    Return the schema rendered in every format, by format.
+    """
+    schema = load_schema()
+    documents = {}
+    for fmt, renderer_class in set(FORMATS.values()):
+        renderer = renderer_class()
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type += f'; charset={renderer.charset}'
+        documents[fmt] = SchemaDocument(
+            renderer.render(schema, renderer_context={}),
+            content_type
+        )
+    return documents
+
+
+def preload_schema() -> None:
+    """
+    Build the schema documents now; failures are logged and retried on the
+    first request.
+    """
+    try:
+        documents = get_schema_documents()
+    except Exception as exc:  # pylint: disable=broad-except
+        log_event(
+            "ERROR",
+            "OpenAPI schema generation failed",
+            error=str(exc)
+        )
+        return
+    log_event(
+        "INFO",
+        "OpenAPI schema loaded",
+        source=getattr(settings, 'OPENAPI_SCHEMA_FILE', '') or 'generated',
+        json_bytes=len(documents['json'].content),
+        json_gzip_bytes=len(documents['json'].gzipped)
+    )
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an `Accept-Encoding` header accepts gzip, honouring q-values:
+    `gzip;q=0` refuses it, and `*` covers it unless gzip is listed.
+    """
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+class SchemaView(View):
+    """
+    Serves the precomputed schema, e.g. `/swagger.json` or `/swagger.yaml`.
+    """
+
+    def get(self, request: HttpRequest, format: str) -> HttpResponse:
+        # pylint: disable=redefined-builtin
+        """
+        Return the schema, gzip-encoded when accepted, or a 304.
+        """
+        suffix = Path(format).suffix.lower()
+        if suffix not in FORMATS:
+            raise Http404("Unknown schema format.")
+        document = get_schema_documents()[FORMATS[suffix][0]]
+
+        if accepts_gzip(request.headers.get('Accept-Encoding', '')):
+            content, etag = document.gzipped, document.gzip_etag
+        else:
+            content, etag = document.content, document.etag
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                content,
+                content_type=document.content_type
+            )
+            if content is document.gzipped:
+                response['Content-Encoding'] = 'gzip'
+        response['ETag'] = etag
+        # the schema only changes with a deploy: revalidate, cheaply
+        response['Cache-Control'] = 'no-cache'
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
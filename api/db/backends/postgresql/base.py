@@ -0,0 +1,28 @@
+"""
+PostgreSQL database engine of the API.
+
+Django's PostgreSQL backend, compiling queries with `api.db.compiler` so a
+query joining tables of different database servers raises
+`CrossDatabaseJoinError` before it is sent.
+
+Example:
+    DATABASES = {"default": {"ENGINE": "api.db.backends.postgresql", ...}}
+"""
+
+from django.db.backends.postgresql import base, operations
+
+
+class DatabaseOperations(operations.DatabaseOperations):
+    """
+    PostgreSQL operations using the API's SQL compilers.
+    """
+
+    compiler_module = "api.db.compiler"
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL connection wrapper using `DatabaseOperations`.
+    """
+
+    ops_class = DatabaseOperations
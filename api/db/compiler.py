@@ -0,0 +1,64 @@
+"""
+SQL compilers refusing joins that span database servers.
+
+Django's compilers, with one addition: once a query's joins are set up
+(including those added by `select_related`), `check_single_server` verifies
+that every joined table lives on the server of the alias the query runs on,
+and raises `CrossDatabaseJoinError` otherwise. The `api.db.backends.postgresql`
+engine compiles every query with this module, so the check covers all models
+and managers.
+
+Example:
+    DATABASES = {"default": {"ENGINE": "api.db.backends.postgresql", ...}}
+"""
+
+from django.db.models.sql import compiler
+
+from api.db.schema_router import check_single_server
+
+
+class DomainCompilerMixin:
+    """
+    Checks the joins of a query once they are set up.
+    """
+
+    def pre_sql_setup(self, *args, **kwargs):
+        """
+        Set up the query, then refuse joins across database servers.
+        """
+        result = super().pre_sql_setup(*args, **kwargs)
+        check_single_server(self.query, self.using)
+        return result
+
+
+class SQLCompiler(DomainCompilerMixin, compiler.SQLCompiler):
+    """
+    SELECT compiler.
+    """
+
+
+class SQLInsertCompiler(DomainCompilerMixin, compiler.SQLInsertCompiler):
+    """
+    INSERT compiler.
+    """
+
+
+class SQLDeleteCompiler(DomainCompilerMixin, compiler.SQLDeleteCompiler):
+    """
+    DELETE compiler.
+    """
+
+
+class SQLUpdateCompiler(DomainCompilerMixin, compiler.SQLUpdateCompiler):
+    """
+    UPDATE compiler.
+    """
+
+
+class SQLAggregateCompiler(
+    DomainCompilerMixin,
+    compiler.SQLAggregateCompiler
+):
+    """
+    Compiler of aggregates over a subquery.
+    """
@@ -0,0 +1,185 @@
+"""
+Read-replica database router.
+
+Sends reads to the replicas listed for a model's primary alias in
+`settings.DATABASE_REPLICAS`. Writes, and reads with no usable replica, are
+left to the next router (`SchemaRouter`), which picks the primary alias of the
+model's domain. Replicas are only used while their replay lag stays under
+`DB_REPLICA_MAX_LAG` seconds; the lag of each replica is measured at most once
+every `DB_REPLICA_LAG_CHECK_INTERVAL` seconds per process.
+
+Inside `use_replica_per_request()`, which `ReplicaPinMiddleware` wraps around
+every request, the replica of each primary is picked once, on the request's
+first read, and every later read of the request goes to it: the lag check and
+the choice are not repeated per query, and the reads of one response never
+mix snapshots of replicas at different replay positions.
+
+Code that must read its own writes (unsafe requests, and clients pinned by
+`ReplicaPinMiddleware`) runs inside `use_primary()`, which sends every read to
+the primary for the duration of the block.
+
+Example:
+    with use_primary():
+        instance = StateProvince.objects.get(state_province_id=1)
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+from api.db.schema_router import get_model_alias, get_primary_of
+from api.utils.logging_handler import log_event
+
+
+# Replay lag in seconds; 0 when the replica has replayed everything it has
+# received, so an idle primary does not make a healthy replica look stale.
+REPLICA_LAG_SQL: str = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+_use_primary: ContextVar[bool] = ContextVar("use_primary", default=False)
+
+# primary alias -> replica picked for the current request (None: primary)
+_request_replicas: ContextVar[Optional[Dict[str, Optional[str]]]] = (
+    ContextVar("request_replicas", default=None)
+)
+
+# alias -> (checked_at, lag in seconds or None when unreachable)
+_replica_lag: Dict[str, Tuple[float, Optional[float]]] = {}
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Route every read made inside the block to the primary database.
+    """
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+@contextmanager
+def use_replica_per_request() -> Iterator[None]:
+    """
+    Send the reads made inside the block to one replica per primary alias,
+    picked on the first read.
+    """
+    token = _request_replicas.set({})
+    try:
+        yield
+    finally:
+        _request_replicas.reset(token)
+
+
+def get_replica_lag(alias: str) -> Optional[float]:
+    """
+    Return the replay lag of a replica, re-measuring it when the cached value
+    is older than `DB_REPLICA_LAG_CHECK_INTERVAL`.
+
+    Args:
+        alias (str): Replica alias from `settings.DATABASES`.
+
+    Returns:
+        float | None: Lag in seconds, or None if the replica is unreachable.
+    """
+    interval = getattr(settings, "DB_REPLICA_LAG_CHECK_INTERVAL", 10)
+    now = time.monotonic()
+
+    checked_at, lag = _replica_lag.get(alias, (None, None))
+    if checked_at is not None and now - checked_at < interval:
+        return lag
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(REPLICA_LAG_SQL)
+            lag = float(cursor.fetchone()[0])
+    except DatabaseError as exc:
+        log_event(
+            "WARNING",
+            "Database replica unreachable",
+            alias=alias,
+            error=str(exc)
+        )
+        lag = None
+
+    _replica_lag[alias] = (now, lag)
+    return lag
+
+
+def get_healthy_replicas(primary: str) -> List[str]:
+    """
+    Return the replicas of a primary alias whose lag is within
+    `DB_REPLICA_MAX_LAG`.
+    """
+    max_lag = getattr(settings, "DB_REPLICA_MAX_LAG", 5)
+    healthy = []
+
+    for alias in getattr(settings, "DATABASE_REPLICAS", {}).get(primary, []):
+        lag = get_replica_lag(alias)
+        if lag is not None and lag <= max_lag:
+            healthy.append(alias)
+
+    return healthy
+
+
+class ReplicaRouter:
+    """
+    Routes reads to a healthy replica of the model's primary alias.
+    """
+
+    # pylint: disable=unused-argument
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        """
+        Pick a random healthy replica, once per request, or defer to the
+        next router when the current context is pinned or no replica is
+        within the lag limit.
+        """
+        if _use_primary.get():
+            return None
+
+        primary = get_model_alias(model)
+        picked = _request_replicas.get()
+        if picked is not None and primary in picked:
+            return picked[primary]
+
+        replicas = get_healthy_replicas(primary)
+        replica = random.choice(replicas) if replicas else None
+        if picked is not None:
+            picked[primary] = replica
+        return replica
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        """
+        Writes never go to a replica.
+        """
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        """
+        Allow relations between objects loaded from a primary and its
+        replicas, since they hold the same data.
+        """
+        if get_primary_of(obj1._state.db) == get_primary_of(obj2._state.db):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Never migrate replicas; they follow their primary.
+        """
+        if get_primary_of(db) != db:
+            return False
+        return None
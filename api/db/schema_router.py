@@ -0,0 +1,151 @@
+"""
+Schema-aware database router.
+
+Maps each domain app (`people`, `production`, `sales`) to the database alias
+holding its schema, as configured in `settings.DATABASE_APPS_MAPPING`. Apps
+without an entry stay on `default`, so with an empty mapping every model is
+routed exactly as before.
+
+Relations between domains (e.g. `StateProvince.sales_territory`) keep working
+for reads: the related object is fetched with a separate query routed to its
+own alias. A single SQL statement that joins tables living on different
+database servers (`select_related`, filters across relations, ...) cannot work
+and raises `CrossDatabaseJoinError` before it is sent, whatever the model; use
+`prefetch_related` or separate queries instead. The check runs in the SQL
+compilers of the `api.db.backends.postgresql` engine (see `api.db.compiler`).
+
+Example:
+    DATABASE_APPS_MAPPING = {"sales": "sales"}
+
+    StateProvince.objects.get(pk=1).sales_territory       # two queries, OK
+    StateProvince.objects.select_related("sales_territory")  # raises
+"""
+
+from typing import Dict, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import NotSupportedError
+from django.db.models.sql import Query
+
+
+PRIMARY_ALIAS: str = "default"
+
+
+class CrossDatabaseJoinError(NotSupportedError):
+    """
+    Raised when a query joins tables that live on different database servers.
+    """
+
+
+def get_app_alias(app_label: str) -> str:
+    """
+    Return the primary alias for an app label.
+    """
+    return getattr(settings, "DATABASE_APPS_MAPPING", {}).get(
+        app_label,
+        PRIMARY_ALIAS
+    )
+
+
+def get_model_alias(model) -> str:
+    """
+    Return the primary alias for a model.
+    """
+    return get_app_alias(model._meta.app_label)
+
+
+def get_primary_of(alias: str) -> str:
+    """
+    Return the primary alias a replica follows, or the alias itself.
+    """
+    replicas = getattr(settings, "DATABASE_REPLICAS", {})
+    for primary, aliases in replicas.items():
+        if alias in aliases:
+            return primary
+    return alias
+
+
+def get_server(alias: str) -> Tuple[str, str, str]:
+    """
+    Identify the database server holding an alias's data; replicas count as
+    their primary's server.
+    """
+    db = settings.DATABASES[get_primary_of(alias)]
+    return (db.get("HOST", ""), str(db.get("PORT", "")), db.get("NAME", ""))
+
+
+_table_models: Dict[str, type] = {}
+
+
+def get_table_model(table_name: str) -> Optional[type]:
+    """
+    Return the model mapped to a database table, if any.
+    """
+    if not _table_models:
+        _table_models.update({
+            model._meta.db_table: model for model in apps.get_models()
+        })
+    return _table_models.get(table_name)
+
+
+def check_single_server(query: Query, using: str) -> None:
+    """
+    Raise `CrossDatabaseJoinError` if any table joined by `query` lives on a
+    different server than the alias the query runs on.
+    """
+    if not getattr(settings, "DATABASE_APPS_MAPPING", {}):
+        return
+
+    server = get_server(using)
+    for alias, join in query.alias_map.items():
+        if not query.alias_refcount.get(alias):
+            continue
+
+        model = get_table_model(join.table_name)
+        if model is None:
+            continue
+
+        model_alias = get_model_alias(model)
+        if get_server(model_alias) != server:
+            raise CrossDatabaseJoinError(
+                f"{query.model.__name__} query on database '{using}' joins "
+                f"'{join.table_name}' ({model.__name__}), which lives on "
+                f"database '{model_alias}'. Cross-database joins are not "
+                "supported; use prefetch_related() or separate queries."
+            )
+
+
+class SchemaRouter:
+    """
+    Routes each model to the alias of its domain schema.
+    """
+
+    # pylint: disable=unused-argument
+    def db_for_read(self, model, **hints) -> str:
+        """
+        Read from the alias of the model's domain.
+        """
+        return get_model_alias(model)
+
+    def db_for_write(self, model, **hints) -> str:
+        """
+        Write to the alias of the model's domain.
+        """
+        return get_model_alias(model)
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        """
+        Allow relations across domains; the related object is always loaded
+        with its own query on its own alias.
+        """
+        aliases = set(settings.DATABASES)
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Migrate an app only on the alias of its domain.
+        """
+        return db == get_app_alias(app_label)
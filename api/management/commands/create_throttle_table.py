@@ -0,0 +1,39 @@
+"""
+Create the table holding the throttle token buckets.
+
+The unlogged table `api_throttle_buckets` is created on the server of
+`THROTTLE_DATABASE` (see `api.utils.throttle_handler`). Running the command
+at deployment keeps the DDL out of the request path; it can be run again
+safely.
+
+Example:
+    python manage.py create_throttle_table
+"""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from api.utils.throttle_handler import create_table, get_throttle_alias
+
+
+class Command(BaseCommand):
+    """
+    Creates the throttle bucket table when it does not exist.
+    """
+    help = (
+        "Create the unlogged table holding the throttle token buckets, "
+        "when it does not exist."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            create_table()
+        except DatabaseError as exc:
+            raise CommandError(
+                f"Throttle table not created: {exc}"
+            ) from exc
+        self.stdout.write(self.style.SUCCESS(
+            f"Throttle table ready ({get_throttle_alias()})."
+        ))
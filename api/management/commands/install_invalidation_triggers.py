@@ -0,0 +1,150 @@
+"""
+Install the cache invalidation triggers on the unmanaged tables.
+
+Every unmanaged table gets two triggers calling
+`public.api_notify_invalidation()`, which notifies `INVALIDATION_BUS_CHANNEL`
+with the table name and the primary key of the row written (see
+`api.utils.invalidation_bus_handler`):
+
+- `api_invalidation_row`, after each `INSERT`, `UPDATE` and `DELETE`;
+- `api_invalidation_truncate`, after each `TRUNCATE` (with a null `pk`).
+
+PostgreSQL delivers the notifications when the transaction commits, once per
+distinct payload, so a row written several times by one transaction is
+evicted once.
+
+Example:
+    python manage.py install_invalidation_triggers
+    python manage.py install_invalidation_triggers --drop
+"""
+
+from typing import Any
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DatabaseError, connections, transaction
+
+from api.db.schema_router import get_model_alias
+from api.utils.invalidation_bus_handler import get_channel
+
+
+FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION public.api_notify_invalidation()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    row_pk text;
+BEGIN
+    -- TG_ARGV: primary key column, channel
+    IF TG_LEVEL = 'ROW' THEN
+        IF TG_OP = 'INSERT' THEN
+            row_pk := to_jsonb(NEW) ->> TG_ARGV[0];
+        ELSE
+            -- the entries cached for an updated row are under its old key
+            row_pk := to_jsonb(OLD) ->> TG_ARGV[0];
+        END IF;
+    END IF;
+    PERFORM pg_notify(
+        TG_ARGV[1],
+        json_build_object('table', TG_TABLE_NAME, 'pk', row_pk)::text
+    );
+    RETURN NULL;
+END;
+$$
+"""
+
+DROP_TRIGGERS_SQL = [
+    "DROP TRIGGER IF EXISTS api_invalidation_row ON {table}",
+    "DROP TRIGGER IF EXISTS api_invalidation_truncate ON {table}",
+]
+
+CREATE_TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER api_invalidation_row
+        AFTER INSERT OR UPDATE OR DELETE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION public.api_notify_invalidation({args})
+    """,
+    """
+    CREATE TRIGGER api_invalidation_truncate
+        AFTER TRUNCATE ON {table}
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION public.api_notify_invalidation({args})
+    """,
+]
+
+
+def quote_literal(value: str) -> str:
+    """
+    Quote a string as an SQL literal (trigger arguments take no parameters).
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+class Command(BaseCommand):
+    """
+    Installs (or drops) the invalidation triggers of the unmanaged tables.
+    """
+    help = (
+        "Install triggers notifying the cache invalidation bus of every "
+        "write to the unmanaged tables."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the triggers instead of installing them."
+        )
+        parser.add_argument(
+            "--database",
+            help="Only handle the tables of this database alias."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        models = [
+            model for model in apps.get_models()
+            if not model._meta.managed
+            and not model._meta.proxy
+            and options["database"] in (None, get_model_alias(model))
+        ]
+        aliases = sorted({get_model_alias(model) for model in models})
+
+        if not options["drop"]:
+            for alias in aliases:
+                with connections[alias].cursor() as cursor:
+                    cursor.execute(FUNCTION_SQL)
+
+        failures = 0
+        for model in models:
+            connection = connections[get_model_alias(model)]
+            table = connection.ops.quote_name(model._meta.db_table)
+            statements, args = DROP_TRIGGERS_SQL, ""
+            if not options["drop"]:
+                # composite keys have no single column: the literal '' makes
+                # every notification evict the whole table
+                args = ", ".join(map(quote_literal, [
+                    model._meta.pk.column or "",
+                    get_channel()
+                ]))
+                statements = statements + CREATE_TRIGGERS_SQL
+
+            try:
+                with transaction.atomic(using=connection.alias):
+                    with connection.cursor() as cursor:
+                        for statement in statements:
+                            cursor.execute(
+                                statement.format(table=table, args=args)
+                            )
+            except DatabaseError as exc:
+                failures += 1
+                self.stderr.write(f"{model._meta.db_table}: {exc}")
+                continue
+            self.stdout.write(
+                f"{'Dropped' if options['drop'] else 'Installed'} "
+                f"triggers on {model._meta.db_table} ({connection.alias})"
+            )
+
+        summary = f"{len(models) - failures} of {len(models)} tables done."
+        if failures:
+            self.stderr.write(self.style.ERROR(summary))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,73 @@
+"""
+Database connection pool reporting middleware.
+
+Periodically logs wait time and saturation of the psycopg3 connection pool
+through `log_event`, and logs a warning as soon as the pool approaches its
+maximum size or requests start queueing for a connection.
+
+Settings:
+    DB_POOL_ENABLED (bool): The middleware is a no-op when False.
+    DB_POOL_STATS_INTERVAL (int): Seconds between INFO stats events.
+    DB_POOL_SATURATION_WARNING (float): Saturation (0.0 to 1.0) at which a
+        WARNING event is logged.
+"""
+
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from api.utils.db_pool_handler import get_pool_stats
+from api.utils.logging_handler import log_event
+
+
+class DatabasePoolMiddleware:
+    """
+    Reports connection pool usage for the `default` database alias.
+    """
+
+    alias: str = "default"
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "DB_POOL_ENABLED", False)
+        self.interval = getattr(settings, "DB_POOL_STATS_INTERVAL", 60)
+        self.threshold = getattr(settings, "DB_POOL_SATURATION_WARNING", 0.8)
+        self.last_report = time.monotonic()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        if self.enabled:
+            self.report(request)
+
+        return response
+
+    def report(self, request: HttpRequest) -> None:
+        """
+        Log a saturation warning when needed, and the interval stats once
+        every `DB_POOL_STATS_INTERVAL` seconds.
+        """
+        stats = get_pool_stats(self.alias)
+        if stats is None:
+            return
+
+        if (stats["saturation"] >= self.threshold
+                or stats["requests_waiting"] > 0):
+            log_event(
+                "WARNING",
+                "Database pool saturated",
+                path=request.path,
+                **stats
+            )
+
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            log_event(
+                "INFO",
+                "Database pool stats",
+                interval_seconds=self.interval,
+                **get_pool_stats(self.alias, reset=True)
+            )
@@ -0,0 +1,130 @@
+"""
+Path-aware middleware dispatcher.
+
+Sessions, CSRF, `request.user`, messages and clickjacking protection only
+matter to browser clients: the admin, the browsable API and the Swagger UI.
+JSON API calls authenticate with JWT (DRF sets `request.user` itself) and
+get nothing from them but per-request overhead.
+
+`PathDispatchMiddleware` stands in `MIDDLEWARE` for that group of
+middleware, listed in `BROWSER_MIDDLEWARE`. It builds the group as an inner
+chain once, and for each request either runs it or skips it entirely:
+
+- requests under `API_PATH_PREFIX` skip the group, unless they come from a
+  browser: a session cookie, an `Accept` header asking for HTML, or
+  `?format=api`;
+- every other request (the admin included) runs the full group, so
+  behavior there is the same as with the middleware listed directly.
+
+The group's `process_view`, `process_template_response` and
+`process_exception` hooks are forwarded in the order Django would call them.
+"""
+
+from typing import Any, Callable, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+from django.utils.module_loading import import_string
+
+
+LEAN_ATTR = "_lean_api_request"
+
+
+def is_lean_request(request: HttpRequest) -> bool:
+    """
+    Return True when a request can skip the browser middleware.
+    """
+    if not request.path_info.startswith(settings.API_PATH_PREFIX):
+        return False
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        return False
+    if "text/html" in request.headers.get("Accept", ""):
+        return False
+    return request.GET.get("format") != "api"
+
+
+class PathDispatchMiddleware:
+    """
+    Runs `BROWSER_MIDDLEWARE` for browser requests only.
+
+    Attributes:
+        - middleware (list): The inner middleware instances, outermost first.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.middleware: List[Any] = []
+
+        handler = get_response
+        for path in reversed(settings.BROWSER_MIDDLEWARE):
+            try:
+                instance = import_string(path)(handler)
+            except MiddlewareNotUsed:
+                continue
+            self.middleware.insert(0, instance)
+            handler = instance
+        self.browser_chain = handler
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if is_lean_request(request):
+            setattr(request, LEAN_ATTR, True)
+            return self.get_response(request)
+        return self.browser_chain(request)
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable,
+        view_args: tuple,
+        view_kwargs: dict
+    ) -> Optional[HttpResponse]:
+        """
+        Forward to the inner `process_view` hooks, outermost first.
+        """
+        if getattr(request, LEAN_ATTR, False):
+            return None
+        for instance in self.middleware:
+            hook = getattr(instance, "process_view", None)
+            if hook is None:
+                continue
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse
+    ) -> HttpResponse:
+        """
+        Forward to the inner `process_template_response` hooks, innermost
+        first.
+        """
+        if getattr(request, LEAN_ATTR, False):
+            return response
+        for instance in reversed(self.middleware):
+            hook = getattr(instance, "process_template_response", None)
+            if hook is not None:
+                response = hook(request, response)
+        return response
+
+    def process_exception(
+        self,
+        request: HttpRequest,
+        exception: Exception
+    ) -> Optional[HttpResponse]:
+        """
+        Forward to the inner `process_exception` hooks, innermost first.
+        """
+        if getattr(request, LEAN_ATTR, False):
+            return None
+        for instance in reversed(self.middleware):
+            hook = getattr(instance, "process_exception", None)
+            if hook is None:
+                continue
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
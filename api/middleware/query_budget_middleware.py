@@ -0,0 +1,191 @@
+"""
+Per-request query budget middleware.
+
+Counts the SQL statements run by each request and the time spent in the
+database, groups them by statement shape (the SQL with its `%s` parameter
+placeholders) to spot N+1 patterns, and reports the request phases in a
+`Server-Timing` header:
+
+    Server-Timing: db;dur=12.4;desc="23 queries", serialize;dur=4.1,
+                   render;dur=0.9, total;dur=18.2
+
+- db: time spent executing SQL.
+- serialize: time in the view outside of SQL (for these viewsets, mostly
+  serializer work).
+- render: time spent rendering the response body.
+
+A viewset declares its budget with `query_budget`, either an int or a dict
+keyed by action (`{'list': 5, 'retrieve': 3}`); other views use
+`QUERY_BUDGET_DEFAULT`. Requests over budget, and statement shapes repeated
+`QUERY_REPEAT_THRESHOLD` times or more, are logged through `log_event`.
+
+Statements run while a streaming response is being iterated happen after the
+middleware returns and are not counted.
+"""
+
+import time
+from collections import Counter
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from api.utils.logging_handler import log_event
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording statement count, time and shapes.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.shapes[sql] += 1
+
+    def repeated(self, threshold: int) -> List[Dict[str, Any]]:
+        """
+        Return the statement shapes run at least `threshold` times.
+        """
+        return [
+            {"sql": sql, "count": count}
+            for sql, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryBudgetMiddleware:
+    """
+    Enforces per-viewset query budgets and emits `Server-Timing` headers.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.default_budget = getattr(settings, "QUERY_BUDGET_DEFAULT", 50)
+        self.repeat_threshold = getattr(
+            settings, "QUERY_REPEAT_THRESHOLD", 5
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        recorder = QueryRecorder()
+        request.query_budget = {"view": None, "budget": self.default_budget}
+        start = time.perf_counter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        total = time.perf_counter() - start
+        timings = request.query_budget
+        self.add_server_timing(response, recorder, timings, total)
+        self.report(request, recorder, timings)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """
+        Remember the view and its query budget; start the view timer.
+        """
+        view_cls = getattr(view_func, "cls", None)
+        actions = getattr(view_func, "actions", None) or {}
+        action = actions.get(request.method.lower())
+
+        request.query_budget.update({
+            "view": view_cls.__name__ if view_cls else view_func.__name__,
+            "action": action,
+            "budget": self.get_budget(view_cls, action),
+            "view_start": time.perf_counter(),
+        })
+
+    def process_template_response(self, request, response):
+        """
+        Stop the view timer and time the rendering of the response.
+        """
+        timings = request.query_budget
+        timings["render_start"] = time.perf_counter()
+        if "view_start" in timings:
+            timings["view_duration"] = (
+                timings["render_start"] - timings["view_start"]
+            )
+
+        def stop_render_timer(rendered):
+            timings["render_duration"] = (
+                time.perf_counter() - timings["render_start"]
+            )
+            return rendered
+
+        response.add_post_render_callback(stop_render_timer)
+        return response
+
+    def get_budget(self, view_cls: Any, action: Optional[str]) -> int:
+        """
+        Return the query budget of a view class and action.
+        """
+        budget = getattr(view_cls, "query_budget", None)
+        if isinstance(budget, dict):
+            budget = budget.get(action)
+        return budget if budget is not None else self.default_budget
+
+    def add_server_timing(
+        self,
+        response: HttpResponse,
+        recorder: QueryRecorder,
+        timings: Dict[str, Any],
+        total: float
+    ) -> None:
+        """
+        Add the `Server-Timing` header to the response.
+        """
+        db_ms = recorder.duration * 1000
+        metrics = [f'db;dur={db_ms:.1f};desc="{recorder.count} queries"']
+
+        if "view_duration" in timings:
+            serialize_ms = max(timings["view_duration"] * 1000 - db_ms, 0)
+            metrics.append(f"serialize;dur={serialize_ms:.1f}")
+        if "render_duration" in timings:
+            metrics.append(
+                f"render;dur={timings['render_duration'] * 1000:.1f}"
+            )
+        metrics.append(f"total;dur={total * 1000:.1f}")
+
+        response.headers["Server-Timing"] = ", ".join(metrics)
+
+    def report(
+        self,
+        request: HttpRequest,
+        recorder: QueryRecorder,
+        timings: Dict[str, Any]
+    ) -> None:
+        """
+        Log over-budget requests and repeated statement shapes.
+        """
+        repeated = recorder.repeated(self.repeat_threshold)
+        over_budget = recorder.count > timings["budget"]
+        if not over_budget and not repeated:
+            return
+
+        log_event(
+            "WARNING",
+            "Query budget exceeded" if over_budget
+            else "Repeated queries detected",
+            view=timings["view"],
+            action=timings.get("action"),
+            method=request.method,
+            path=request.get_full_path(),
+            queries=recorder.count,
+            budget=timings["budget"],
+            db_ms=round(recorder.duration * 1000, 3),
+            repeated=repeated
+        )
@@ -0,0 +1,81 @@
+"""
+Read-your-writes middleware for the read-replica router.
+
+Unsafe requests (POST, PUT, PATCH, DELETE) run pinned to the primary, so the
+`get_object()` lookups and serializer validation of a write never read stale
+replica data. After a write, the client stays pinned for
+`DB_REPLICA_PIN_SECONDS`, so its next reads see what it just wrote even while
+replicas catch up.
+
+The pin travels with the client, in a cookie (`DB_REPLICA_PIN_COOKIE`) signed
+with `SECRET_KEY` and carrying its own timestamp: every worker process can
+check it without a shared cache, and a client cannot forge or extend it.
+Clients that drop cookies are not pinned and may read stale data for up to
+`DB_REPLICA_MAX_LAG` seconds after a write.
+
+Other requests read from one replica per primary, picked on their first read
+(see `use_replica_per_request`).
+"""
+
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from api.db.replica_router import use_primary, use_replica_per_request
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+PIN_SALT = "api.replica-pin"
+
+
+class ReplicaPinMiddleware:
+    """
+    Pins writes, and reads that follow a write, to the primary database.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.pin_seconds = getattr(settings, "DB_REPLICA_PIN_SECONDS", 10)
+        self.cookie_name = getattr(
+            settings,
+            "DB_REPLICA_PIN_COOKIE",
+            "replica_pin"
+        )
+
+    def is_pinned(self, request: HttpRequest) -> bool:
+        """
+        Return True when the request carries a valid, unexpired pin.
+        """
+        return request.get_signed_cookie(
+            self.cookie_name,
+            default=None,
+            salt=PIN_SALT,
+            max_age=self.pin_seconds
+        ) is not None
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not getattr(settings, "DATABASE_REPLICAS", {}):
+            return self.get_response(request)
+
+        if request.method not in SAFE_METHODS:
+            with use_primary():
+                response = self.get_response(request)
+            response.set_signed_cookie(
+                self.cookie_name,
+                "1",
+                salt=PIN_SALT,
+                max_age=self.pin_seconds,
+                secure=request.is_secure(),
+                httponly=True,
+                samesite="Lax"
+            )
+            return response
+
+        if self.is_pinned(request):
+            with use_primary():
+                return self.get_response(request)
+
+        with use_replica_per_request():
+            return self.get_response(request)
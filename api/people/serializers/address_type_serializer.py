@@ -6,9 +6,13 @@ from rest_framework import serializers
 
 from api.people.models.address_type_model import AddressType
 from api.utils.hateoas_serializer import HATEOASLinkSerializer
+from api.utils.representation_cache_mixin import RepresentationCacheMixin
 
 
-class AddressTypeSerializer(serializers.ModelSerializer):
+class AddressTypeSerializer(
+    RepresentationCacheMixin,
+    serializers.ModelSerializer
+):
     """
     tba
     """
@@ -6,9 +6,17 @@ from rest_framework import serializers
 
 from api.people.models.country_region_model import CountryRegion
 from api.utils.hateoas_serializer import HATEOASLinkSerializer
+from api.utils.identity_map_mixin import IdentityMapMixin
+from api.utils.reference_data_mixin import ReferenceDataMixin
+from api.utils.representation_cache_mixin import RepresentationCacheMixin
 
 
-class CountryRegionSerializer(serializers.ModelSerializer):
+class CountryRegionSerializer(
+    IdentityMapMixin,
+    ReferenceDataMixin,
+    RepresentationCacheMixin,
+    serializers.ModelSerializer
+):
     """
     tba
     """
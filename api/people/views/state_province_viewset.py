@@ -18,7 +18,6 @@ Logging:
 import logging
 from typing import Any
 from rest_framework import status, filters
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -31,16 +30,29 @@ from api.people.serializers.state_province_serializer import (
 )
 from api.viewsets.base_hateoas_viewset import BaseHATEOASViewSet
 from api.config.build_swagger_schema import build_schema_extension
+from api.utils.conditional_get_mixin import ConditionalGetMixin
+from api.utils.hateoas_mixin import CollectionLinksMixin
+from api.utils.keyset_pagination import KeysetPagination
 from api.utils.logging_handler import log_event
+from api.utils.request_deadline_mixin import RequestDeadlineMixin
+from api.utils.row_serializer_mixin import RowSerializerMixin
+from api.utils.serializer_query_mixin import SerializerQueryMixin
+from api.utils.sparse_fieldset_mixin import SparseFieldsetMixin
+from api.utils.streaming_list_mixin import StreamingListMixin
 
 
 logger = logging.getLogger(__name__)
 
 
-class StateProvincePagination(PageNumberPagination):
+class StateProvincePagination(KeysetPagination):
     """
     Pagination configuration for StateProvince API endpoints.
 
+    Pages are addressed by opaque cursors on `lookup_field` (keyset
+    pagination), so every page costs the same index seek. `count` is only
+    computed on request: `?count=exact`, or `?count=estimate`, estimated once
+    the table passes `PAGINATION_COUNT_ESTIMATE_THRESHOLD` rows.
+
     Attributes:
         - page_size (int): Default number of items per page (10).
         - page_size_query_param (str): Query parameter to override the page
@@ -52,7 +64,16 @@ class StateProvincePagination(PageNumberPagination):
     max_page_size: int = 100
 
 
-class StateProvinceViewSet(BaseHATEOASViewSet):
+class StateProvinceViewSet(
+    RequestDeadlineMixin,
+    ConditionalGetMixin,
+    SparseFieldsetMixin,
+    SerializerQueryMixin,
+    RowSerializerMixin,
+    CollectionLinksMixin,
+    StreamingListMixin,
+    BaseHATEOASViewSet
+):
     """
     ViewSet for managing StateProvince resources.
 
@@ -67,11 +88,15 @@ class StateProvinceViewSet(BaseHATEOASViewSet):
           - Response status code
     """
     model: str = StateProvince.__name__
-    basename: str = 'address-types'
+    basename: str = 'state-provinces'
     lookup_field: str = 'state_province_id'
     # pylint: disable=no-member
     queryset = StateProvince.objects.all().order_by(lookup_field)
     serializer_class = StateProvinceSerializer
+    pagination_class = StateProvincePagination
+    query_budget: int = 10
+    request_deadline: int = 2000
+    fast_list: bool = True
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'post', 'put', 'patch', 'delete', 'head',
                          'options']
@@ -102,6 +127,8 @@ class StateProvinceViewSet(BaseHATEOASViewSet):
 
         Returns:
             Response: A JSON response containing the count and serialized data.
+            Unpaginated lists (`?stream=true`) are streamed row by row with
+            constant memory.
 
         Logging:
             Logs request context and total count of results.
@@ -114,27 +141,22 @@ class StateProvinceViewSet(BaseHATEOASViewSet):
             path=request.get_full_path()
         )
 
+        not_modified = self.get_not_modified_response()
+        if not_modified is not None:
+            return not_modified
+
         queryset = self.filter_queryset(self.get_queryset())
+        rows = self.get_row_serializer()
+        if rows is not None:
+            queryset = self.get_row_values(queryset, rows)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = StateProvinceSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = StateProvinceSerializer(queryset, many=True)
-
-        log_event(
-            "INFO",
-            "StateProvince list retrieved",
-            user=str(request.user),
-            count=len(serializer.data),
-            status=status.HTTP_200_OK
-        )
+            return self.get_paginated_response(
+                self.serialize_page(page, rows)
+            )
 
-        return Response({
-            'count': len(serializer.data),
-            'data': serializer.data
-        }, status=status.HTTP_200_OK)
+        return self.get_streaming_response(queryset, rows)
 
     @build_schema_extension(
         model=model,
@@ -162,6 +184,10 @@ class StateProvinceViewSet(BaseHATEOASViewSet):
         Logging:
             Logs the ID of the retrieved StateProvince and request context.
         """
+        not_modified = self.get_not_modified_response()
+        if not_modified is not None:
+            return not_modified
+
         instance: StateProvince = self.get_object()
         log_event(
             "INFO",
@@ -6,6 +6,7 @@ from rest_framework.routers import DefaultRouter
 
 from api.admin.views.user_viewset import UserViewSet
 from api.admin.views.group_viewset import GroupViewSet
+from api.admin.views.database_stats_viewset import DatabaseStatsViewSet
 
 from api.people.views.address_type_viewset import AddressTypeViewSet
 from api.people.views.country_region_viewset import CountryRegionViewSet
@@ -17,6 +18,11 @@ router = DefaultRouter()
 
 router.register(r'api/admin/users', UserViewSet, basename='user')
 router.register(r'api/admin/groups', GroupViewSet, basename='group')
+router.register(
+  r'api/admin/database-stats',
+  DatabaseStatsViewSet,
+  basename='database-stats'
+)
 
 router.register(
   r'api/people/address-types',
@@ -3,22 +3,32 @@ tba
 """
 
 from rest_framework import serializers
-from rest_framework.reverse import reverse
 
 from api.people.models.country_region_model import CountryRegion
 from api.sales.models.sales_territory_model import SalesTerritory
 from api.people.serializers.country_region_serializer import (
   CountryRegionSerializer
 )
+from api.utils.hateoas_mixin import HATEOASListSerializer, HATEOASMixin
+from api.utils.link_builder import LinkBuilder, get_link_builder
+from api.utils.reference_data_mixin import ReferenceSlugRelatedField
+from api.utils.representation_cache_mixin import RepresentationCacheMixin
 
 
-class SalesTerritorySerializer(serializers.ModelSerializer):
+class SalesTerritorySerializer(
+    HATEOASMixin,
+    RepresentationCacheMixin,
+    serializers.ModelSerializer
+):
     """
     tba
     """
     model = SalesTerritory
+    detail_view_name = 'sales-territories-detail'
+    list_view_name = 'sales-territories-list'
+    neighbor_field = 'sales_territory_id'
     # Write-only: accept country_region_code when creating/updating
-    country_region_code = serializers.SlugRelatedField(
+    country_region_code = ReferenceSlugRelatedField(
         slug_field="country_region_code",
         queryset=CountryRegion.objects.all(),
         source="country_region",
@@ -48,108 +58,61 @@ class SalesTerritorySerializer(serializers.ModelSerializer):
             "country_region_code",
             "country_region_detail"
         ]
+        list_serializer_class = HATEOASListSerializer
         read_only_fields = [
             'sales_territory_id',
             'rowguid',
             'modified_date',
         ]
 
-    def get_object_url(self, obj, view_name: str, request):
+    def get_object_url(self, pk, view_name: str, links: LinkBuilder):
         """
-        Returns the reverse URL for a given object and view name, or None
-        if the object is None.
+        Returns the URL for a given primary key and view name, or None if
+        there is no such object.
         """
-        if obj:
-            return reverse(
-                view_name,
-                args=[obj.state_province_id],
-                request=request)
-        else:
-            return None
+        if pk is not None:
+            return links.url(view_name, pk)
+        return None
 
     def get_links(self, obj):
         """
-        tba
+        Links of the object, built from precompiled URL templates; the
+        next/previous neighbours come from `get_neighbors`, looked up once
+        per page.
         """
-        request = self.context.get("request")
-
-        # Get next object
-        next_obj = (
-            StateProvince.objects.filter(  # pylint: disable=no-member
-                state_province_id__gt=obj.state_province_id)
-            .order_by("state_province_id")
-            .first()
-        )
-        # Get previous object
-        previous_obj = (
-            StateProvince.objects.filter(  # pylint: disable=no-member
-                state_province_id__lt=obj.state_province_id
-            )
-            .order_by("-state_province_id")
-            .first()
-        )
+        links = get_link_builder(self.context.get("request"))
+        previous_id, next_id = self.get_neighbors(obj)
+        detail = links.url(self.detail_view_name, obj.sales_territory_id)
+        collection = links.url(self.list_view_name)
 
         return {
             "next": self.get_object_url(
-                next_obj,
-                "address-types-id",
-                request
+                next_id,
+                self.detail_view_name,
+                links
             ),
-
             "previous": self.get_object_url(
-                previous_obj,
-                "address-types-id",
-                request
+                previous_id,
+                self.detail_view_name,
+                links
             ),
 
             # GET: retrieve
-            "self": {
-                "href": reverse("address-types-id",
-                                args=[obj.state_province_id],
-                                request=request),
-                "method": "GET"
-            },
+            "self": {"href": detail, "method": "GET"},
 
             # GET: list
             # POST: create
             # OPTIONS
             # HEAD
-            "list": {
-                "href": reverse("address-types", request=request),
-                "method": "GET"
-            },
-            "create": {
-                "href": reverse("address-types", request=request),
-                "method": "POST"
-            },
-            "options": {
-                "href": reverse("address-types", request=request),
-                "method": "OPTIONS"
-            },
-            "head": {
-                "href": reverse("address-types", request=request),
-                "method": "HEAD"
-            },
+            "list": {"href": collection, "method": "GET"},
+            "create": {"href": collection, "method": "POST"},
+            "options": {"href": collection, "method": "OPTIONS"},
+            "head": {"href": collection, "method": "HEAD"},
 
             # PUT: update
             # PATCH: partial_update
             # DELETE: destroy
-            "update": {
-                "href": reverse("address-types-id",
-                                args=[obj.state_province_id],
-                                request=request),
-                "method": "PUT"
-            },
-            "partial_update": {
-                "href": reverse("address-types-id",
-                                args=[obj.state_province_id],
-                                request=request),
-                "method": "PATCH"
-            },
-            "destroy": {
-                "href": reverse("address-types-id",
-                                args=[obj.state_province_id],
-                                request=request),
-                "method": "DELETE"
-            },
+            "update": {"href": detail, "method": "PUT"},
+            "partial_update": {"href": detail, "method": "PATCH"},
+            "destroy": {"href": detail, "method": "DELETE"},
         }
@@ -13,28 +13,50 @@ from api.sales.serializers.sales_territory_serializer import (
     SalesTerritorySerializer
 )
 from api.config.build_swagger_schema import build_schema_extension
+from api.utils.conditional_get_mixin import ConditionalGetMixin
+from api.utils.hateoas_mixin import CollectionLinksMixin
+from api.utils.keyset_pagination import KeysetPagination
 from api.utils.logging_handler import log_event
+from api.utils.request_deadline_mixin import RequestDeadlineMixin
+from api.utils.row_serializer_mixin import RowSerializerMixin
+from api.utils.serializer_query_mixin import SerializerQueryMixin
+from api.utils.sparse_fieldset_mixin import SparseFieldsetMixin
+from api.utils.streaming_list_mixin import StreamingListMixin
 
 
 logger = logging.getLogger(__name__)
 
 
-class SalesTerritoryPagination(viewsets.ModelViewSet):
+class SalesTerritoryPagination(KeysetPagination):
     """
-    # Pagination configuration for SalesTerritory API endpoints.
-
-    # Attributes:
-    #     - page_size (int): Default number of items per page (10).
-    #     - page_size_query_param (str): Query parameter to override the page
-    #     size.
-    #     - max_page_size (int): Maximum allowed page size (100).
-    # """
-    # page_size: int = 10
-    # page_size_query_param: str = 'page_size'
-    # max_page_size: int = 100
-
-
-class SalesTerritoryViewSet(viewsets.ModelViewSet):
+    Pagination configuration for SalesTerritory API endpoints.
+
+    Pages are addressed by opaque cursors on `lookup_field` (keyset
+    pagination), so every page costs the same index seek. `count` is only
+    computed on request: `?count=exact`, or `?count=estimate`, estimated once
+    the table passes `PAGINATION_COUNT_ESTIMATE_THRESHOLD` rows.
+
+    Attributes:
+        - page_size (int): Default number of items per page (10).
+        - page_size_query_param (str): Query parameter to override the page
+        size.
+        - max_page_size (int): Maximum allowed page size (100).
+    """
+    page_size: int = 10
+    page_size_query_param: str = 'page_size'
+    max_page_size: int = 100
+
+
+class SalesTerritoryViewSet(
+    RequestDeadlineMixin,
+    ConditionalGetMixin,
+    SparseFieldsetMixin,
+    SerializerQueryMixin,
+    RowSerializerMixin,
+    CollectionLinksMixin,
+    StreamingListMixin,
+    viewsets.ModelViewSet
+):
     """
     ViewSet for managing SalesTerritory resources.
 
@@ -54,6 +76,10 @@ class SalesTerritoryViewSet(viewsets.ModelViewSet):
     # pylint: disable=no-member
     queryset = SalesTerritory.objects.all().order_by(lookup_field)
     serializer_class = SalesTerritorySerializer
+    pagination_class = SalesTerritoryPagination
+    query_budget: int = 10
+    request_deadline: int = 2000
+    fast_list: bool = True
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'post', 'put', 'patch', 'delete', 'head',
                          'options']
@@ -83,6 +109,8 @@ class SalesTerritoryViewSet(viewsets.ModelViewSet):
 
         Returns:
             Response: A JSON response containing the count and serialized data.
+            Unpaginated lists (`?stream=true`) are streamed row by row with
+            constant memory.
 
         Logging:
             Logs request context and total count of results.
@@ -95,27 +123,22 @@ class SalesTerritoryViewSet(viewsets.ModelViewSet):
             path=request.get_full_path()
         )
 
+        not_modified = self.get_not_modified_response()
+        if not_modified is not None:
+            return not_modified
+
         queryset = self.filter_queryset(self.get_queryset())
+        rows = self.get_row_serializer()
+        if rows is not None:
+            queryset = self.get_row_values(queryset, rows)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = SalesTerritorySerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(
+                self.serialize_page(page, rows)
+            )
 
-        serializer = SalesTerritorySerializer(queryset, many=True)
-
-        log_event(
-            "INFO",
-            "SalesTerritory list retrieved",
-            user=str(request.user),
-            count=len(serializer.data),
-            status=status.HTTP_200_OK
-        )
-
-        return Response({
-            'count': len(serializer.data),
-            'data': serializer.data
-        }, status=status.HTTP_200_OK)
+        return self.get_streaming_response(queryset, rows)
 
     @build_schema_extension(
         model=model,
@@ -143,6 +166,10 @@ class SalesTerritoryViewSet(viewsets.ModelViewSet):
         Logging:
             Logs the ID of the retrieved SalesTerritory and request context.
         """
+        not_modified = self.get_not_modified_response()
+        if not_modified is not None:
+            return not_modified
+
         instance: SalesTerritory = self.get_object()
         log_event(
             "INFO",
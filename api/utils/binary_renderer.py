@@ -0,0 +1,157 @@
+"""
+MessagePack and CBOR renderers and parsers.
+
+Binary alternatives to the JSON renderer for server-to-server clients,
+negotiated with `Accept: application/msgpack` / `application/cbor` (or
+`?format=msgpack` / `?format=cbor`), and accepted as request bodies with the
+matching `Content-Type`. They render whatever the JSON renderer renders,
+HATEOAS `_links` and pagination envelopes included: dicts, lists, strings,
+numbers, booleans and None map onto the formats' own types.
+
+Serializer output is mostly strings already (`DecimalField`s under
+`COERCE_DECIMAL_TO_STRING`, `DateTimeField`s, `UUIDField`s), and is encoded
+as such. Other values have these encodings:
+
+=========  ===============================  ==============================
+value      MessagePack                      CBOR
+=========  ===============================  ==============================
+Decimal    string (`str(value)`)            tag 4, decimal fraction
+UUID       string, canonical form           tag 37, 16 bytes
+datetime   timestamp extension (type -1)    tag 0, RFC 3339 string
+date       string, ISO 8601                 tag 1004, RFC 8943 string
+time       string, ISO 8601                 string, ISO 8601
+=========  ===============================  ==============================
+
+Naive datetimes are taken to be in the default time zone. Anything else
+(lazy strings, querysets, timedeltas, ...) goes through DRF's `JSONEncoder`,
+as with the JSON renderer.
+
+The parsers decode the same encodings back to `Decimal`, `UUID` and
+`datetime` objects (MessagePack strings stay strings), which the serializer
+fields accept as they are.
+
+Streamed lists (`?stream=true`) are always written as JSON.
+"""
+
+import datetime
+import uuid
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import cbor2
+import msgpack
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+JSON_ENCODER = JSONEncoder()
+
+
+def msgpack_default(value: Any) -> Any:
+    """
+    Convert a value MessagePack has no type for.
+    """
+    if isinstance(value, datetime.datetime):
+        # naive; aware datetimes are packed as timestamps
+        return timezone.make_aware(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return JSON_ENCODER.default(value)
+
+
+def cbor_default(encoder: Any, value: Any) -> None:
+    """
+    Encode a value CBOR has no type for.
+    """
+    encoder.encode(JSON_ENCODER.default(value))
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders data as MessagePack.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None
+    ) -> bytes:
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=msgpack_default, datetime=True)
+
+
+class CBORRenderer(BaseRenderer):
+    """
+    Renders data as CBOR.
+    """
+    media_type = 'application/cbor'
+    format = 'cbor'
+    charset = None
+    render_style = 'binary'
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None
+    ) -> bytes:
+        if data is None:
+            return b''
+        return cbor2.dumps(
+            data,
+            default=cbor_default,
+            timezone=timezone.get_default_timezone()
+        )
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack request bodies.
+    """
+    media_type = 'application/msgpack'
+    renderer_class = MessagePackRenderer
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None
+    ) -> Any:
+        body = stream.read() if stream is not None else b''
+        try:
+            return msgpack.unpackb(body, timestamp=3)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc}') from exc
+
+
+class CBORParser(BaseParser):
+    """
+    Parses CBOR request bodies.
+    """
+    media_type = 'application/cbor'
+    renderer_class = CBORRenderer
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None
+    ) -> Any:
+        body = stream.read() if stream is not None else b''
+        try:
+            return cbor2.loads(body)
+        except (ValueError, cbor2.CBORError) as exc:
+            raise ParseError(f'CBOR parse error - {exc}') from exc
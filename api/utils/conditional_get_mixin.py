@@ -0,0 +1,258 @@
+"""
+Conditional GET for DRF viewsets.
+
+`list` and `retrieve` responses carry validators derived from the
+`modified_date` (`version_field`) columns they are built from:
+
+- retrieve: a strong `ETag` over the object's primary key and versions,
+  and `Last-Modified`, the latest version;
+- list: a strong `ETag` over `max(version)`, the row count and the query
+  parameters (page, cursor, ordering, fields, ...) of the filtered queryset.
+
+The versions are those of the rows themselves and of the related rows the
+serializer nests (every joined, prefetched or reference-cached relation of
+its query plan whose model has a `version_field`), so changing a nested
+country region changes the ETag of the territories showing it. The
+representation variant (accepted media type, `X-Links` header) is part of
+the ETag too.
+
+Before the action runs, the validators are computed with one aggregate
+query; when `If-None-Match` (or, on `retrieve` without it,
+`If-Modified-Since`) matches, `initial()` keeps a `304 Not Modified`
+response that `list`/`retrieve` return right away, through
+`get_not_modified_response()`, without loading or serializing any row.
+Otherwise the headers are added to the full response.
+
+Deletions are caught by the row count. The list ETag can only miss a
+deletion paired with an insert that does not raise `max(modified_date)`,
+i.e. a row written outside Django with a back-dated `modified_date`. A
+timestamp alone cannot tell that a row was deleted, so lists carry no
+`Last-Modified` and `If-Modified-Since` is ignored on `list`.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from api.utils.hateoas_mixin import LINKS_HEADER
+from api.utils.serializer_query_mixin import is_same_server
+
+
+CONDITIONAL_ACTIONS = ('list', 'retrieve')
+
+
+def get_related_model(model: type, path: str) -> Optional[type]:
+    """
+    Follow a `__` relation path, or return None when it cannot be joined.
+    """
+    current = model
+    for attr in path.split('__'):
+        try:
+            field = current._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation:
+            return None
+        related = field.related_model
+        if not is_same_server(current, related):
+            return None
+        current = related
+    return current
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag/Last-Modified validators and 304 responses to `list` and
+    `retrieve`.
+
+    Attributes:
+        - version_field (str | None): `auto_now` column versioning the rows;
+        None disables conditional requests.
+    """
+    version_field: Optional[str] = 'modified_date'
+
+    def get_version_paths(self, model: type) -> List[str]:
+        """
+        Return the version columns of the rows and of the relations the
+        serializer nests.
+        """
+        field = self.version_field
+        paths = [field]
+
+        get_plan = getattr(self, 'get_query_plan', None)
+        if get_plan is None:
+            return paths
+
+        plan = get_plan()
+        relations = (
+            plan.select_related | plan.prefetch_related | plan.reference
+        )
+        for path in sorted(relations):
+            related = get_related_model(model, path)
+            if related is None:
+                continue
+            try:
+                related._meta.get_field(field)
+            except FieldDoesNotExist:
+                continue
+            paths.append(f'{path}__{field}')
+        return paths
+
+    def get_validator_queryset(self) -> QuerySet:
+        """
+        Return the rows the response is built from.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{
+                self.lookup_field: self.kwargs[lookup_url_kwarg]
+            })
+        return queryset
+
+    def get_validators(self) -> Optional[Tuple[str, Any]]:
+        """
+        Return the `(etag, last_modified)` of the response, or None when
+        there is nothing to validate (e.g. a missing object).
+        """
+        queryset = self.get_validator_queryset()
+        paths = self.get_version_paths(queryset.model)
+        aggregates: Dict[str, Any] = {
+            f'version_{position}': Max(path)
+            for position, path in enumerate(paths)
+        }
+        aggregates['count'] = Count('pk', distinct=True)
+        values = queryset.aggregate(**aggregates)
+
+        count = values.pop('count')
+        if not count:
+            return None
+
+        versions = [values[f'version_{i}'] for i in range(len(paths))]
+        last_modified = None
+        if self.action == 'retrieve':
+            last_modified = max(
+                (version for version in versions if version is not None),
+                default=None
+            )
+
+        request: Request = self.request
+        accepted = getattr(request, 'accepted_media_type', '')
+        parts = [
+            request.path,
+            accepted,
+            request.headers.get(LINKS_HEADER, ''),
+            sorted(request.query_params.lists()),
+            count,
+            [version.isoformat() if version else None
+             for version in versions],
+        ]
+        if self.action == 'retrieve':
+            parts.append(self.kwargs[self.lookup_url_kwarg or
+                                     self.lookup_field])
+
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+        return f'"{digest}"', last_modified
+
+    def is_conditional(self, request: Request) -> bool:
+        """
+        Return True when the request is a `list` or `retrieve` GET to
+        validate.
+        """
+        return (
+            request.method in ('GET', 'HEAD')
+            and self.action in CONDITIONAL_ACTIONS
+            and bool(self.version_field)
+        )
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        """
+        Compute the validators, and keep a 304 response when the client's
+        copy is current.
+        """
+        super().initial(request, *args, **kwargs)
+
+        self.conditional_validators = None
+        self.not_modified_response = None
+        if not self.is_conditional(request):
+            return
+
+        self.conditional_validators = self.get_validators()
+        if self.conditional_validators is None:
+            return
+
+        etag, last_modified = self.conditional_validators
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=(
+                int(last_modified.timestamp()) if last_modified else None
+            )
+        )
+        if response is not None:
+            self.add_validators(response)
+            self.not_modified_response = response
+
+    def get_not_modified_response(self) -> Optional[HttpResponse]:
+        """
+        Return the 304 response `initial()` kept, or None when the action
+        must run.
+        """
+        return getattr(self, 'not_modified_response', None)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Answer 304 without listing when the client's copy is current.
+        """
+        not_modified = self.get_not_modified_response()
+        if not_modified is not None:
+            return not_modified
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any
+    ) -> Response:
+        """
+        Answer 304 before `get_object()` when the client's copy is current.
+        """
+        not_modified = self.get_not_modified_response()
+        if not_modified is not None:
+            return not_modified
+        return super().retrieve(request, *args, **kwargs)
+
+    def add_validators(self, response: HttpResponse) -> None:
+        """
+        Set the `ETag` and `Last-Modified` headers of a response.
+        """
+        etag, last_modified = self.conditional_validators
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: HttpResponse,
+        *args: Any,
+        **kwargs: Any
+    ) -> HttpResponse:
+        """
+        Add the validators to successful `list`/`retrieve` responses.
+        """
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        if (getattr(self, 'conditional_validators', None)
+                and response.status_code == 200):
+            self.add_validators(response)
+        return response
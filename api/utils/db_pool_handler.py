@@ -0,0 +1,84 @@
+"""
+Database connection pool statistics.
+
+Reads the psycopg3 pool that Django attaches to a PostgreSQL alias when
+`OPTIONS["pool"]` is configured, and reduces its counters to the figures we
+track: pool size, checked-out connections, saturation and wait time.
+
+Example:
+    stats = get_pool_stats("default")
+    if stats:
+        log_event("INFO", "Database pool stats", **stats)
+"""
+from typing import Any, Dict, Optional
+
+from django.db import connections
+
+
+def get_pool(alias: str = "default") -> Optional[Any]:
+    """
+    Return the connection pool for a database alias.
+
+    Args:
+        alias (str): Database alias from `settings.DATABASES`.
+
+    Returns:
+        ConnectionPool | None: The psycopg3 pool, or None when pooling is
+        disabled for the alias (or unsupported by its backend).
+    """
+    return getattr(connections[alias], "pool", None)
+
+
+def get_pool_stats(
+    alias: str = "default",
+    reset: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Summarize pool usage for a database alias.
+
+    Args:
+        alias (str): Database alias from `settings.DATABASES`.
+        reset (bool): Reset the pool's cumulative counters after reading them,
+            so the next call reports only the following interval.
+
+    Returns:
+        dict | None: Pool figures, or None when pooling is disabled.
+            - pool_size (int): Connections currently open.
+            - pool_max (int): Configured maximum size.
+            - in_use (int): Connections checked out by requests.
+            - saturation (float): `in_use / pool_max` (0.0 to 1.0).
+            - requests_waiting (int): Requests queued for a connection now.
+            - requests_num (int): Connections handed out (counter).
+            - requests_queued (int): Requests that had to wait (counter).
+            - requests_wait_ms (int): Total time spent waiting (counter).
+            - avg_wait_ms (float): Average wait of the queued requests.
+            - requests_errors (int): Requests that timed out (counter).
+    """
+    pool = get_pool(alias)
+    if pool is None:
+        return None
+
+    stats = pool.pop_stats() if reset else pool.get_stats()
+
+    pool_size = stats.get("pool_size", 0)
+    pool_max = stats.get("pool_max", 0) or 1
+    in_use = pool_size - stats.get("pool_available", 0)
+    requests_queued = stats.get("requests_queued", 0)
+    requests_wait_ms = stats.get("requests_wait_ms", 0)
+
+    return {
+        "alias": alias,
+        "pool_size": pool_size,
+        "pool_max": pool_max,
+        "in_use": in_use,
+        "saturation": round(in_use / pool_max, 3),
+        "requests_waiting": stats.get("requests_waiting", 0),
+        "requests_num": stats.get("requests_num", 0),
+        "requests_queued": requests_queued,
+        "requests_wait_ms": requests_wait_ms,
+        "avg_wait_ms": (
+            round(requests_wait_ms / requests_queued, 3)
+            if requests_queued else 0.0
+        ),
+        "requests_errors": stats.get("requests_errors", 0),
+    }
@@ -0,0 +1,244 @@
+"""
+Estimated-count pagination for large list endpoints.
+
+An exact `SELECT COUNT(*)` scans the whole table (or filtered result), which
+on the big sales tables costs more than fetching the page itself. Once a
+table passes `PAGINATION_COUNT_ESTIMATE_THRESHOLD` rows, the paginators below
+report PostgreSQL's own row estimate instead:
+
+- unfiltered querysets: `pg_class.reltuples`, kept up to date by
+  ANALYZE/autovacuum;
+- filtered querysets: the row estimate of the query's `EXPLAIN` plan.
+
+Smaller tables keep exact counts. Responses carry `count_exact` so clients
+know which one they got, and `?exact_count=true` always forces an exact count.
+"""
+
+import json
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+RELTUPLES_SQL: str = """
+    SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass
+"""
+
+
+def get_estimated_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Return PostgreSQL's row estimate for a queryset.
+
+    Args:
+        queryset (QuerySet): Queryset to estimate.
+
+    Returns:
+        int | None: The estimate, or None when the table has never been
+        analyzed.
+    """
+    connection = connections[queryset.db]
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(RELTUPLES_SQL, [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+            estimate = row[0] if row else -1
+        else:
+            sql, params = queryset.query.get_compiler(
+                using=queryset.db
+            ).as_sql()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+    return int(estimate) if estimate >= 0 else None
+
+
+class EstimatedPage(Page):
+    """
+    Page whose `has_next()` comes from fetching one extra row, since the
+    paginator's page count is only an estimate.
+    """
+
+    def __init__(self, object_list, number, paginator, more: bool):
+        super().__init__(object_list, number, paginator)
+        self.more = more
+
+    def has_next(self) -> bool:
+        return self.more
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that counts with `count_strategy`, and pages without
+    trusting the page count when the count is an estimate.
+    """
+
+    def __init__(self, object_list, per_page, count_strategy=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+
+    @cached_property
+    def counted(self) -> Tuple[int, bool]:
+        """
+        `(count, exact)` from the count strategy, evaluated once.
+        """
+        if self.count_strategy is None:
+            return Paginator(self.object_list, self.per_page).count, True
+        return self.count_strategy(self.object_list)
+
+    @cached_property
+    def count(self) -> int:
+        return self.counted[0]
+
+    @cached_property
+    def count_exact(self) -> bool:
+        """
+        True when `count` is exact, False when it is an estimate.
+        """
+        return self.counted[1]
+
+    def validate_number(self, number: Any) -> int:
+        if self.count_exact:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError) as exc:
+            raise InvalidPage(self.error_messages["invalid_page"]) from exc
+        if number < 1:
+            raise InvalidPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number: Any) -> Page:
+        number = self.validate_number(number)
+        if self.count_exact:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        return EstimatedPage(
+            rows[:self.per_page],
+            number,
+            self,
+            more=len(rows) > self.per_page
+        )
+
+
+class EstimatedCountMixin:
+    """
+    Counting strategy shared by the paginators.
+
+    Attributes:
+        - count_estimate_threshold (int | None): Row estimate above which
+        counts are estimated instead of exact; None reads
+        `PAGINATION_COUNT_ESTIMATE_THRESHOLD` on each count.
+        - exact_count_query_param (str): Query parameter forcing an exact
+        count (`?exact_count=true`).
+    """
+    count_estimate_threshold: Optional[int] = None
+    exact_count_query_param: str = "exact_count"
+
+    def get_count_estimate_threshold(self) -> int:
+        """
+        Return the row estimate above which counts are estimated.
+        """
+        if self.count_estimate_threshold is not None:
+            return self.count_estimate_threshold
+        return getattr(
+            settings, "PAGINATION_COUNT_ESTIMATE_THRESHOLD", 100_000
+        )
+
+    def is_exact_count_requested(self, request: Request) -> bool:
+        """
+        Return True when the client forced an exact count.
+        """
+        value = request.query_params.get(self.exact_count_query_param, "")
+        return value.lower() in ("1", "true", "yes")
+
+    def get_count(self, queryset: QuerySet) -> Tuple[int, bool]:
+        """
+        Count a queryset.
+
+        Returns:
+            tuple: `(count, exact)`; `exact` is False for estimates.
+        """
+        if not self.is_exact_count_requested(self.request):
+            estimate = get_estimated_count(queryset)
+            if (estimate is not None
+                    and estimate >= self.get_count_estimate_threshold()):
+                return estimate, False
+
+        return queryset.count(), True
+
+    def get_count_schema(self) -> Dict[str, Dict]:
+        """
+        OpenAPI schema of the count fields.
+        """
+        return {
+            "count": {"type": "integer", "example": 123},
+            "count_exact": {"type": "boolean", "example": True},
+        }
+
+    def get_count_parameter(self) -> Dict[str, Any]:
+        """
+        OpenAPI parameter forcing an exact count.
+        """
+        return {
+            "name": self.exact_count_query_param,
+            "required": False,
+            "in": "query",
+            "description": "Force an exact count instead of an estimate.",
+            "schema": {"type": "boolean"},
+        }
+
+
+class EstimatedCountPageNumberPagination(
+    EstimatedCountMixin,
+    PageNumberPagination
+):
+    """
+    `PageNumberPagination` with estimated counts on large tables.
+    """
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: Any = None
+    ) -> Optional[List[Any]]:
+        self.request = request
+        self.django_paginator_class = partial(
+            EstimatedCountPaginator,
+            count_strategy=self.get_count
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({
+            "count": self.page.paginator.count,
+            "count_exact": self.page.paginator.count_exact,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema: Dict) -> Dict:
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"].update(self.get_count_schema())
+        return response_schema
+
+    def get_schema_operation_parameters(self, view: Any) -> List[Dict]:
+        return [
+            *super().get_schema_operation_parameters(view),
+            self.get_count_parameter(),
+        ]
@@ -1,9 +1,50 @@
+from django.db import OperationalError
+from rest_framework.exceptions import APIException
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
 
+try:
+    from psycopg_pool import PoolTimeout
+except ImportError:  # pragma: no cover - pool support not installed
+    PoolTimeout = None
+
+
+# SQLSTATE raised when PostgreSQL cancels a statement (statement_timeout)
+QUERY_CANCELED = '57014'
+
+
+class DatabaseTimeout(APIException):
+    status_code = status.HTTP_504_GATEWAY_TIMEOUT
+    default_detail = 'The request exceeded its database deadline.'
+    default_code = 'database_timeout'
+
+
+class DatabaseUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'No database connection available, try again later.'
+    default_code = 'database_unavailable'
+
+
+def translate_database_error(exc):
+    """
+    Map cancelled statements to a 504 and connection-pool timeouts to a 503;
+    other exceptions are returned unchanged.
+    """
+    if not isinstance(exc, OperationalError):
+        return exc
+
+    cause = exc.__cause__
+    if getattr(cause, 'sqlstate', None) == QUERY_CANCELED:
+        return DatabaseTimeout()
+    if PoolTimeout is not None and isinstance(cause, PoolTimeout):
+        return DatabaseUnavailable()
+    return exc
+
 
 def custom_exception_handler(exc, context):
+    exc = translate_database_error(exc)
+
     # Call DRF's default exception handler to get the standard error response
     response = exception_handler(exc, context)
 
@@ -15,4 +56,4 @@ def custom_exception_handler(exc, context):
             'message': response.data
         }
         response.data = data
-    return response
\ No newline at end of file
+    return response
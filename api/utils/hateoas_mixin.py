@@ -1,12 +1,169 @@
 """
-tba
+HATEOAS links for model serializers.
+
+Serializers declaring a `neighbor_field` get the previous and next objects
+(in that field's order, over the whole table) of each instance for their
+`next`/`previous` links. The neighbours of every instance in a list are
+looked up together, in one query per page, by `HATEOASListSerializer`, so
+`get_links` reads them without touching the database.
+
+Clients choose how many links they get with `?links=` (or the `X-Links`
+header):
+
+- none: no `_links` at all (default of lists, `HATEOAS_LIST_LINKS_DEFAULT`,
+  so list payloads stay lean unless links are asked for);
+- compact: `_links` holds only each object's `self` link;
+- full: every link of `get_links` (default of other actions,
+  `HATEOAS_LINKS_DEFAULT`).
+
+In lists, the collection links (list, create, options, head) are left out
+of the rows and added once to the page by `CollectionLinksMixin`, with the
+pagination links.
 """
 
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db.models import Model, OuterRef, Subquery
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from api.utils.link_builder import get_link_builder
+
+
+NEIGHBORS_ATTR = '_hateoas_neighbors'
+LINKS_MODE_ATTR = '_hateoas_links_mode'
+
+LINKS_QUERY_PARAM = 'links'
+LINKS_HEADER = 'X-Links'
+LINKS_NONE = 'none'
+LINKS_COMPACT = 'compact'
+LINKS_FULL = 'full'
+LINKS_MODES = (LINKS_NONE, LINKS_COMPACT, LINKS_FULL)
+
+COLLECTION_LINKS = {
+    'list': 'GET',
+    'create': 'POST',
+    'options': 'OPTIONS',
+    'head': 'HEAD',
+}
+
+
+def get_default_links_mode(request: Any) -> str:
+    """
+    Return the link verbosity of requests not choosing one: lists default to
+    `HATEOAS_LIST_LINKS_DEFAULT`, other actions to `HATEOAS_LINKS_DEFAULT`.
+    """
+    view = (getattr(request, 'parser_context', None) or {}).get('view')
+    if getattr(view, 'action', None) == 'list':
+        return getattr(settings, 'HATEOAS_LIST_LINKS_DEFAULT', LINKS_NONE)
+    return getattr(settings, 'HATEOAS_LINKS_DEFAULT', LINKS_FULL)
+
+
+def get_links_mode(request: Any) -> str:
+    """
+    Return the link verbosity requested by the client.
+
+    Raises:
+        ValidationError: The requested mode is not one of `LINKS_MODES`.
+    """
+    mode = getattr(request, LINKS_MODE_ATTR, None)
+    if mode is not None:
+        return mode
+
+    mode = (
+        request.GET.get(LINKS_QUERY_PARAM)
+        or request.headers.get(LINKS_HEADER)
+        or get_default_links_mode(request)
+    ).lower()
+    if mode not in LINKS_MODES:
+        raise serializers.ValidationError({
+            LINKS_QUERY_PARAM: [
+                f'"{mode}" is not a valid choice; use one of: '
+                f'{", ".join(LINKS_MODES)}.'
+            ]
+        })
+
+    setattr(request, LINKS_MODE_ATTR, mode)
+    return mode
+
+
+def get_collection_links(request: Any, view_name: str) -> Dict[str, Dict]:
+    """
+    Return the links of a collection: list, create, options and head.
+    """
+    href = get_link_builder(request).url(view_name)
+    return {
+        name: {"href": href, "method": method}
+        for name, method in COLLECTION_LINKS.items()
+    }
+
+
+def get_neighbor_ids(
+    model: Type[Model],
+    field: str,
+    values: Iterable[Any],
+    using: Optional[str] = None
+) -> Dict[Any, Tuple[Any, Any]]:
+    """
+    Look up the previous and next values of `field` around each value.
+
+    Each neighbour is a correlated `ORDER BY ... LIMIT 1` subquery, i.e. one
+    index seek, all run in a single statement bounded by `values`.
+
+    Args:
+        model (Model): Model to look up.
+        field (str): Unique, ordered field (usually the primary key).
+        values (Iterable): Field values to find the neighbours of.
+        using (str | None): Database alias; routed when None.
+
+    Returns:
+        dict: `{value: (previous value, next value)}`; a missing neighbour
+        is None.
+    """
+    manager = model._default_manager.db_manager(using)
+    previous_id = manager.filter(
+        **{f'{field}__lt': OuterRef(field)}
+    ).order_by(f'-{field}').values(field)[:1]
+    next_id = manager.filter(
+        **{f'{field}__gt': OuterRef(field)}
+    ).order_by(field).values(field)[:1]
+
+    rows = manager.filter(**{f'{field}__in': list(values)}).annotate(
+        hateoas_previous_id=Subquery(previous_id),
+        hateoas_next_id=Subquery(next_id)
+    ).values_list(field, 'hateoas_previous_id', 'hateoas_next_id')
+
+    return {value: (previous, after) for value, previous, after in rows}
+
+
+class HATEOASListSerializer(serializers.ListSerializer):
+    """
+    List serializer looking up the neighbours of all its instances at once.
+    """
+
+    def to_representation(self, data):
+        request = self.child.context.get("request")
+        if request and get_links_mode(request) == LINKS_FULL:
+            data = list(data.all() if hasattr(data, 'all') else data)
+            self.child.attach_neighbors(data)
+        return super().to_representation(data)
+
 
 class HATEOASMixin:
     """
     Adds HATEOAS links to serializer output.
+
+    Attributes:
+        - neighbor_field (str | None): Field ordering the previous/next
+        neighbours returned by `get_neighbors`.
+        - detail_view_name (str | None): URL name of an object.
+        - list_view_name (str | None): URL name of the collection.
     """
+    neighbor_field: Optional[str] = None
+    detail_view_name: Optional[str] = None
+    list_view_name: Optional[str] = None
+
     # pylint: disable=unused-argument
     def get_links(self, obj):
         """
@@ -14,13 +171,95 @@ class HATEOASMixin:
         """
         return {}
 
+    def attach_neighbors(self, instances: Iterable[Model]) -> None:
+        """
+        Look up, in one query, the neighbours of the instances that do not
+        carry them yet.
+        """
+        field = self.neighbor_field
+        pending = [
+            instance for instance in instances
+            if not hasattr(instance, NEIGHBORS_ATTR)
+        ]
+        if not field or not pending:
+            return
+
+        neighbors = get_neighbor_ids(
+            type(pending[0]),
+            field,
+            {getattr(instance, field) for instance in pending},
+            using=pending[0]._state.db
+        )
+        for instance in pending:
+            setattr(
+                instance,
+                NEIGHBORS_ATTR,
+                neighbors.get(getattr(instance, field), (None, None))
+            )
+
+    def get_neighbors(self, obj: Model) -> Tuple[Any, Any]:
+        """
+        Return the `(previous, next)` values of `neighbor_field` for `obj`.
+        """
+        if not hasattr(obj, NEIGHBORS_ATTR):
+            self.attach_neighbors([obj])
+        return getattr(obj, NEIGHBORS_ATTR, (None, None))
+
+    def get_self_link(self, obj: Model) -> Dict[str, str]:
+        """
+        Return the `self` link of an object.
+        """
+        links = get_link_builder(self.context.get("request"))
+        return {
+            "href": links.url(self.detail_view_name, obj.pk),
+            "method": "GET"
+        }
+
     def to_representation(self, instance):
         """
-        tba
+        Add `_links` at the verbosity requested by the client; rows of a
+        list leave the collection links to the page.
         """
         rep = super().to_representation(instance)
         request = self.context.get("request")
+        if not request:
+            return rep
 
-        if request:
-            rep["_links"] = self.get_links(instance)
+        mode = get_links_mode(request)
+        if mode == LINKS_COMPACT:
+            rep["_links"] = {"self": self.get_self_link(instance)}
+        elif mode == LINKS_FULL:
+            links = self.get_links(instance)
+            if isinstance(self.parent, serializers.ListSerializer):
+                links = {
+                    name: link for name, link in links.items()
+                    if name not in COLLECTION_LINKS
+                }
+            rep["_links"] = links
         return rep
+
+
+class CollectionLinksMixin:
+    """
+    Adds the collection links, once, to paginated list responses.
+    """
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """
+        Add `_links` (collection and pagination links) to the page.
+        """
+        response = super().get_paginated_response(data)
+        view_name = getattr(
+            self.get_serializer_class(),
+            'list_view_name',
+            None
+        )
+        if not view_name or get_links_mode(self.request) == LINKS_NONE:
+            return response
+
+        links = get_collection_links(self.request, view_name)
+        for name in ('next', 'previous'):
+            if response.data.get(name):
+                links[name] = {"href": response.data[name], "method": "GET"}
+        response.data['_links'] = links
+        return response
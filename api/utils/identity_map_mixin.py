@@ -0,0 +1,91 @@
+"""
+Request-scoped identity map for nested serializers.
+
+A page of `StateProvince` or `SalesTerritory` rows usually points at a few
+`CountryRegion`s. Joined with `select_related`, every row carries its own
+copy of its region, and the nested serializer renders the same region once
+per row.
+
+Serializers using `IdentityMapMixin` change both, wherever they are nested:
+
+- loading: the query plan (`api.utils.serializer_query_mixin`) fetches the
+  relation with `prefetch_related` instead of a join, which loads each
+  distinct related row once, as one instance shared by every row pointing
+  at it;
+- serializing: the representation of each related object is kept in a map
+  stored on the request, keyed by serializer shape, model and primary key,
+  and reused by every later row (and serializer) of the request that nests
+  the same object.
+
+Reused representations are the same dict objects; they must not be mutated
+after serialization. Top-level use of the serializer (a list of regions) is
+not affected.
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from django.db.models import Model
+from rest_framework import serializers
+
+
+IDENTITY_MAP_ATTR = '_identity_map'
+
+
+def get_identity_map(context: Dict[str, Any]) -> Dict[Hashable, Any]:
+    """
+    Return the identity map of the serializer context's request (of the
+    context itself when there is no request), created on first use.
+    """
+    request = context.get('request')
+    if request is None:
+        return context.setdefault(IDENTITY_MAP_ATTR, {})
+
+    identity_map = getattr(request, IDENTITY_MAP_ATTR, None)
+    if identity_map is None:
+        identity_map = {}
+        setattr(request, IDENTITY_MAP_ATTR, identity_map)
+    return identity_map
+
+
+class IdentityMapMixin:
+    """
+    Loads and serializes each nested related object once per request.
+
+    Attributes:
+        - identity_mapped (bool): Read by the query plan; nested relations
+        to this serializer are prefetched rather than joined.
+    """
+    identity_mapped: bool = True
+
+    def get_identity_key(self, instance: Any) -> Optional[Tuple]:
+        """
+        Return the identity map key of an instance: serializer shape, model
+        and primary key; None when it cannot be mapped.
+        """
+        if not isinstance(instance, Model) or instance.pk is None:
+            return None
+
+        shape = getattr(self, '_identity_shape', None)
+        if shape is None:
+            shape = (type(self), tuple(self.fields))
+            self._identity_shape = shape
+        return (*shape, instance._meta.label_lower, instance.pk)
+
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """
+        Reuse the representation of a nested object already serialized in
+        this request.
+        """
+        if not isinstance(self.parent, serializers.Serializer):
+            return super().to_representation(instance)
+
+        key = self.get_identity_key(instance)
+        if key is None:
+            return super().to_representation(instance)
+
+        identity_map = get_identity_map(self.context)
+        rep = identity_map.get(key)
+        if rep is None:
+            rep = super().to_representation(instance)
+            identity_map[key] = rep
+        return rep
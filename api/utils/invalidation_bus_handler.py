@@ -0,0 +1,259 @@
+"""
+Cross-process cache invalidation over PostgreSQL LISTEN/NOTIFY.
+
+Every model here is `managed = False` and most writes come from the ETL
+pipeline, so neither `post_save` nor a moved `modified_date` can be relied on
+to tell the caches of a worker that a row changed. Instead, the triggers
+installed by `manage.py install_invalidation_triggers` send a notification
+on `INVALIDATION_BUS_CHANNEL` for every row written:
+
+    {"table": "country_regions", "pk": "DE"}
+
+(`"pk": null` for a `TRUNCATE`, or sent by hand after a bulk load, meaning
+the whole table). Each worker runs one listener thread per database server;
+a notification evicts the row's entries from the representation cache and
+invalidates its reference table, when it has one.
+
+Notifications sent while a listener is disconnected are lost, so a listener
+flushes every local cache each time it (re)connects. Keys of the shared
+representation cache backend are deleted along with the local entries known
+to the worker; whole-table notifications and flushes move the backend to a
+new key namespace instead, so entries written by other workers are dropped
+too. Entries left in old namespaces expire after
+`REPRESENTATION_CACHE_TIMEOUT`.
+
+The listeners are started by `core.wsgi`/`core.asgi` when
+`INVALIDATION_BUS_ENABLED` is set. Servers forking workers from a preloaded
+application (`gunicorn --preload`) must call `start_invalidation_listeners()`
+after the fork instead, e.g. from a `post_fork` hook.
+
+Example:
+    handle_notification('{"table": "country_regions", "pk": "DE"}')
+"""
+
+import json
+import threading
+from typing import Any, Dict, List, Optional
+
+import psycopg
+from psycopg import sql
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+
+from api.db.schema_router import get_model_alias, get_table_model
+from api.utils import reference_data_handler
+from api.utils.logging_handler import log_event
+from api.utils.representation_cache_handler import get_representation_cache
+
+
+DEFAULT_CHANNEL = "api_invalidation"
+
+_listeners: Dict[str, "InvalidationListener"] = {}
+_listeners_lock = threading.Lock()
+
+
+def get_channel() -> str:
+    """
+    Return the channel the triggers notify and the listeners listen on.
+    """
+    return getattr(settings, "INVALIDATION_BUS_CHANNEL", DEFAULT_CHANNEL)
+
+
+def evict(model: type, pk: Optional[Any] = None) -> None:
+    """
+    Evict the cached entries of a row, or of every row of a model when `pk`
+    is None.
+    """
+    reference_data_handler.invalidate([model])
+    cache = get_representation_cache()
+    if cache is not None:
+        cache.evict(model._meta.label_lower, pk)
+
+
+def flush() -> None:
+    """
+    Drop every entry of the local caches, and move the shared representation
+    cache to a new namespace.
+    """
+    reference_data_handler.invalidate()
+    cache = get_representation_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def handle_notification(payload: str) -> None:
+    """
+    Evict the entries named by a notification payload.
+
+    Args:
+        payload (str): JSON object with the `table` written and the `pk` of
+            the row, null for the whole table.
+    """
+    try:
+        message = json.loads(payload)
+        table, pk = message["table"], message.get("pk")
+    except (TypeError, ValueError, KeyError):
+        log_event("WARNING", "Invalid invalidation payload", payload=payload)
+        return
+
+    model = get_table_model(table)
+    if model is not None:
+        evict(model, pk)
+
+
+def get_listened_aliases() -> List[str]:
+    """
+    Return the primary aliases holding the unmanaged tables.
+    """
+    return sorted({
+        get_model_alias(model) for model in apps.get_models()
+        if not model._meta.managed
+    })
+
+
+class InvalidationListener(threading.Thread):
+    """
+    Daemon thread listening to the invalidation channel of one alias.
+
+    Attributes:
+        - alias (str): Primary database alias listened to.
+        - connected (bool): Whether the listener is connected now.
+        - notifications (int): Notifications handled.
+        - connects (int): Successful (re)connections, each followed by a
+        flush.
+        - errors (int): Connections lost or refused, and other failures
+        ending a connection.
+    """
+
+    def __init__(self, alias: str):
+        super().__init__(name=f"invalidation-listener-{alias}", daemon=True)
+        self.alias = alias
+        self.connected = False
+        self.notifications = self.connects = self.errors = 0
+        self._stopped = threading.Event()
+
+    def get_connection_params(self) -> Dict[str, Any]:
+        """
+        Return psycopg connection parameters for the alias, unpooled.
+        """
+        params = connections[self.alias].get_connection_params()
+        params.pop("cursor_factory", None)
+        params.pop("pool", None)
+        params.pop("context", None)
+        return params
+
+    def run(self) -> None:
+        delay = settings.INVALIDATION_BUS_RECONNECT_DELAY
+        while not self._stopped.is_set():
+            try:
+                self.listen()
+            except Exception as exc:  # pylint: disable=broad-except
+                # the thread must outlive any error, or the caches go stale
+                self.errors += 1
+                log_event(
+                    "WARNING",
+                    "Invalidation listener disconnected",
+                    alias=self.alias,
+                    error=str(exc),
+                    retry_in=delay
+                )
+            if self.connected:
+                delay = settings.INVALIDATION_BUS_RECONNECT_DELAY
+                self.connected = False
+            # rows written from now until the next LISTEN go unnoticed
+            try:
+                flush()
+            except Exception as exc:  # pylint: disable=broad-except
+                # the shared backend may be down too; retry on reconnect
+                self.errors += 1
+                log_event(
+                    "WARNING",
+                    "Invalidation flush failed",
+                    alias=self.alias,
+                    error=str(exc)
+                )
+            if self._stopped.wait(delay):
+                break
+            delay = min(
+                delay * 2,
+                settings.INVALIDATION_BUS_RECONNECT_MAX_DELAY
+            )
+
+    def listen(self) -> None:
+        """
+        Connect, flush and handle notifications until stopped or
+        disconnected.
+        """
+        timeout = settings.INVALIDATION_BUS_HEALTH_CHECK_INTERVAL
+        with psycopg.connect(
+            **self.get_connection_params(),
+            autocommit=True
+        ) as conn:
+            conn.execute(
+                sql.SQL("LISTEN {}").format(sql.Identifier(get_channel()))
+            )
+            # notifications sent before LISTEN were missed
+            flush()
+            self.connected = True
+            self.connects += 1
+            log_event(
+                "INFO",
+                "Invalidation listener connected",
+                alias=self.alias,
+                channel=get_channel()
+            )
+
+            while not self._stopped.is_set():
+                for notify in conn.notifies(timeout=timeout):
+                    self.notifications += 1
+                    handle_notification(notify.payload)
+                    if self._stopped.is_set():
+                        return
+                # a silent channel looks like a dead connection; probe it
+                conn.execute("SELECT 1")
+
+    def stop(self) -> None:
+        """
+        Ask the thread to exit after its current wait.
+        """
+        self._stopped.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the listener's state.
+        """
+        return {
+            "alive": self.is_alive(),
+            "connected": self.connected,
+            "notifications": self.notifications,
+            "connects": self.connects,
+            "errors": self.errors,
+        }
+
+
+def start_invalidation_listeners() -> None:
+    """
+    Start the listener threads of this process, once, when
+    `INVALIDATION_BUS_ENABLED` is set.
+    """
+    if not getattr(settings, "INVALIDATION_BUS_ENABLED", False):
+        return
+
+    with _listeners_lock:
+        for alias in get_listened_aliases():
+            if alias in _listeners and _listeners[alias].is_alive():
+                continue
+            listener = InvalidationListener(alias)
+            listener.start()
+            _listeners[alias] = listener
+
+
+def get_invalidation_bus_stats() -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Return the state of the process's listeners by alias, or None when the
+    bus is disabled.
+    """
+    if not getattr(settings, "INVALIDATION_BUS_ENABLED", False):
+        return None
+    return {alias: listener.stats() for alias, listener in _listeners.items()}
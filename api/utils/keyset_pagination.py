@@ -0,0 +1,322 @@
+"""
+Keyset (seek) pagination for DRF viewsets.
+
+Pages are addressed by an opaque cursor holding the ordering values of the
+row at the page boundary, and fetched with `WHERE (key) > (last key) LIMIT n`
+instead of `OFFSET`, so page N costs the same index seek as page 1. Paging
+needs no total, so none is computed unless the client asks for one:
+`?count=exact` runs a `COUNT(*)`, `?count=estimate` estimates it on large
+tables (see `EstimatedCountMixin`). Otherwise `count` is null.
+
+Ordering defaults to the view's `lookup_field`, which is unique. A view may
+declare `keyset_ordering` to page by other columns first; `lookup_field` is
+then appended as the final tie-breaker so every position stays unique.
+
+Example:
+    class StateProvinceViewSet(BaseHATEOASViewSet):
+        lookup_field = 'state_province_id'
+        keyset_ordering = ['name']          # optional
+        pagination_class = KeysetPagination
+
+    GET /api/people/state-provinces?page_size=50
+    GET /api/people/state-provinces?cursor=eyJvIjpbInN0YXRlX3...
+    GET /api/people/state-provinces?count=estimate
+"""
+
+import base64
+import binascii
+import json
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from api.utils.estimated_count_pagination import EstimatedCountMixin
+
+
+class KeysetPagination(EstimatedCountMixin, BasePagination):
+    """
+    Seek-based pagination on the view's `lookup_field`.
+
+    Attributes:
+        - page_size (int): Default number of items per page.
+        - page_size_query_param (str): Query parameter to override the page
+        size.
+        - max_page_size (int): Maximum allowed page size (100).
+        - cursor_query_param (str): Query parameter holding the cursor.
+        - count_query_param (str): Query parameter requesting a count
+        (`exact` or `estimate`).
+    """
+    page_size: int = api_settings.PAGE_SIZE
+    page_size_query_param: str = 'page_size'
+    max_page_size: int = 100
+    cursor_query_param: str = 'cursor'
+    count_query_param: str = 'count'
+    count_modes: Sequence[str] = ('exact', 'estimate')
+    invalid_cursor_message: str = 'Invalid cursor'
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: Any = None
+    ) -> Optional[List[Any]]:
+        """
+        Return the page of rows after (or before) the requested cursor.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.queryset = queryset
+        self.ordering = self.get_ordering(queryset, view)
+        cursor = self.decode_cursor(request)
+        backwards = bool(cursor and cursor['b'])
+
+        ordering = [
+            self.flip(field) if backwards else field
+            for field in self.ordering
+        ]
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(
+                self.build_seek_filter(cursor['v'], ordering)
+            )
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if backwards:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request: Request) -> Optional[int]:
+        """
+        Return the page size, honouring `page_size_query_param`.
+        """
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, queryset: QuerySet, view: Any) -> List[str]:
+        """
+        Build the ordering: the view's `keyset_ordering`, or the queryset's
+        own ordering, ending with the unique `lookup_field`.
+        """
+        lookup_field = getattr(view, 'lookup_field', None) or 'pk'
+        ordering = list(
+            getattr(view, 'keyset_ordering', None)
+            or queryset.query.order_by
+            or [lookup_field]
+        )
+
+        if lookup_field not in [field.lstrip('-') for field in ordering]:
+            ordering.append(lookup_field)
+        return ordering
+
+    @staticmethod
+    def flip(field: str) -> str:
+        """
+        Reverse the direction of an ordering field.
+        """
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def build_seek_filter(values: Sequence[Any], ordering: List[str]) -> Q:
+        """
+        Build the filter selecting rows strictly after `values` in `ordering`:
+        `(a > x) OR (a = x AND b > y) OR ...`, with `<` for descending fields.
+        """
+        seek = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            seek |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return seek
+
+    def get_position(self, instance: Any) -> List[Any]:
+        """
+        Return the ordering values of a row (an instance, or a `values()`
+        dict).
+        """
+        if isinstance(instance, dict):
+            return [instance[field.lstrip('-')] for field in self.ordering]
+        return [
+            attrgetter(field.lstrip('-').replace('__', '.'))(instance)
+            for field in self.ordering
+        ]
+
+    def encode_cursor(self, instance: Any, backwards: bool) -> str:
+        """
+        Return the page URL for the cursor positioned at `instance`.
+        """
+        token = json.dumps(
+            {
+                'o': self.ordering,
+                'v': self.get_position(instance),
+                'b': backwards
+            },
+            cls=DjangoJSONEncoder,
+            separators=(',', ':')
+        )
+        encoded = base64.urlsafe_b64encode(token.encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            encoded
+        )
+
+    def decode_cursor(self, request: Request) -> Optional[Dict[str, Any]]:
+        """
+        Decode the cursor query parameter; raise 404 when it is malformed or
+        was issued for a different ordering.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            valid = (
+                cursor['o'] == self.ordering
+                and len(cursor['v']) == len(self.ordering)
+                and isinstance(cursor['b'], bool)
+            )
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            valid = False
+
+        if not valid:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def get_next_link(self) -> Optional[str]:
+        """
+        Return the URL of the next page, if any.
+        """
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], backwards=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """
+        Return the URL of the previous page, if any.
+        """
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(
+                self.request.build_absolute_uri(),
+                self.cursor_query_param
+            )
+        return self.encode_cursor(self.page[0], backwards=True)
+
+    def get_count_mode(self, request: Request) -> Optional[str]:
+        """
+        Return the count requested by the client: `exact`, `estimate` or
+        None. `?exact_count=true` is read as `?count=exact`.
+        """
+        mode = request.query_params.get(self.count_query_param, '').lower()
+        if mode in self.count_modes:
+            return mode
+        if self.is_exact_count_requested(request):
+            return 'exact'
+        return None
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """
+        Wrap a page of serialized rows with the requested count and the
+        next/previous links.
+        """
+        count, count_exact = None, False
+        mode = self.get_count_mode(self.request)
+        if mode == 'exact':
+            count, count_exact = self.queryset.count(), True
+        elif mode == 'estimate':
+            count, count_exact = self.get_count(self.queryset)
+        return Response({
+            'count': count,
+            'count_exact': count_exact,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema: Dict) -> Dict:
+        """
+        OpenAPI schema of the paginated response.
+        """
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri'
+                },
+                **self.get_count_schema(),
+                'count': {
+                    'type': 'integer',
+                    'nullable': True,
+                    'example': 123
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> List[Dict]:
+        """
+        OpenAPI parameters accepted by the paginator.
+        """
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque cursor returned in next/previous.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results to return per page.',
+                'schema': {'type': 'integer'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    'Include the total count: exact, or estimated on '
+                    'large tables.'
+                ),
+                'schema': {'type': 'string', 'enum': list(self.count_modes)},
+            },
+        ]
@@ -0,0 +1,128 @@
+"""
+orjson-backed JSON renderer and parser.
+
+Drop-in replacements for DRF's `JSONRenderer` and `JSONParser` that encode
+and decode with orjson (native code) instead of the stdlib `json` module and
+its Python-level encoder. Output is byte-for-byte the one of `JSONRenderer`
+with the default settings (`COMPACT_JSON`, `UNICODE_JSON`, `STRICT_JSON`):
+
+- compact separators, UTF-8 output, U+2028/U+2029 escaped;
+- strings, ints, bools, None, dicts and lists are encoded natively;
+- `datetime`/`date`/`time` objects go through DRF's own `JSONEncoder`
+  (`...Z` for UTC), as do `Decimal` (a float, as in DRF; `DecimalField`s
+  are already strings under `COERCE_DECIMAL_TO_STRING`), lazy strings,
+  querysets and the other types DRF's encoder accepts;
+- `UUID`s are encoded natively, as their canonical string.
+
+The one textual difference is the exponent notation of very large or small
+floats (`1e16` rather than `1e+16`), which is the same JSON number.
+
+orjson writes NaN and ±Infinity as `null`, where `STRICT_JSON` makes
+`JSONRenderer` raise `ValueError`. Since a non-finite float can only have
+become a `null`, the data is searched for one only when the output holds a
+`null`, and such data is handed to the stock renderer, which raises as
+before.
+
+Anything orjson cannot do as `JSONRenderer` would (indented output,
+`UNICODE_JSON`/`COMPACT_JSON`/`STRICT_JSON` turned off, integers beyond 64
+bits) falls back to the stock renderer, and malformed request bodies are
+re-parsed by the stock parser so error messages do not change.
+"""
+
+import io
+import math
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import orjson
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+
+OPTIONS: int = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+def has_non_finite(data: Any) -> bool:
+    """
+    Return True if `data` holds a NaN or infinite float or `Decimal`.
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, Decimal):
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite(value) for value in data)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` encoding with orjson.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None
+    ) -> bytes:
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if (indent is not None or self.ensure_ascii
+                or not self.compact or not self.strict):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if b'null' in ret and has_non_finite(data):
+            # raises ValueError, as STRICT_JSON does
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # same as JSONRenderer: keep the output valid JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+            b'\xe2\x80\xa9', b'\\u2029'
+        )
+
+
+class ORJSONParser(JSONParser):
+    """
+    `JSONParser` decoding with orjson.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None
+    ) -> Any:
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        body = stream.read() if stream is not None else b''
+
+        try:
+            if encoding.lower().replace('-', '') == 'utf8':
+                return orjson.loads(body)
+            return orjson.loads(body.decode(encoding))
+        except (orjson.JSONDecodeError, UnicodeDecodeError):
+            pass
+
+        # let the stdlib parser raise its usual ParseError (or parse what
+        # orjson refuses, e.g. integers beyond 64 bits)
+        return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,88 @@
+"""
+Prepared statement statistics.
+
+Reads `pg_prepared_statements` for the database session currently held by a
+Django connection. psycopg3 prepares statements at the protocol level (not
+with SQL `PREPARE`), so those are the rows with `from_sql = false`.
+
+Each execution of a prepared statement skips parsing, then either reuses the
+cached generic plan (no planning either) or builds a custom plan for the given
+parameters. `generic_plan_rate` is the share of executions served by the
+generic plan, `generic_plans / executions`; it is not a cache hit rate, since
+custom-plan executions are still served from the prepared statement.
+
+Example:
+    stats = get_prepared_statement_stats("default")
+    log_event("INFO", "Prepared statements", **stats["totals"])
+"""
+from typing import Any, Dict
+
+from django.conf import settings
+from django.db import connections
+
+
+PREPARED_STATEMENTS_SQL: str = """
+    SELECT name, statement, prepare_time, generic_plans, custom_plans
+    FROM pg_prepared_statements
+    WHERE NOT from_sql
+    ORDER BY generic_plans + custom_plans DESC
+"""
+
+
+def get_prepared_statement_stats(alias: str = "default") -> Dict[str, Any]:
+    """
+    Summarize the prepared statements of the current session of an alias.
+
+    Args:
+        alias (str): Database alias from `settings.DATABASES`.
+
+    Returns:
+        dict:
+            - enabled (bool): Whether prepared statements are configured.
+            - prepare_threshold (int | None): Executions before a statement is
+              prepared.
+            - backend_pid (int): PostgreSQL session the figures belong to.
+            - totals (dict): Prepared statement count, executions, generic
+              and custom plans, and the generic plan rate.
+            - statements (list): The same figures per statement.
+    """
+    connection = connections[alias]
+    options = settings.DATABASES[alias].get("OPTIONS", {})
+    statements = []
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        backend_pid = cursor.fetchone()[0]
+
+        cursor.execute(PREPARED_STATEMENTS_SQL)
+        for name, statement, prepare_time, generic, custom in cursor:
+            executions = generic + custom
+            statements.append({
+                "name": name,
+                "statement": statement,
+                "prepared_at": prepare_time.isoformat(),
+                "executions": executions,
+                "generic_plans": generic,
+                "custom_plans": custom,
+                "generic_plan_rate": round(generic / executions, 3)
+                if executions else 0.0,
+            })
+
+    executions = sum(row["executions"] for row in statements)
+    generic_plans = sum(row["generic_plans"] for row in statements)
+
+    return {
+        "alias": alias,
+        "enabled": bool(options.get("server_side_binding")),
+        "prepare_threshold": options.get("prepare_threshold"),
+        "backend_pid": backend_pid,
+        "totals": {
+            "prepared": len(statements),
+            "executions": executions,
+            "generic_plans": generic_plans,
+            "custom_plans": executions - generic_plans,
+            "generic_plan_rate": round(generic_plans / executions, 3)
+            if executions else 0.0,
+        },
+        "statements": statements,
+    }
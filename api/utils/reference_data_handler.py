@@ -0,0 +1,224 @@
+"""
+Per-process cache of small reference tables.
+
+`CountryRegion`, `AddressType`, `Currency` and the other lookup tables listed
+in `REFERENCE_DATA_MODELS` hold a few hundred rows at most and change
+rarely, yet they are queried for every foreign key validation and every
+nested serialization. Each table is loaded whole, once, on first use, and
+then serves:
+
+- lookups: `get_reference(CountryRegion, 'DE')`;
+- foreign key validation: `ReferencePrimaryKeyRelatedField` and
+  `ReferenceSlugRelatedField` (see `api.utils.reference_data_mixin`);
+- nested serialization: serializers using `ReferenceDataMixin` read the
+  related row from the cache instead of a join or prefetch.
+
+Every table carries a version number, bumped by `invalidate()`. A load that
+was overtaken by an invalidation is discarded instead of installed, so a
+cache filled concurrently with a write never keeps the pre-write rows.
+
+Writes through the ORM (the API's create/update/destroy, the admin) invalidate
+their table once the transaction commits, through `post_save`/`post_delete`.
+Bulk `QuerySet.update()`/`delete()` calls and writes made outside Django do
+not send those signals and are only seen after an explicit `invalidate()`.
+
+Tables larger than `REFERENCE_DATA_MAX_ROWS` are not cached; lookups on them
+fall back to the database.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+
+from api.utils.logging_handler import log_event
+
+
+class ReferenceTable:
+    """
+    The cached rows of one reference model.
+
+    Attributes:
+        - model (Model): The reference model.
+        - version (int): Bumped by every invalidation.
+        - rows (dict | None): Rows by primary key; None until loaded, or
+        when the table is too large to cache.
+    """
+
+    def __init__(self, model: Type[Model]):
+        self.model = model
+        self.version = 0
+        self.rows: Optional[Dict[Any, Model]] = None
+        self.cacheable = True
+        self._indexes: Dict[str, Dict[Any, Model]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[Any, Model]]:
+        """
+        Return the rows by primary key, loading the table on first use.
+        """
+        rows = self.rows
+        if rows is not None or not self.cacheable:
+            return rows
+
+        with self._lock:
+            if self.rows is not None:
+                return self.rows
+            version = self.version
+
+        limit = getattr(settings, "REFERENCE_DATA_MAX_ROWS", 10000)
+        loaded = list(self.model._default_manager.all()[:limit + 1])
+        if len(loaded) > limit:
+            self.cacheable = False
+            log_event(
+                "WARNING",
+                "Reference table too large to cache",
+                model=self.model._meta.label,
+                limit=limit
+            )
+            return None
+
+        rows = {row.pk: row for row in loaded}
+        with self._lock:
+            if self.version != version:
+                # invalidated while loading: serve, but do not keep
+                return rows
+            self.rows = rows
+            self._indexes = {}
+        return rows
+
+    def get(self, pk: Any) -> Optional[Model]:
+        """
+        Return the row with a primary key, or None.
+        """
+        rows = self.load()
+        if rows is None:
+            return self.model._default_manager.filter(pk=pk).first()
+        return rows.get(self.model._meta.pk.to_python(pk))
+
+    def get_by(self, field: str, value: Any) -> Optional[Model]:
+        """
+        Return the row whose `field` equals `value`, or None.
+        """
+        if field == self.model._meta.pk.name:
+            return self.get(value)
+
+        rows = self.load()
+        if rows is None:
+            return self.model._default_manager.filter(
+                **{field: value}
+            ).first()
+
+        index = self._indexes.get(field)
+        if index is None:
+            index = {getattr(row, field): row for row in rows.values()}
+            self._indexes[field] = index
+        return index.get(self.model._meta.get_field(field).to_python(value))
+
+    def all(self) -> List[Model]:
+        """
+        Return every row, in the model's default ordering.
+        """
+        rows = self.load()
+        if rows is None:
+            return list(self.model._default_manager.all())
+        return list(rows.values())
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached rows; the next access reloads them.
+        """
+        with self._lock:
+            self.version += 1
+            self.rows = None
+            self._indexes = {}
+            self.cacheable = True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the table's cache state.
+        """
+        rows = self.rows
+        return {
+            "loaded": rows is not None,
+            "rows": len(rows) if rows is not None else 0,
+            "version": self.version,
+            "cacheable": self.cacheable,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_reference_tables() -> Dict[Type[Model], ReferenceTable]:
+    """
+    Return the reference tables of `REFERENCE_DATA_MODELS`, by model.
+    """
+    return {
+        model: ReferenceTable(model)
+        for model in map(
+            import_string,
+            getattr(settings, "REFERENCE_DATA_MODELS", [])
+        )
+    }
+
+
+def get_reference_table(model: Type[Model]) -> Optional[ReferenceTable]:
+    """
+    Return the cached table of a model, or None when it is not reference
+    data.
+    """
+    return get_reference_tables().get(model)
+
+
+def is_reference_model(model: Type[Model]) -> bool:
+    """
+    Return True when a model is served from the reference data cache.
+    """
+    return model in get_reference_tables()
+
+
+def get_reference(model: Type[Model], pk: Any) -> Optional[Model]:
+    """
+    Look up a reference row by primary key.
+    """
+    table = get_reference_table(model)
+    if table is None:
+        return model._default_manager.filter(pk=pk).first()
+    return table.get(pk)
+
+
+def invalidate(models: Optional[Iterable[Type[Model]]] = None) -> None:
+    """
+    Invalidate the cached tables of some models, or of every model.
+    """
+    tables = get_reference_tables()
+    for model in tables if models is None else models:
+        table = tables.get(model)
+        if table is not None:
+            table.invalidate()
+
+
+def get_reference_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the cache state of every reference table, by model label.
+    """
+    return {
+        model._meta.label: table.stats()
+        for model, table in get_reference_tables().items()
+    }
+
+
+def invalidate_on_write(sender: Type[Model], using: str, **kwargs) -> None:
+    """
+    Invalidate a reference table once the write to it commits.
+    """
+    if is_reference_model(sender):
+        transaction.on_commit(lambda: invalidate([sender]), using=using)
+
+
+post_save.connect(invalidate_on_write, dispatch_uid="reference_data_save")
+post_delete.connect(invalidate_on_write, dispatch_uid="reference_data_delete")
@@ -0,0 +1,116 @@
+"""
+Serializer support for the reference data cache.
+
+- `ReferenceDataMixin`, on the serializer of a reference model, makes every
+  serializer nesting it read the related row from the cache (through the
+  foreign key column) instead of from a join or prefetch; the query plan
+  (`api.utils.serializer_query_mixin`) leaves such relations out.
+- `ReferencePrimaryKeyRelatedField` and `ReferenceSlugRelatedField` validate
+  incoming foreign keys against the cache instead of querying their
+  `queryset`, which is still used for the browsable API's choices.
+
+Both fall back to the regular behavior for models that are not listed in
+`REFERENCE_DATA_MODELS`, and the related fields do so for filtered querysets.
+
+Example:
+    country_region_code = ReferencePrimaryKeyRelatedField(
+        queryset=CountryRegion.objects.all(),
+        source='country_region',
+        write_only=True
+    )
+"""
+
+from typing import Any, Optional
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Model, QuerySet
+from rest_framework import serializers
+
+from api.utils.reference_data_handler import (
+    ReferenceTable,
+    get_reference_table
+)
+
+
+def get_queryset_table(
+    queryset: Optional[QuerySet]
+) -> Optional[ReferenceTable]:
+    """
+    Return the reference table an unfiltered queryset reads, or None.
+    """
+    if queryset is None or queryset.query.has_filters():
+        return None
+    return get_reference_table(queryset.model)
+
+
+class ReferenceDataMixin:
+    """
+    Serves nested instances of a reference model from the cache.
+
+    Attributes:
+        - reference_data (bool): Read by the query plan; relations to this
+        serializer are neither joined nor prefetched.
+    """
+    reference_data: bool = True
+
+    def get_attribute(self, instance: Any) -> Any:
+        """
+        Read a forward foreign key from the cache.
+        """
+        if isinstance(instance, Model) and len(self.source_attrs) == 1:
+            try:
+                field = instance._meta.get_field(self.source_attrs[0])
+            except FieldDoesNotExist:
+                field = None
+            if field is not None and field.many_to_one and field.concrete:
+                table = get_reference_table(field.related_model)
+                if table is not None:
+                    value = getattr(instance, field.attname)
+                    return None if value is None else table.get(value)
+        return super().get_attribute(instance)
+
+
+class ReferencePrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    `PrimaryKeyRelatedField` validated against the reference data cache.
+    """
+
+    def to_internal_value(self, data: Any) -> Model:
+        table = get_queryset_table(self.get_queryset())
+        if table is None:
+            return super().to_internal_value(data)
+
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            instance = table.get(data)
+        except (TypeError, ValueError, ValidationError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if instance is None:
+            self.fail('does_not_exist', pk_value=data)
+        return instance
+
+
+class ReferenceSlugRelatedField(serializers.SlugRelatedField):
+    """
+    `SlugRelatedField` validated against the reference data cache.
+    """
+
+    def to_internal_value(self, data: Any) -> Model:
+        table = get_queryset_table(self.get_queryset())
+        if table is None or '__' in self.slug_field:
+            return super().to_internal_value(data)
+
+        try:
+            instance = table.get_by(self.slug_field, data)
+        except (TypeError, ValueError, ValidationError):
+            self.fail('invalid')
+        if instance is None:
+            self.fail(
+                'does_not_exist',
+                slug_name=self.slug_field,
+                value=str(data)
+            )
+        return instance
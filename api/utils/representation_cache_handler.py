@@ -0,0 +1,349 @@
+"""
+Cache of serialized model representations.
+
+Every model here carries an `auto_now` `modified_date`, so a row's
+representation is fully determined by its model, primary key and
+`modified_date` (for a given serializer shape). Entries are keyed on
+exactly that, which makes invalidation implicit: saving a row moves its
+`modified_date`, and the stale entry is simply never asked for again and
+ages out of the LRU.
+
+The cache is two-level:
+
+- a per-process LRU bounded to `REPRESENTATION_CACHE_SIZE` entries (0
+  disables the cache);
+- optionally, a shared Django cache (`REPRESENTATION_CACHE_BACKEND`, an alias
+  of `CACHES`), so workers fill the cache for one another. Shared hits are
+  copied into the local LRU.
+
+Rows changed without touching `modified_date` (`QuerySet.update()` calls
+that do not set it, writes made outside Django) are not seen until their
+entries are evicted, e.g. by the invalidation bus
+(`api.utils.invalidation_bus_handler`), which calls `evict()` for every row
+changed in the database. Entries are indexed by their row for that.
+
+Evictions also bump a generation, per row and per model. Callers read
+`generation()` before serializing a row and hand it to `set()`, which
+refuses the entry when the row was evicted in between: a representation
+built from pre-write data is never stored after the eviction of that write.
+
+Keys of the shared backend are prefixed with a namespace version, kept in
+the backend itself, per model and for the whole cache. Evicting a whole
+model or clearing the cache bumps it, so the shared entries left behind by
+every worker, known locally or not, are no longer read.
+
+Example:
+    cache = get_representation_cache()
+    if cache:
+        stats = cache.stats()
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+Owner = Tuple[str, str]
+Generation = Tuple[int, int, int]
+
+NAMESPACE_KEY = "rep:namespace"
+
+
+class RepresentationCache:
+    """
+    Thread-safe LRU of representations, with an optional shared backend.
+
+    Attributes:
+        - max_entries (int): Entries kept in the process before evicting.
+        - backend (BaseCache | None): Shared Django cache, if any.
+        - timeout (int | None): Expiry of entries in the shared backend.
+        - hits (int): Lookups answered by the local LRU.
+        - shared_hits (int): Lookups answered by the shared backend.
+        - misses (int): Lookups answered by neither.
+        - evictions (int): Entries dropped from the local LRU.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        backend: Optional[Any] = None,
+        timeout: Optional[int] = None
+    ):
+        self.max_entries = max_entries
+        self.backend = backend
+        self.timeout = timeout
+        self._entries: OrderedDict = OrderedDict()
+        self._owners: Dict[Owner, Set[str]] = {}
+        self._generation = 0
+        self._label_generations: Dict[str, int] = {}
+        self._owner_generations: Dict[Owner, int] = {}
+        self._namespaces: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = self.shared_hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: str,
+        owner: Optional[Owner] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the representation stored under `key`, or None.
+
+        Args:
+            key (str): Cache key.
+            owner (tuple | None): `(model label, pk)` of the row, indexing
+                entries copied from the shared backend.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        if self.backend is not None:
+            value = self.backend.get(self.get_backend_key(key, owner))
+            if value is not None:
+                self._store(key, value, owner)
+                with self._lock:
+                    self.shared_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def generation(self, owner: Owner) -> Generation:
+        """
+        Return the eviction generation of a row, to pass to `set()`.
+        """
+        with self._lock:
+            return self._get_generation(owner)
+
+    def _get_generation(self, owner: Owner) -> Generation:
+        return (
+            self._generation,
+            self._label_generations.get(owner[0], 0),
+            self._owner_generations.get(owner, 0),
+        )
+
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        owner: Optional[Owner] = None,
+        generation: Optional[Generation] = None
+    ) -> bool:
+        """
+        Store a representation locally and in the shared backend.
+
+        Args:
+            key (str): Cache key.
+            value (dict): Representation.
+            owner (tuple | None): `(model label, pk)` of the row, so that
+                `evict()` can find the entry.
+            generation (tuple | None): `generation()` of the owner, read
+                before the representation was built.
+
+        Returns:
+            bool: False when the row was evicted since `generation` was
+            read, and nothing was stored.
+        """
+        if not self._store(key, value, owner, generation):
+            return False
+        if self.backend is not None:
+            backend_key = self.get_backend_key(key, owner)
+            self.backend.set(backend_key, value, self.timeout)
+            if generation is not None and owner is not None:
+                with self._lock:
+                    current = self._get_generation(owner)
+                if current != generation:
+                    # evicted while writing: the eviction may have missed it
+                    self.backend.delete(backend_key)
+                    return False
+        return True
+
+    def _store(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        owner: Optional[Owner],
+        generation: Optional[Generation] = None
+    ) -> bool:
+        with self._lock:
+            if (generation is not None and owner is not None
+                    and self._get_generation(owner) != generation):
+                return False
+            self._entries[key] = (value, owner)
+            self._entries.move_to_end(key)
+            if owner is not None:
+                self._owners.setdefault(owner, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                evicted, (_, evicted_owner) = self._entries.popitem(
+                    last=False
+                )
+                self._unindex(evicted, evicted_owner)
+                self.evictions += 1
+        return True
+
+    def _unindex(self, key: str, owner: Optional[Owner]) -> None:
+        keys = self._owners.get(owner)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._owners[owner]
+
+    def evict(self, label: str, pk: Optional[Any] = None) -> int:
+        """
+        Drop the entries of a row, or of every row of a model when `pk` is
+        None, and bump the matching generation.
+
+        The shared entries of a row are deleted for the keys known here;
+        those of a whole model are dropped by moving its namespace.
+
+        Returns:
+            int: Number of local entries dropped.
+        """
+        with self._lock:
+            if pk is not None:
+                owner = (label, str(pk))
+                owners = [owner]
+                self._owner_generations[owner] = (
+                    self._owner_generations.get(owner, 0) + 1
+                )
+                if len(self._owner_generations) > self.max_entries:
+                    # bounded like the LRU: move every row on at once
+                    self._owner_generations.clear()
+                    self._generation += 1
+            else:
+                owners = [owner for owner in self._owners
+                          if owner[0] == label]
+                self._label_generations[label] = (
+                    self._label_generations.get(label, 0) + 1
+                )
+            keys = [
+                (key, owner) for owner in owners
+                for key in self._owners.pop(owner, ())
+            ]
+            for key, _ in keys:
+                self._entries.pop(key, None)
+
+        if self.backend is not None:
+            if pk is None:
+                self.bump_namespace(label)
+            elif keys:
+                self.backend.delete_many([
+                    self.get_backend_key(key, owner) for key, owner in keys
+                ])
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop every local entry, bump every generation and move the shared
+        backend to a new namespace.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._owners.clear()
+            self._owner_generations.clear()
+            self._generation += 1
+        if self.backend is not None:
+            self.bump_namespace()
+
+    def get_namespace(self, label: str = "") -> int:
+        """
+        Return the shared namespace version of a model, or of the whole
+        cache for an empty label, as last read from the backend.
+        """
+        namespace = self._namespaces.get(label)
+        if namespace is None:
+            key = f"{NAMESPACE_KEY}:{label}" if label else NAMESPACE_KEY
+            self.backend.add(key, 0, None)
+            namespace = self.backend.get(key, 0)
+            self._namespaces[label] = namespace
+        return namespace
+
+    def bump_namespace(self, label: str = "") -> None:
+        """
+        Move a model, or the whole cache for an empty label, to a new shared
+        namespace.
+        """
+        key = f"{NAMESPACE_KEY}:{label}" if label else NAMESPACE_KEY
+        self.backend.add(key, 0, None)
+        try:
+            self.backend.incr(key)
+        except ValueError:
+            # expired between add() and incr()
+            self.backend.set(key, 1, None)
+        # re-read on next use, after the other workers' bumps
+        self._namespaces.pop(label, None)
+
+    def get_backend_key(self, key: str, owner: Optional[Owner]) -> str:
+        """
+        Return the shared backend key of an entry, in its namespace.
+        """
+        label = owner[0] if owner is not None else ""
+        namespace = self.get_namespace()
+        if label:
+            return f"{key}@{namespace}.{self.get_namespace(label)}"
+        return f"{key}@{namespace}"
+
+    def stats(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        Summarize cache usage.
+
+        Args:
+            reset (bool): Reset the counters after reading them, so the next
+                call reports only the following interval.
+
+        Returns:
+            dict: Cache figures.
+                - size (int): Entries held by the local LRU.
+                - max_entries (int): Local LRU bound.
+                - shared (bool): Whether a shared backend is configured.
+                - hits, shared_hits, misses, evictions (int): Counters.
+                - hit_ratio (float): Share of lookups answered from either
+                  level (0.0 to 1.0).
+        """
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            stats = {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "shared": self.backend is not None,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(
+                    (self.hits + self.shared_hits) / lookups, 4
+                ) if lookups else 0.0,
+            }
+            if reset:
+                self.hits = self.shared_hits = 0
+                self.misses = self.evictions = 0
+        return stats
+
+
+@lru_cache(maxsize=None)
+def get_representation_cache() -> Optional[RepresentationCache]:
+    """
+    Return the process-wide representation cache, or None when disabled.
+    """
+    max_entries = getattr(settings, "REPRESENTATION_CACHE_SIZE", 0)
+    if max_entries <= 0:
+        return None
+
+    alias = getattr(settings, "REPRESENTATION_CACHE_BACKEND", None)
+    return RepresentationCache(
+        max_entries,
+        backend=caches[alias] if alias else None,
+        timeout=getattr(settings, "REPRESENTATION_CACHE_TIMEOUT", None)
+    )
@@ -0,0 +1,132 @@
+"""
+Serializer mixin reusing cached representations of unchanged rows.
+
+The column fields of an instance (every readable field but nested
+serializers) are stored in the representation cache under the instance's
+model, primary key and `cache_version_field` (see
+`api.utils.representation_cache_handler`). Rows whose version is cached skip
+field-by-field serialization; nested serializers are still rendered per row,
+through their own cache when they use this mixin too, so a changed related
+row shows up even though the parent row did not change.
+
+The cache key also holds the serializer class and its field set, so
+`?fields=`/`?exclude=` trimmed serializers get entries of their own. Links
+are added on top by `HATEOASMixin`, which must come first in the bases:
+
+    class StateProvinceSerializer(
+        HATEOASMixin,
+        RepresentationCacheMixin,
+        serializers.ModelSerializer
+    ):
+        ...
+
+Instances without a loaded version column (deferred by `only()`), unsaved
+instances and non-model instances are serialized as usual.
+"""
+
+import hashlib
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from django.db.models import Model
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.serializers import BaseSerializer
+
+from api.utils.representation_cache_handler import get_representation_cache
+
+
+class RepresentationCacheMixin:
+    """
+    Caches the column fields of model serializers.
+
+    Attributes:
+        - cache_version_field (str | None): `auto_now` field versioning the
+        rows; None disables the cache for the serializer.
+    """
+    cache_version_field: Optional[str] = 'modified_date'
+
+    def get_cache_layout(self) -> Tuple[str, FrozenSet[str]]:
+        """
+        Return the serializer's shape hash and its nested field names.
+        """
+        layout = getattr(self, '_cache_layout', None)
+        if layout is None:
+            cls = type(self)
+            columns, nested = [], set()
+            for field in self._readable_fields:
+                if isinstance(field, BaseSerializer):
+                    nested.add(field.field_name)
+                else:
+                    columns.append(f'{field.field_name}={field.source}')
+            signature = f"{cls.__module__}.{cls.__qualname__}:" + ','.join(
+                columns
+            )
+            layout = (
+                hashlib.md5(signature.encode()).hexdigest()[:12],
+                frozenset(nested)
+            )
+            self._cache_layout = layout
+        return layout
+
+    def get_cache_key(self, instance: Any) -> Optional[str]:
+        """
+        Return the cache key of an instance, or None when it cannot be
+        cached.
+        """
+        field = self.cache_version_field
+        if (not field or not isinstance(instance, Model)
+                or instance.pk is None or field not in instance.__dict__):
+            return None
+
+        version = instance.__dict__[field]
+        if version is None:
+            return None
+
+        shape, _ = self.get_cache_layout()
+        return (
+            f'rep:{shape}:{instance._meta.label_lower}:{instance.pk}:'
+            f'{version.isoformat()}'
+        )
+
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """
+        Serve the column fields from the cache, rendering nested
+        serializers.
+        """
+        cache = get_representation_cache()
+        key = self.get_cache_key(instance) if cache is not None else None
+        if key is None:
+            return super().to_representation(instance)
+
+        _, nested = self.get_cache_layout()
+        owner = (instance._meta.label_lower, str(instance.pk))
+        generation = cache.generation(owner)
+        columns = cache.get(key, owner)
+        if columns is None:
+            rep = super().to_representation(instance)
+            # refused when the row was evicted while being serialized
+            cache.set(key, {
+                name: value for name, value in rep.items()
+                if name not in nested
+            }, owner, generation)
+            return rep
+
+        ret = {}
+        for field in self._readable_fields:
+            name = field.field_name
+            if name in columns:
+                ret[name] = columns[name]
+            elif name in nested:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = (
+                    attribute.pk if isinstance(attribute, PKOnlyObject)
+                    else attribute
+                )
+                ret[name] = (
+                    None if check_for_none is None
+                    else field.to_representation(attribute)
+                )
+        return ret
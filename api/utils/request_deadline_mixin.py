@@ -0,0 +1,125 @@
+"""
+Per-request database deadlines for DRF viewsets.
+
+Each request gets a `statement_timeout` on the database alias its viewset
+reads from (or writes to, for unsafe methods). A statement that overruns is
+cancelled by PostgreSQL and `custom_exception_handler` turns the error into a
+504 response, so a slow query can no longer hold a worker and a connection
+indefinitely.
+
+- Unsafe requests run inside a transaction, with the equivalent of
+  `SET LOCAL statement_timeout`. DRF answers exceptions with an error
+  response instead of raising them, so the transaction is marked for
+  rollback whenever the response has an error status (4xx/5xx).
+- Safe requests open no transaction: the timeout is set on the session for
+  the length of the request, then reset.
+
+The deadline comes from the viewset's `request_deadline` (milliseconds),
+either an int or a dict keyed by action (`{'list': 2000}`), falling back to
+`settings.REQUEST_DEADLINE_MS`. A value of 0 or None disables it.
+
+Rows of a streamed list (`?stream=true`) are read after the timeout has been
+reset and are not covered by the deadline.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from django.conf import settings
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import QuerySet
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def set_statement_timeout(
+    alias: str,
+    milliseconds: int,
+    local: bool = True
+) -> None:
+    """
+    Set `statement_timeout` for the current transaction of an alias, or for
+    its session when `local` is False.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('statement_timeout', %s, %s)",
+            [f"{milliseconds}ms", local]
+        )
+
+
+def reset_statement_timeout(alias: str) -> None:
+    """
+    Restore the session's `statement_timeout`; a connection that cannot run
+    the reset is closed rather than handed back with the request's timeout.
+    """
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("RESET statement_timeout")
+    except DatabaseError:
+        connection.close()
+
+
+class RequestDeadlineMixin:
+    """
+    Runs each request in a transaction bounded by a statement timeout.
+
+    Attributes:
+        - request_deadline (int | dict | None): Deadline in milliseconds, or
+        a dict of deadlines keyed by action. None uses
+        `REQUEST_DEADLINE_MS`.
+    """
+    request_deadline: Optional[Union[int, Dict[str, int]]] = None
+
+    def get_request_deadline(self, action: Optional[str]) -> Optional[int]:
+        """
+        Return the deadline, in milliseconds, of an action.
+        """
+        deadline = self.request_deadline
+        if isinstance(deadline, dict):
+            deadline = deadline.get(action)
+        if deadline is None:
+            deadline = getattr(settings, 'REQUEST_DEADLINE_MS', None)
+        return deadline or None
+
+    def dispatch(self, request: Request, *args: Any, **kwargs: Any):
+        """
+        Dispatch the request under its deadline; unsafe requests run in a
+        transaction rolled back on error responses.
+        """
+        action = self.action_map.get(request.method.lower())
+        deadline = self.get_request_deadline(action)
+        if not deadline:
+            return super().dispatch(request, *args, **kwargs)
+
+        model = self.queryset.model
+        if request.method in SAFE_METHODS:
+            self.deadline_alias = alias = router.db_for_read(model)
+            if connections[alias].in_atomic_block:
+                set_statement_timeout(alias, deadline)
+                return super().dispatch(request, *args, **kwargs)
+
+            set_statement_timeout(alias, deadline, local=False)
+            try:
+                return super().dispatch(request, *args, **kwargs)
+            finally:
+                reset_statement_timeout(alias)
+
+        self.deadline_alias = alias = router.db_for_write(model)
+        with transaction.atomic(using=alias):
+            set_statement_timeout(alias, deadline)
+            response: Response = super().dispatch(request, *args, **kwargs)
+            if response.status_code >= 400:
+                transaction.set_rollback(True, using=alias)
+        return response
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Keep the request's queries on the alias holding the deadline.
+        """
+        queryset = super().get_queryset()
+        alias = getattr(self, 'deadline_alias', None)
+        return queryset.using(alias) if alias else queryset
@@ -0,0 +1,194 @@
+"""
+Compiled, read-only serialization of `values()` rows.
+
+`ModelSerializer` resolves every field of every instance through its field
+objects (`get_attribute`, `PKOnlyObject`, per-field exception handling) on
+top of building model instances. For list endpoints whose serializer only
+reads model columns, `RowSerializer` compiles the serializer once into:
+
+- the `values()` paths the representation needs, joins included;
+- one converter per output key, calling the field's own
+  `to_representation` on the raw column value.
+
+Rows are then fetched as dicts and converted without instantiating models.
+The output is identical to the serializer's: same keys in the same order,
+same formatting (Decimal quantizing/coercion, datetime and UUID formats,
+`None` for null values and null nested relations).
+
+Serializers that cannot be compiled (method fields, `source='*'`, properties,
+to-many relations, hyperlinked fields, nested HATEOAS serializers, relations
+to another database server) raise `NotCompilable`; callers fall back to the
+regular serializer.
+
+Example:
+    rows = RowSerializer(SalesTerritorySerializer())
+    data = rows.serialize(rows.values(SalesTerritory.objects.all()))
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from rest_framework import serializers
+from rest_framework.relations import (
+    PrimaryKeyRelatedField,
+    RelatedField,
+    SlugRelatedField
+)
+
+from api.utils.hateoas_mixin import HATEOASMixin
+from api.utils.serializer_query_mixin import is_same_server
+
+
+Row = Dict[str, Any]
+Getter = Callable[[Row], Any]
+
+
+class NotCompilable(Exception):
+    """
+    Raised when a serializer reads more than plain model columns.
+    """
+
+
+def resolve_source(
+    model: Type[Model],
+    field: serializers.Field,
+    prefix: str
+) -> Tuple[str, Any]:
+    """
+    Resolve a field's `source` to a `values()` path and its model field.
+    """
+    current, path, model_field = model, prefix, None
+
+    for position, attr in enumerate(field.source_attrs):
+        if model_field is not None:
+            if not (model_field.is_relation and model_field.concrete
+                    and (model_field.many_to_one or model_field.one_to_one)):
+                raise NotCompilable(f'cannot traverse {path}')
+            current = model_field.related_model
+        try:
+            model_field = current._meta.get_field(attr)
+        except FieldDoesNotExist as exc:
+            raise NotCompilable(f'{attr} is not a model field') from exc
+        path = f'{path}__{attr}' if position else prefix + attr
+
+        if model_field.is_relation:
+            if not model_field.concrete or model_field.many_to_many:
+                raise NotCompilable(f'{path} is not a forward relation')
+            if not is_same_server(current, model_field.related_model):
+                raise NotCompilable(f'{path} is on another database server')
+
+    return path, model_field
+
+
+def column_getter(key: str, convert: Callable[[Any], Any]) -> Getter:
+    """
+    Getter converting a column value, None staying None.
+    """
+    def get(row: Row) -> Any:
+        value = row[key]
+        return None if value is None else convert(value)
+    return get
+
+
+def nested_getter(key: str, convert: Callable[[Row], Row]) -> Getter:
+    """
+    Getter building a nested representation, None for a null relation.
+    """
+    def get(row: Row) -> Any:
+        return None if row[key] is None else convert(row)
+    return get
+
+
+def compile_serializer(
+    serializer: serializers.Serializer,
+    model: Type[Model],
+    prefix: str = ''
+) -> Tuple[List[str], Callable[[Row], Row]]:
+    """
+    Compile a serializer into its `values()` paths and a row converter.
+
+    Raises:
+        NotCompilable: The serializer reads more than model columns.
+    """
+    paths: List[str] = []
+    getters: List[Tuple[str, Getter]] = []
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field.source == '*':
+            raise NotCompilable(f'{name} reads the whole object')
+
+        path, model_field = resolve_source(model, field, prefix)
+
+        if isinstance(field, serializers.BaseSerializer):
+            if (isinstance(field, (serializers.ListSerializer, HATEOASMixin))
+                    or not model_field.is_relation):
+                raise NotCompilable(f'{name} cannot be compiled')
+            nested_paths, convert = compile_serializer(
+                field,
+                model_field.related_model,
+                f'{path}__'
+            )
+            paths.append(path)
+            paths.extend(nested_paths)
+            getters.append((name, nested_getter(path, convert)))
+
+        elif isinstance(field, PrimaryKeyRelatedField):
+            pk_field = field.pk_field
+            paths.append(path)
+            getters.append((name, column_getter(
+                path,
+                pk_field.to_representation if pk_field else (lambda pk: pk)
+            )))
+
+        elif isinstance(field, SlugRelatedField):
+            key = f"{path}__{field.slug_field.replace('.', '__')}"
+            paths.append(key)
+            getters.append((name, column_getter(key, lambda value: value)))
+
+        elif isinstance(field, RelatedField) or model_field.is_relation:
+            raise NotCompilable(f'{name} cannot be compiled')
+
+        else:
+            paths.append(path)
+            getters.append((name, column_getter(
+                path,
+                field.to_representation
+            )))
+
+    def convert(row: Row) -> Row:
+        return {name: get(row) for name, get in getters}
+
+    return paths, convert
+
+
+class RowSerializer:
+    """
+    A model serializer compiled for `values()` rows.
+
+    Attributes:
+        - paths (list): `values()` paths read by the representation.
+    """
+
+    def __init__(self, serializer: serializers.ModelSerializer):
+        self.paths, self.to_representation = compile_serializer(
+            serializer,
+            serializer.Meta.model
+        )
+
+    def values(self, queryset: QuerySet, extra: Iterable[str] = ()):
+        """
+        Return `queryset` as dict rows holding the compiled paths and
+        `extra` (ordering or cursor columns).
+        """
+        paths = list(dict.fromkeys([*self.paths, *extra]))
+        return queryset.prefetch_related(None).values(*paths)
+
+    def serialize(self, rows: Iterable[Row]) -> List[Row]:
+        """
+        Convert rows to their representations.
+        """
+        convert = self.to_representation
+        return [convert(row) for row in rows]
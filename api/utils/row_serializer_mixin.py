@@ -0,0 +1,89 @@
+"""
+Opt-in fast read path for list endpoints.
+
+Viewsets setting `fast_list = True` serve `list()` from `values()` rows
+converted by a `RowSerializer` compiled from their serializer (after any
+`?fields=`/`?exclude=` trimming), instead of model instances walked by the
+serializer. The representation is identical; see
+`api.utils.row_serializer_handler`.
+
+The regular serializer is used when the serializer cannot be compiled, and
+for HATEOAS serializers unless links are turned off (`?links=none`), since
+links are built from instances.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from django.db.models import QuerySet
+
+from api.utils.hateoas_mixin import HATEOASMixin, LINKS_NONE, get_links_mode
+from api.utils.row_serializer_handler import NotCompilable, RowSerializer
+
+
+class RowSerializerMixin:
+    """
+    Serves lists from compiled `values()` rows.
+
+    Attributes:
+        - fast_list (bool): Enable the `values()` read path for `list()`.
+    """
+    fast_list: bool = False
+    _row_serializers: Dict[type, Optional[RowSerializer]] = {}
+
+    def get_row_serializer(self) -> Optional[RowSerializer]:
+        """
+        Return the compiled row serializer of the request, or None when the
+        regular serializer must be used.
+        """
+        if not self.fast_list:
+            return None
+
+        serializer_class = self.get_serializer_class()
+        if (issubclass(serializer_class, HATEOASMixin)
+                and get_links_mode(self.request) != LINKS_NONE):
+            return None
+
+        get_key = getattr(self, 'get_query_plan_key', None)
+        cacheable = get_key is None or get_key() is None
+        if cacheable and serializer_class in self._row_serializers:
+            return self._row_serializers[serializer_class]
+
+        try:
+            rows = RowSerializer(self.get_serializer(context={}))
+        except NotCompilable:
+            rows = None
+
+        if cacheable:
+            self._row_serializers[serializer_class] = rows
+        return rows
+
+    def get_row_values(
+        self,
+        queryset: QuerySet,
+        rows: RowSerializer
+    ) -> QuerySet:
+        """
+        Return `queryset` as dict rows, with the columns the paginator
+        orders and seeks on.
+        """
+        extra: List[str] = [
+            field.lstrip('-') for field in queryset.query.order_by
+            if isinstance(field, str)
+        ]
+        extra.extend(getattr(self, 'keyset_ordering', None) or [])
+        extra.append(getattr(self, 'lookup_field', None) or 'pk')
+        return rows.values(queryset, extra=[
+            field.lstrip('-') for field in extra
+        ])
+
+    def serialize_page(
+        self,
+        page: List[Any],
+        rows: Optional[RowSerializer]
+    ) -> List[Dict[str, Any]]:
+        """
+        Serialize a page of rows or instances.
+        """
+        if rows is not None:
+            return rows.serialize(page)
+        return self.get_serializer(page, many=True).data
@@ -0,0 +1,296 @@
+"""
+Query shaping derived from serializer fields.
+
+Walks a serializer's readable fields and their `source` paths and builds the
+matching queryset plan:
+
+- forward foreign keys read by a nested serializer or a slug/string related
+  field are joined with `select_related`, or fetched with `prefetch_related`
+  when the related model lives on another database server (see
+  `api.db.schema_router`);
+- to-many relations (nested `many=True` serializers, reverse foreign keys,
+  many-to-many) are fetched with `prefetch_related`, as are foreign keys
+  read by a nested `IdentityMapMixin` serializer, so each related row is
+  loaded once;
+- foreign keys to reference tables read by a nested `ReferenceDataMixin`
+  serializer are not loaded at all: the serializer reads the related row
+  from the reference data cache;
+- the columns actually read are kept with `only()`, on the root model and on
+  every joined model. A model read through `source='*'`, a method field or a
+  plain attribute/property keeps all of its columns, since the walk cannot
+  tell what those read.
+
+Adding a nested serializer to a viewset's serializer therefore adds its join
+(or prefetch) too, instead of a query per row.
+
+Example:
+    class SalesTerritoryViewSet(SerializerQueryMixin, ModelViewSet):
+        serializer_class = SalesTerritorySerializer
+
+    # SELECT sales_territories.<read columns> FROM sales_territories ...
+    # SELECT country_regions.* FROM country_regions
+    # WHERE country_region_code IN (<codes of the page>)
+"""
+
+from typing import Any, Iterable, Set, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from rest_framework import serializers
+from rest_framework.relations import RelatedField, SlugRelatedField
+
+from api.db.schema_router import get_model_alias, get_server
+from api.utils.reference_data_handler import is_reference_model
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class QueryPlan:
+    """
+    Relations to load and columns to keep for a serializer.
+
+    Attributes:
+        - select_related (set): Paths joined in the main query.
+        - prefetch_related (set): Paths fetched with a separate query.
+        - only (set): Columns read, as `only()` paths.
+        - unrestricted (set): Path prefixes whose model keeps every column
+        ('' for the root model).
+        - defer (set): Root columns known to be unused, deferred when
+        `only()` cannot be applied.
+        - reference (set): Relation paths served from the reference data
+        cache (see `api.utils.reference_data_handler`).
+    """
+
+    def __init__(self):
+        self.select_related: Set[str] = set()
+        self.prefetch_related: Set[str] = set()
+        self.only: Set[str] = set()
+        self.unrestricted: Set[str] = set()
+        self.defer: Set[str] = set()
+        self.reference: Set[str] = set()
+
+    def get_only(self, extra: Iterable[str] = ()) -> Set[str]:
+        """
+        Return the `only()` paths, or an empty set when the root model must
+        keep every column.
+        """
+        if '' in self.unrestricted:
+            return set()
+
+        paths = self.only | set(extra)
+        return {
+            path for path in paths
+            if not any(path.startswith(p) for p in self.unrestricted)
+        }
+
+    def apply(
+        self,
+        queryset: QuerySet,
+        restrict: bool = True,
+        extra: Iterable[str] = ()
+    ) -> QuerySet:
+        """
+        Apply the plan to a queryset.
+
+        Args:
+            queryset (QuerySet): Queryset of the serializer's model.
+            restrict (bool): Whether to restrict columns with `only()`.
+            extra (Iterable[str]): Columns to keep in addition to the ones
+            the serializer reads (ordering, lookup field, ...).
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(
+                *sorted(self.prefetch_related)
+            )
+        if not restrict:
+            return queryset
+
+        only = self.get_only(extra)
+        if only:
+            queryset = queryset.only(*sorted(only))
+        elif self.defer - set(extra):
+            queryset = queryset.defer(*sorted(self.defer - set(extra)))
+        return queryset
+
+
+def is_same_server(model: Type[Model], related: Type[Model]) -> bool:
+    """
+    Return True when two models can be joined in one statement.
+    """
+    return get_server(get_model_alias(model)) == get_server(
+        get_model_alias(related)
+    )
+
+
+def walk_serializer(
+    serializer: serializers.BaseSerializer,
+    model: Type[Model],
+    prefix: str,
+    plan: QueryPlan
+) -> None:
+    """
+    Add the relations and columns read by a serializer to `plan`.
+    """
+    plan.only.add(prefix + model._meta.pk.name)
+    # the version column keying cached representations
+    version_field = getattr(serializer, 'cache_version_field', None)
+    if version_field:
+        plan.only.add(prefix + version_field)
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == '*':
+            plan.unrestricted.add(prefix)
+            continue
+        walk_field(field, model, prefix, plan)
+
+
+def walk_field(
+    field: serializers.Field,
+    model: Type[Model],
+    prefix: str,
+    plan: QueryPlan
+) -> None:
+    """
+    Follow a field's `source` path through the model's relations.
+    """
+    current, path = model, prefix
+
+    for position, attr in enumerate(field.source_attrs):
+        last = position == len(field.source_attrs) - 1
+        try:
+            model_field = current._meta.get_field(attr)
+        except FieldDoesNotExist:
+            # property, method or annotation
+            plan.unrestricted.add(path)
+            return
+
+        name = path + attr
+        if not model_field.is_relation:
+            plan.only.add(name)
+            return
+
+        if model_field.many_to_many or model_field.one_to_many:
+            plan.prefetch_related.add(name)
+            return
+
+        if model_field.concrete:
+            plan.only.add(name)
+        if (last and isinstance(field, RelatedField)
+                and field.use_pk_only_optimization()):
+            # the foreign key column holds everything the field reads
+            return
+
+        related = model_field.related_model
+        if (last and isinstance(field, serializers.BaseSerializer)
+                and getattr(field, 'reference_data', False)
+                and is_reference_model(related)):
+            # read from the reference data cache through the foreign key
+            plan.reference.add(name)
+            return
+        if not is_same_server(current, related):
+            plan.prefetch_related.add(name)
+            return
+        if (last and isinstance(field, serializers.BaseSerializer)
+                and getattr(field, 'identity_mapped', False)):
+            # loaded once per distinct row (see identity_map_mixin)
+            plan.prefetch_related.add(name)
+            return
+
+        plan.select_related.add(name)
+        current, path = related, f'{name}__'
+
+    if isinstance(field, serializers.BaseSerializer):
+        walk_serializer(field, current, path, plan)
+    elif isinstance(field, SlugRelatedField):
+        plan.only.add(path + current._meta.pk.name)
+        plan.only.add(path + field.slug_field)
+    else:
+        plan.unrestricted.add(path)
+
+
+def build_query_plan(serializer: serializers.ModelSerializer) -> QueryPlan:
+    """
+    Build the query plan of a model serializer.
+    """
+    plan = QueryPlan()
+    walk_serializer(serializer, serializer.Meta.model, '', plan)
+    return plan
+
+
+class SerializerQueryMixin:
+    """
+    Shapes the viewset queryset after its serializer.
+
+    Columns are only restricted for safe methods, so writes always work on
+    fully loaded instances.
+
+    Attributes:
+        - auto_query_plan (bool): Set to False to use the queryset as
+        declared.
+    """
+    auto_query_plan: bool = True
+
+    def get_query_plan_key(self) -> Any:
+        """
+        Part of the plan's cache key besides the serializer class; None for
+        the plain serializer. Plans with another key are not cached.
+        """
+        return None
+
+    def build_query_plan(self) -> QueryPlan:
+        """
+        Build the query plan of the viewset's serializer.
+        """
+        return build_query_plan(self.get_serializer_class()())
+
+    def get_query_plan(self) -> QueryPlan:
+        """
+        Return the query plan of the viewset's serializer, cached per
+        viewset class and serializer class.
+        """
+        if self.get_query_plan_key() is not None:
+            return self.build_query_plan()
+
+        # the viewset class's own dict, never one inherited from a base
+        plans = type(self).__dict__.get('_query_plans')
+        if plans is None:
+            plans = {}
+            setattr(type(self), '_query_plans', plans)
+
+        serializer_class = self.get_serializer_class()
+        plan = plans.get(serializer_class)
+        if plan is None:
+            plan = self.build_query_plan()
+            plans[serializer_class] = plan
+        return plan
+
+    def get_query_plan_extra(self, queryset: QuerySet) -> Set[str]:
+        """
+        Columns the view itself reads: its lookup field and ordering.
+        """
+        extra = {getattr(self, 'lookup_field', None) or 'pk'}
+        extra.update(
+            field.lstrip('-') for field in queryset.query.order_by
+            if isinstance(field, str) and '__' not in field
+        )
+        extra.discard('pk')
+        return extra
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Return the queryset with the serializer's query plan applied.
+        """
+        queryset = super().get_queryset()
+        if not self.auto_query_plan:
+            return queryset
+
+        return self.get_query_plan().apply(
+            queryset,
+            restrict=self.request.method in SAFE_METHODS,
+            extra=self.get_query_plan_extra(queryset)
+        )
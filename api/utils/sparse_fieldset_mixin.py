@@ -0,0 +1,224 @@
+"""
+Sparse fieldsets for DRF viewsets.
+
+Clients trim the representation with `?fields=` (keep only these) and/or
+`?exclude=` (drop these), as comma-separated field names. Nested serializer
+fields are addressed with `__`:
+
+    GET /api/people/state-provinces?fields=name,country_region__name
+    GET /api/people/state-provinces?exclude=rowguid,modified_date
+
+The trimmed serializer also drives the query plan of `SerializerQueryMixin`,
+so only the selected columns (and the joins they need) are read from the
+database: `only()` for the selection, or `defer()` on the excluded columns
+when the serializer reads attributes the plan cannot see. Unknown field names
+are rejected with a 400.
+
+Fieldsets apply to the reads listed in `sparse_actions` (list and retrieve);
+create, update and destroy ignore them and answer with the full
+representation.
+"""
+
+from typing import Any, Dict, Optional, Set, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from api.utils.serializer_query_mixin import QueryPlan, build_query_plan
+
+
+FieldTree = Dict[str, 'FieldTree']
+
+
+def parse_field_tree(value: str) -> FieldTree:
+    """
+    Parse `a,b__c,b__d` into `{'a': {}, 'b': {'c': {}, 'd': {}}}`.
+    """
+    tree: FieldTree = {}
+    for path in value.split(','):
+        path = path.strip()
+        if not path:
+            continue
+        node = tree
+        for name in path.split('__'):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def freeze_field_tree(tree: Optional[FieldTree]) -> Any:
+    """
+    Return a hashable copy of a field tree.
+    """
+    if tree is None:
+        return None
+    return frozenset(
+        (name, freeze_field_tree(sub)) for name, sub in tree.items()
+    )
+
+
+def get_nested(field: serializers.Field) -> Optional[serializers.Serializer]:
+    """
+    Return the serializer behind a nested field, if it is one.
+    """
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    return field if isinstance(field, serializers.Serializer) else None
+
+
+def find_unknown_fields(
+    serializer: serializers.Serializer,
+    tree: FieldTree,
+    prefix: str = ''
+) -> Set[str]:
+    """
+    Return the paths of `tree` that are not readable fields of `serializer`.
+    """
+    unknown = set()
+    for name, sub in tree.items():
+        field = serializer.fields.get(name)
+        if field is None or field.write_only:
+            unknown.add(prefix + name)
+            continue
+        if sub:
+            nested = get_nested(field)
+            if nested is None:
+                unknown.update(f'{prefix}{name}__{key}' for key in sub)
+            else:
+                unknown |= find_unknown_fields(
+                    nested,
+                    sub,
+                    f'{prefix}{name}__'
+                )
+    return unknown
+
+
+def include_fields(
+    serializer: serializers.Serializer,
+    tree: FieldTree
+) -> None:
+    """
+    Drop the readable fields of `serializer` that are not in `tree`.
+    """
+    for name, field in list(serializer.fields.items()):
+        if field.write_only:
+            continue
+        if name not in tree:
+            serializer.fields.pop(name)
+        elif tree[name]:
+            include_fields(get_nested(field), tree[name])
+
+
+def exclude_fields(
+    serializer: serializers.Serializer,
+    tree: FieldTree
+) -> None:
+    """
+    Drop the fields of `serializer` listed in `tree`.
+    """
+    for name, sub in tree.items():
+        if sub:
+            exclude_fields(get_nested(serializer.fields[name]), sub)
+        else:
+            serializer.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """
+    Trims serializers, and the query behind them, to `?fields=`/`?exclude=`.
+
+    Attributes:
+        - fields_query_param (str): Query parameter listing the fields to
+        keep.
+        - exclude_query_param (str): Query parameter listing the fields to
+        drop.
+        - sparse_actions (tuple): Actions honouring the fieldsets.
+    """
+    fields_query_param: str = 'fields'
+    exclude_query_param: str = 'exclude'
+    sparse_actions: Tuple[str, ...] = ('list', 'retrieve')
+
+    def get_sparse_fields(
+        self
+    ) -> Tuple[Optional[FieldTree], Optional[FieldTree]]:
+        """
+        Return the validated `(fields, exclude)` trees of the request.
+
+        Raises:
+            ValidationError: A requested field does not exist.
+        """
+        if hasattr(self, '_sparse_fields'):
+            return self._sparse_fields
+        if getattr(self, 'action', None) not in self.sparse_actions:
+            self._sparse_fields = (None, None)
+            return self._sparse_fields
+
+        serializer = self.get_serializer_class()()
+        trees = []
+        errors = {}
+        for param in (self.fields_query_param, self.exclude_query_param):
+            value = self.request.query_params.get(param)
+            tree = parse_field_tree(value) if value else None
+            unknown = find_unknown_fields(serializer, tree or {})
+            if unknown:
+                errors[param] = [
+                    f'Unknown field(s): {", ".join(sorted(unknown))}.'
+                ]
+            trees.append(tree)
+        if errors:
+            raise ValidationError(errors)
+
+        self._sparse_fields = tuple(trees)
+        return self._sparse_fields
+
+    def trim_serializer(self, serializer: serializers.BaseSerializer):
+        """
+        Apply the requested fieldset to a serializer (or list serializer).
+        """
+        include, exclude = self.get_sparse_fields()
+        target = get_nested(serializer)
+        if target is None:
+            return serializer
+        if include:
+            include_fields(target, include)
+        if exclude:
+            exclude_fields(target, exclude)
+        return serializer
+
+    def get_serializer(self, *args: Any, **kwargs: Any):
+        """
+        Return the serializer trimmed to the requested fieldset.
+        """
+        return self.trim_serializer(super().get_serializer(*args, **kwargs))
+
+    def get_query_plan_key(self) -> Any:
+        """
+        Key the query plan by the requested fieldset.
+        """
+        include, exclude = self.get_sparse_fields()
+        if include is None and exclude is None:
+            return super().get_query_plan_key()
+        return (freeze_field_tree(include), freeze_field_tree(exclude))
+
+    def build_query_plan(self) -> QueryPlan:
+        """
+        Build the query plan of the trimmed serializer; columns of excluded
+        model fields are deferred.
+        """
+        serializer = self.trim_serializer(self.get_serializer_class()())
+        plan = build_query_plan(serializer)
+
+        _, exclude = self.get_sparse_fields()
+        model = serializer.Meta.model
+        declared = self.get_serializer_class()().fields
+        for name, sub in (exclude or {}).items():
+            source = declared[name].source
+            if sub or '.' in source or source in plan.select_related:
+                continue
+            try:
+                model_field = model._meta.get_field(source)
+            except FieldDoesNotExist:
+                continue
+            if model_field.concrete and not model_field.primary_key:
+                plan.defer.add(source)
+        return plan
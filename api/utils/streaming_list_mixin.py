@@ -0,0 +1,116 @@
+"""
+Streaming, constant-memory list responses for DRF viewsets.
+
+When a list is not paginated (`?stream=true`, or a viewset without a
+paginator), the rows are read through a server-side cursor with
+`QuerySet.iterator(chunk_size=...)` and the JSON array is written
+incrementally through `StreamingHttpResponse`. Only one chunk of rows is held
+in memory at a time, whatever the size of the table.
+
+The body has the same keys as the buffered list response, with `count`
+written last since it is only known once every row has been sent:
+
+    {"data": [{...}, {...}], "count": 2}
+"""
+
+from typing import Any, Iterator, Optional
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.serializers import BaseSerializer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from api.utils.logging_handler import log_event
+
+
+class StreamingListMixin:
+    """
+    Adds a streaming branch to `list()` for unpaginated responses.
+
+    Attributes:
+        - stream_query_param (str): Query parameter that turns pagination off
+        and streams the whole list (`?stream=true`).
+        - stream_chunk_size (int): Rows fetched from the cursor, and written to
+        the response, per chunk.
+    """
+    stream_query_param: str = 'stream'
+    stream_chunk_size: int = 2000
+
+    def is_streaming_request(self) -> bool:
+        """
+        Return True when the client asked for a streamed list.
+        """
+        value = self.request.query_params.get(self.stream_query_param, '')
+        return value.lower() in ('1', 'true', 'yes')
+
+    def paginate_queryset(self, queryset: QuerySet) -> Any:
+        """
+        Skip pagination for streamed lists.
+        """
+        if self.is_streaming_request():
+            return None
+        return super().paginate_queryset(queryset)
+
+    def get_streaming_response(
+        self,
+        queryset: QuerySet,
+        serializer: Optional[Any] = None
+    ) -> StreamingHttpResponse:
+        """
+        Build a streaming JSON response for every row of `queryset`, converted
+        by `serializer` (anything with `to_representation`, e.g. a
+        `RowSerializer` for `values()` rows) or the viewset's serializer.
+        """
+        # resolve the database now, while routing context set by middleware
+        # (e.g. replica pinning) is still active
+        queryset = queryset.using(queryset.db)
+
+        # rows are serialized without request context (no links)
+        if serializer is None:
+            serializer = self.get_serializer(context={})
+
+        return StreamingHttpResponse(
+            self.stream_rows(queryset, serializer),
+            content_type='application/json',
+            status=status.HTTP_200_OK
+        )
+
+    def stream_rows(
+        self,
+        queryset: QuerySet,
+        serializer: BaseSerializer
+    ) -> Iterator[bytes]:
+        """
+        Yield the JSON body one chunk of serialized rows at a time.
+        """
+        encoder = JSONEncoder(
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            allow_nan=not api_settings.STRICT_JSON,
+            separators=(',', ':')
+        )
+        count = 0
+        chunk = []
+        separator = ''
+
+        yield b'{"data":['
+        for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+            row = serializer.to_representation(instance)
+            chunk.append(encoder.encode(row))
+            count += 1
+            if len(chunk) == self.stream_chunk_size:
+                yield (separator + ','.join(chunk)).encode()
+                separator, chunk = ',', []
+
+        if chunk:
+            yield (separator + ','.join(chunk)).encode()
+        yield f'],"count":{count}}}'.encode()
+
+        log_event(
+            "INFO",
+            f"{queryset.model.__name__} list streamed",
+            user=str(self.request.user),
+            count=count,
+            status=status.HTTP_200_OK
+        )
@@ -0,0 +1,280 @@
+"""
+Token-bucket throttling shared by every worker.
+
+DRF's stock throttles keep a list of request timestamps per client in
+Django's cache, which is per-process `locmem` here: limits are not enforced
+across workers, and the lists grow with the rate. These throttles keep one
+token bucket per client and scope instead, in the unlogged PostgreSQL table
+`api_throttle_buckets`:
+
+- a bucket holds up to `num_requests` tokens of the scope's rate
+  (`'60/min'`: 60 tokens, refilled at one per second); each request takes
+  one, and is throttled when none is left;
+- refill and take happen in one `INSERT ... ON CONFLICT DO UPDATE`, so
+  concurrent requests of a client, on any worker, never both take the last
+  token;
+- a bucket is one row whatever the rate, and rows that have refilled
+  completely (equivalent to no row) are purged every
+  `THROTTLE_PURGE_INTERVAL` seconds.
+
+The table is unlogged: it skips the WAL, is not replicated, and is emptied
+after a crash, which only resets the buckets. Create it at deployment with
+`manage.py create_throttle_table`; a process that finds it missing creates
+it on first use.
+
+The statements run on the server of `THROTTLE_DATABASE`, over a connection
+of their own per thread, in autocommit mode and kept open, not over the
+alias's Django connection: a bucket row is never locked for the length of a
+request transaction (see `RequestDeadlineMixin`), and a failed statement
+never aborts one.
+
+Rates come from `DEFAULT_THROTTLE_RATES`. Viewsets pick a scope with
+`throttle_scope`, either a string or a dict keyed by action:
+
+    throttle_scope = {'create': 'writes', 'destroy': 'writes'}
+
+Example:
+    allowed, wait = take_token('throttle_user_42', 60, 1.0)
+"""
+
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+import psycopg
+from django.conf import settings
+from django.db import DatabaseError, connections
+from rest_framework.request import Request
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    ScopedRateThrottle,
+    UserRateThrottle
+)
+
+from api.utils.logging_handler import log_event
+
+
+CREATE_TABLE_SQL = """
+    CREATE UNLOGGED TABLE IF NOT EXISTS public.api_throttle_buckets (
+        key text PRIMARY KEY,
+        tokens double precision NOT NULL,
+        allowed boolean NOT NULL,
+        updated_at timestamptz NOT NULL,
+        full_at timestamptz NOT NULL
+    )
+"""
+
+# tokens of the stored bucket once refilled up to now
+REFILLED_SQL = """
+    LEAST(
+        %(capacity)s,
+        bucket.tokens + %(rate)s * GREATEST(
+            0, EXTRACT(EPOCH FROM statement_timestamp() - bucket.updated_at)
+        )
+    )
+"""
+
+TAKE_TOKEN_SQL = f"""
+    INSERT INTO public.api_throttle_buckets AS bucket
+        (key, tokens, allowed, updated_at, full_at)
+    VALUES (
+        %(key)s,
+        %(capacity)s - 1,
+        true,
+        statement_timestamp(),
+        statement_timestamp() + make_interval(secs => 1 / %(rate)s)
+    )
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = {REFILLED_SQL} - CASE
+            WHEN {REFILLED_SQL} >= 1 THEN 1 ELSE 0
+        END,
+        allowed = {REFILLED_SQL} >= 1,
+        updated_at = statement_timestamp(),
+        full_at = statement_timestamp() + make_interval(
+            secs => (%(capacity)s - {REFILLED_SQL}
+                     + CASE WHEN {REFILLED_SQL} >= 1 THEN 1 ELSE 0 END)
+                    / %(rate)s
+        )
+    RETURNING allowed, tokens
+"""
+
+PURGE_SQL = """
+    DELETE FROM public.api_throttle_buckets
+    WHERE full_at < statement_timestamp()
+"""
+
+_state = {"table_ready": False, "purged_at": time.monotonic()}
+_state_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_throttle_alias() -> str:
+    """
+    Return the database alias holding the buckets.
+    """
+    return getattr(settings, "THROTTLE_DATABASE", "default")
+
+
+def get_connection() -> psycopg.Connection:
+    """
+    Return the thread's autocommit connection to the throttle alias's
+    server, opening it on first use.
+    """
+    connection = getattr(_local, "connection", None)
+    if connection is None or connection.closed:
+        params = connections[get_throttle_alias()].get_connection_params()
+        params.pop("cursor_factory", None)
+        params.pop("pool", None)
+        params.pop("context", None)
+        connection = psycopg.connect(**params, autocommit=True)
+        _local.connection = connection
+    return connection
+
+
+def execute(sql: str, params: Optional[dict] = None) -> Optional[tuple]:
+    """
+    Run a statement on the thread's throttle connection and return its
+    first row.
+
+    Raises:
+        DatabaseError: The statement failed; a broken connection is closed
+            and reopened by the next call.
+    """
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone() if cursor.description else None
+    except psycopg.Error as exc:
+        connection = getattr(_local, "connection", None)
+        if connection is not None and connection.broken:
+            connection.close()
+        raise DatabaseError(str(exc)) from exc
+
+
+def create_table() -> None:
+    """
+    Create the bucket table when it does not exist.
+    """
+    execute(CREATE_TABLE_SQL)
+    with _state_lock:
+        _state["table_ready"] = True
+
+
+def prepare() -> None:
+    """
+    Create the bucket table once per process, and purge full buckets every
+    `THROTTLE_PURGE_INTERVAL` seconds.
+    """
+    interval = getattr(settings, "THROTTLE_PURGE_INTERVAL", 300)
+    now = time.monotonic()
+    with _state_lock:
+        create = not _state["table_ready"]
+        purge = now - _state["purged_at"] >= interval
+        if purge:
+            _state["purged_at"] = now
+
+    if create:
+        # marked ready only once created; a failure is retried next time
+        create_table()
+    if purge:
+        execute(PURGE_SQL)
+
+
+def take_token(key: str, capacity: int, rate: float) -> Tuple[bool, float]:
+    """
+    Take a token from a bucket, refilling it first.
+
+    Args:
+        key (str): Bucket key (scope and client).
+        capacity (int): Tokens the bucket holds when full.
+        rate (float): Tokens added per second.
+
+    Returns:
+        tuple: Whether a token was taken, and the seconds until the next one
+        when it was not. Requests are allowed when the database fails.
+    """
+    try:
+        prepare()
+        allowed, tokens = execute(TAKE_TOKEN_SQL, {
+            "key": key,
+            "capacity": float(capacity),
+            "rate": float(rate),
+        })
+    except DatabaseError as exc:
+        log_event("WARNING", "Throttle check failed", key=key, error=str(exc))
+        return True, 0.0
+    return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+
+class TokenBucketMixin:
+    """
+    Replaces the request history of `SimpleRateThrottle` with a shared
+    token bucket.
+    """
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        """
+        Take a token from the client's bucket.
+        """
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, self.wait_seconds = take_token(
+            self.key,
+            self.num_requests,
+            self.num_requests / self.duration
+        )
+        return allowed
+
+    def wait(self) -> Optional[float]:
+        """
+        Return the seconds until the client's next token.
+        """
+        return getattr(self, "wait_seconds", None)
+
+
+class AnonTokenBucketThrottle(TokenBucketMixin, AnonRateThrottle):
+    """
+    Throttles anonymous clients by IP on the `anon` rate.
+    """
+
+
+class UserTokenBucketThrottle(TokenBucketMixin, UserRateThrottle):
+    """
+    Throttles authenticated users (anonymous clients by IP) on the `user`
+    rate.
+    """
+
+
+def get_throttle_scope(view: Any) -> Optional[str]:
+    """
+    Return the throttle scope of a view's current action, if any.
+    """
+    scope = getattr(view, "throttle_scope", None)
+    if isinstance(scope, dict):
+        scope = scope.get(getattr(view, "action", None))
+    return scope
+
+
+class ScopedTokenBucketThrottle(TokenBucketMixin, ScopedRateThrottle):
+    """
+    Throttles clients on the rate of the viewset's `throttle_scope`, per
+    viewset or per action; views without one are not throttled.
+    """
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        """
+        Resolve the scope of the action, then take a token from its bucket.
+        """
+        self.scope = get_throttle_scope(view)
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
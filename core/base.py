@@ -54,14 +54,31 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # runs BROWSER_MIDDLEWARE, skipped by JSON calls under API_PATH_PREFIX
+    "api.middleware.path_dispatch_middleware.PathDispatchMiddleware",
+    # project middleware
+    "api.middleware.db_pool_middleware.DatabasePoolMiddleware",
+    "api.middleware.replica_pin_middleware.ReplicaPinMiddleware",
+    "api.middleware.query_budget_middleware.QueryBudgetMiddleware",
+]
+
+# Browser-only middleware: run for the admin, the browsable API and other
+# browser requests, skipped by JSON API calls under API_PATH_PREFIX
+BROWSER_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+API_PATH_PREFIX = config('API_PATH_PREFIX', default='/api/')
+
+# the admin checks look for the session, auth and messages middleware in
+# MIDDLEWARE; they run from BROWSER_MIDDLEWARE for every admin request
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 ROOT_URLCONF = "core.urls"
 
 APPEND_SLASH = False
@@ -128,6 +145,181 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Database connection pool (psycopg3)
+# https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
+#
+# When enabled, each worker keeps a pool of open connections instead of
+# paying for a TCP connection, authentication and the `search_path` setup on
+# every request. `CONN_MAX_AGE` must stay 0 while pooling is enabled.
+
+DB_POOL_ENABLED = config('DB_POOL_ENABLED', default=False, cast=bool)
+
+DB_POOL_OPTIONS = {
+    'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+    'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+    # seconds an idle connection is kept before it is closed
+    'max_idle': config('DB_POOL_MAX_IDLE', default=300, cast=float),
+    # seconds a request waits for a free connection before failing
+    'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+}
+
+# pool stats are logged every DB_POOL_STATS_INTERVAL seconds; a warning is
+# logged whenever the share of checked-out connections reaches
+# DB_POOL_SATURATION_WARNING
+DB_POOL_STATS_INTERVAL = config('DB_POOL_STATS_INTERVAL', default=60,
+                                cast=int)
+DB_POOL_SATURATION_WARNING = config('DB_POOL_SATURATION_WARNING',
+                                    default=0.8, cast=float)
+
+# Server-side prepared statements (psycopg3)
+# https://www.psycopg.org/psycopg3/docs/advanced/prepare.html
+#
+# With server-side binding, psycopg prepares a statement once it has run
+# DB_PREPARE_THRESHOLD times on a connection, and reuses the parsed, planned
+# statement afterwards (e.g. the `WHERE <pk> = %s` lookups of get_object()).
+# Prepared statements live as long as the connection, so enable this together
+# with DB_POOL_ENABLED. Keep it off behind a transaction-mode pgbouncer.
+
+DB_PREPARED_STATEMENTS = config('DB_PREPARED_STATEMENTS', default=False,
+                                cast=bool)
+DB_PREPARE_THRESHOLD = config('DB_PREPARE_THRESHOLD', default=5, cast=int)
+
+DB_PREPARED_OPTIONS = {
+    'server_side_binding': True,
+    'prepare_threshold': DB_PREPARE_THRESHOLD,
+} if DB_PREPARED_STATEMENTS else {}
+
+# Per-domain databases
+# https://docs.djangoproject.com/en/5.2/topics/db/multi-db/#database-routers
+#
+# DATABASE_APPS_MAPPING maps an app label (`people`, `production`, `sales`) to
+# the alias holding its schema; unmapped apps use `default`. Queries that join
+# tables living on different database servers raise CrossDatabaseJoinError.
+
+DATABASE_APPS_MAPPING = {}
+
+# Read replicas
+#
+# Reads of safe (GET/HEAD/OPTIONS) requests are spread across the replica
+# aliases listed for each primary alias in DATABASE_REPLICAS, one replica per
+# request; writes always go to the primary. A replica whose replay lag exceeds
+# DB_REPLICA_MAX_LAG seconds is skipped, and a client that has just written
+# keeps reading from the primary for DB_REPLICA_PIN_SECONDS, through a signed
+# DB_REPLICA_PIN_COOKIE cookie.
+
+DATABASE_ROUTERS = [
+    'api.db.replica_router.ReplicaRouter',
+    'api.db.schema_router.SchemaRouter',
+]
+
+DATABASE_REPLICAS = {}
+
+DB_REPLICA_MAX_LAG = config('DB_REPLICA_MAX_LAG', default=5, cast=float)
+DB_REPLICA_LAG_CHECK_INTERVAL = config('DB_REPLICA_LAG_CHECK_INTERVAL',
+                                       default=10, cast=float)
+DB_REPLICA_PIN_SECONDS = config('DB_REPLICA_PIN_SECONDS', default=10,
+                                cast=int)
+DB_REPLICA_PIN_COOKIE = config('DB_REPLICA_PIN_COOKIE', default='replica_pin')
+
+# Pagination: list counts are estimated from PostgreSQL statistics once a
+# table holds more than PAGINATION_COUNT_ESTIMATE_THRESHOLD rows
+# (`?exact_count=true` forces an exact COUNT(*)); keyset-paginated lists only
+# count on `?count=exact` or `?count=estimate`
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = config(
+    'PAGINATION_COUNT_ESTIMATE_THRESHOLD', default=100000, cast=int
+)
+
+# Query budgets: requests running more SQL statements than their viewset's
+# `query_budget` (or QUERY_BUDGET_DEFAULT), or repeating one statement shape
+# QUERY_REPEAT_THRESHOLD times or more, are logged as likely N+1 patterns
+QUERY_BUDGET_DEFAULT = config('QUERY_BUDGET_DEFAULT', default=50, cast=int)
+QUERY_REPEAT_THRESHOLD = config('QUERY_REPEAT_THRESHOLD', default=5, cast=int)
+
+# Request deadlines: viewset requests run with a statement_timeout of the
+# viewset's `request_deadline` (or REQUEST_DEADLINE_MS), writes in a
+# transaction rolled back on error responses; cancelled statements are
+# answered with a 504 (0 disables the deadline)
+REQUEST_DEADLINE_MS = config('REQUEST_DEADLINE_MS', default=5000, cast=int)
+
+# HATEOAS links: default verbosity of `_links` when the client sends neither
+# `?links=` nor `X-Links` (none | compact | full), for list rows and for
+# other actions
+HATEOAS_LIST_LINKS_DEFAULT = config('HATEOAS_LIST_LINKS_DEFAULT',
+                                    default='none')
+HATEOAS_LINKS_DEFAULT = config('HATEOAS_LINKS_DEFAULT', default='full')
+
+# Representation cache: serialized rows are reused while their
+# (model, pk, modified_date) is unchanged; REPRESENTATION_CACHE_SIZE bounds
+# the per-process LRU (0 disables it), REPRESENTATION_CACHE_BACKEND names an
+# optional shared CACHES alias
+REPRESENTATION_CACHE_SIZE = config(
+    'REPRESENTATION_CACHE_SIZE', default=10000, cast=int
+)
+REPRESENTATION_CACHE_BACKEND = config(
+    'REPRESENTATION_CACHE_BACKEND', default=None
+)
+REPRESENTATION_CACHE_TIMEOUT = config(
+    'REPRESENTATION_CACHE_TIMEOUT', default=3600, cast=int
+)
+
+# Reference data: small lookup tables loaded once per process and served
+# from memory for lookups, foreign key validation and nested serializers;
+# tables over REFERENCE_DATA_MAX_ROWS rows are left to the database
+REFERENCE_DATA_MODELS = [
+    "api.people.models.address_type_model.AddressType",
+    "api.people.models.country_region_model.CountryRegion",
+    "api.people.models.phone_number_type_model.PhoneNumberType",
+    "api.production.models.unit_measures_model.UnitMeasure",
+    "api.sales.models.currency_model.Currency",
+    "api.sales.models.sales_reason_model.SalesReason",
+    "api.sales.models.ship_method_model.ShipMethod",
+]
+REFERENCE_DATA_MAX_ROWS = config(
+    'REFERENCE_DATA_MAX_ROWS', default=10000, cast=int
+)
+
+# Invalidation bus: with INVALIDATION_BUS_ENABLED, every worker listens on
+# INVALIDATION_BUS_CHANNEL for the notifications sent by the triggers of
+# `manage.py install_invalidation_triggers`, and evicts the cached entries of
+# the rows written (e.g. by the ETL pipeline). A lost connection is retried
+# after INVALIDATION_BUS_RECONNECT_DELAY seconds, doubling up to
+# INVALIDATION_BUS_RECONNECT_MAX_DELAY, and every cache is flushed on
+# reconnect; an idle connection is probed every
+# INVALIDATION_BUS_HEALTH_CHECK_INTERVAL seconds
+INVALIDATION_BUS_ENABLED = config(
+    'INVALIDATION_BUS_ENABLED', default=False, cast=bool
+)
+INVALIDATION_BUS_CHANNEL = config(
+    'INVALIDATION_BUS_CHANNEL', default='api_invalidation'
+)
+INVALIDATION_BUS_RECONNECT_DELAY = config(
+    'INVALIDATION_BUS_RECONNECT_DELAY', default=1, cast=float
+)
+INVALIDATION_BUS_RECONNECT_MAX_DELAY = config(
+    'INVALIDATION_BUS_RECONNECT_MAX_DELAY', default=60, cast=float
+)
+INVALIDATION_BUS_HEALTH_CHECK_INTERVAL = config(
+    'INVALIDATION_BUS_HEALTH_CHECK_INTERVAL', default=30, cast=float
+)
+
+# OpenAPI schema: built once per worker and served from memory (gzip + ETag);
+# set OPENAPI_SCHEMA_FILE to load the file written at build time by
+# `manage.py spectacular --format openapi-json --file <path>` instead of
+# generating the schema at startup
+OPENAPI_SCHEMA_FILE = config('OPENAPI_SCHEMA_FILE', default='')
+
+# Throttling: token buckets shared by every worker, kept in an unlogged
+# PostgreSQL table (`manage.py create_throttle_table`) on the server of the
+# THROTTLE_DATABASE alias, updated over a connection of their own in
+# autocommit mode, outside any request transaction (rates in
+# REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']; viewsets add their own with
+# `throttle_scope`); fully refilled buckets are purged every
+# THROTTLE_PURGE_INTERVAL seconds
+THROTTLE_DATABASE = config('THROTTLE_DATABASE', default='default')
+THROTTLE_PURGE_INTERVAL = config(
+    'THROTTLE_PURGE_INTERVAL', default=300, cast=int
+)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -149,15 +341,26 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAdminUser',
     ),
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer', 
+        'api.utils.orjson_renderer.ORJSONRenderer',
+        'api.utils.binary_renderer.MessagePackRenderer',
+        'api.utils.binary_renderer.CBORRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.utils.orjson_renderer.ORJSONParser',
+        'api.utils.binary_renderer.MessagePackParser',
+        'api.utils.binary_renderer.CBORParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_PAGINATION_CLASS':
-        'rest_framework.pagination.PageNumberPagination',
+        'api.utils.estimated_count_pagination.'
+        'EstimatedCountPageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'api.utils.throttle_handler.AnonTokenBucketThrottle',
+        'api.utils.throttle_handler.UserTokenBucketThrottle',
+        'api.utils.throttle_handler.ScopedTokenBucketThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '60/min',
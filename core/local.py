@@ -1,7 +1,7 @@
 """
 tba
 """
-from decouple import config
+from decouple import config, Csv
 from .base import *  # pylint: disable=wildcard-import, unused-wildcard-import
 
 
@@ -10,19 +10,21 @@ from .base import *  # pylint: disable=wildcard-import, unused-wildcard-import
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'api.db.backends.postgresql',
         'NAME': config('DB_NAME'),
         'USER': config('DB_USERNAME'),
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOSTNAME'),
         'PORT': config('DB_PORT'),
         "OPTIONS": {
-            "options": "-c search_path=admin,people,production,sales,public"
+            "options": "-c search_path=admin,people,production,sales,public",
+            "pool": DB_POOL_OPTIONS if DB_POOL_ENABLED else False,
+            **DB_PREPARED_OPTIONS
         },
         'ATOMIC_REQUESTS': False,
         'AUTOCOMMIT': True,
         'CONN_MAX_AGE': 0,
-        'CONN_HEALTH_CHECKS': False,
+        'CONN_HEALTH_CHECKS': True,
         'TIME_ZONE': None,
         'TEST': {
           'CHARSET': None,
@@ -34,6 +36,44 @@ DATABASES = {
     }
 }
 
+# Per-domain databases: an app gets its own alias when DB_<DOMAIN>_HOSTNAME
+# is set (e.g. DB_SALES_HOSTNAME=sales.internal), with the schema of the domain
+# first on its search_path
+
+for domain in ('people', 'production', 'sales'):
+    hostname = config(f'DB_{domain.upper()}_HOSTNAME', default='')
+    if not hostname:
+        continue
+
+    prefix = f'DB_{domain.upper()}'
+    DATABASES[domain] = {
+        **DATABASES['default'],
+        'NAME': config(f'{prefix}_NAME', default=config('DB_NAME')),
+        'HOST': hostname,
+        'PORT': config(f'{prefix}_PORT', default=config('DB_PORT')),
+        "OPTIONS": {
+            **DATABASES['default']['OPTIONS'],
+            "options": f"-c search_path={domain},public"
+        },
+        'TEST': {**DATABASES['default']['TEST'], 'MIRROR': 'default'}
+    }
+    DATABASE_APPS_MAPPING[domain] = domain
+
+# Read replicas of the primary: one alias per host in DB_REPLICA_HOSTNAMES,
+# sharing the primary's credentials and options
+# (e.g. DB_REPLICA_HOSTNAMES=replica-1.internal,replica-2.internal)
+
+for index, hostname in enumerate(
+    config('DB_REPLICA_HOSTNAMES', default='', cast=Csv()),
+    start=1
+):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': hostname,
+        'TEST': {**DATABASES['default']['TEST'], 'MIRROR': 'default'}
+    }
+    DATABASE_REPLICAS.setdefault('default', []).append(f'replica_{index}')
+
 
 def get_db_url():
     """
@@ -11,19 +11,21 @@ from .base import *
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'api.db.backends.postgresql',
         'NAME': config('TEST_DB_NAME'),
         'USER': config('TEST_DB_USERNAME'),
         'PASSWORD': config('TEST_DB_PASSWORD'),
         'HOST': config('TEST_DB_HOSTNAME'),
         'PORT': config('TEST_DB_PORT'),
         "OPTIONS": {
-            "options": "-c search_path=admin,people,production,sales,public"
+            "options": "-c search_path=admin,people,production,sales,public",
+            "pool": DB_POOL_OPTIONS if DB_POOL_ENABLED else False,
+            **DB_PREPARED_OPTIONS
         },
         'ATOMIC_REQUESTS': False,
         'AUTOCOMMIT': True,
         'CONN_MAX_AGE': 0,
-        'CONN_HEALTH_CHECKS': False,
+        'CONN_HEALTH_CHECKS': True,
         'TIME_ZONE': None,
         'TEST': {
           'CHARSET': None,
@@ -35,6 +37,15 @@ DATABASES = {
     }
 }
 
+# Per-domain aliases, mirroring `default`: the test database holds every
+# schema. Tests enable the routing with DATABASE_APPS_MAPPING when they need it.
+
+for domain in ('people', 'production', 'sales'):
+    DATABASES[domain] = {
+        **DATABASES['default'],
+        'TEST': {**DATABASES['default']['TEST'], 'MIRROR': 'default'}
+    }
+
 
 def get_db_url():
     """
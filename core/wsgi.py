@@ -15,3 +15,13 @@ from decouple import config
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", config("APP_ENV"))
 
 application = get_wsgi_application()
+
+# imported once get_*_application() has loaded the app registry
+# pylint: disable=wrong-import-position
+from api.config.openapi_schema import preload_schema
+from api.utils.invalidation_bus_handler import (
+    start_invalidation_listeners
+)
+
+start_invalidation_listeners()
+preload_schema()
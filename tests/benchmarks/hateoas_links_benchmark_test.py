@@ -0,0 +1,110 @@
+"""
+Microbenchmark of HATEOAS link building: per-row cost of the ten URLs
+`get_links` builds, with `reverse()` and with the precompiled templates of
+`LinkBuilder`.
+
+Not part of the default test paths; run with:
+
+    pytest tests/benchmarks/hateoas_links_benchmark_test.py -s
+"""
+
+import timeit
+
+import pytest
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
+
+from api.utils.link_builder import get_link_builder
+
+
+DETAIL = "sales-territories-detail"
+LIST = "sales-territories-list"
+ROWS = 1000
+REPEAT = 5
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def links_with_reverse(request, pk):
+    """
+    The URLs of one row: next, previous, self and update, partial_update,
+    destroy (detail); list, create, options and head (list).
+    """
+    return [
+        *(reverse(DETAIL, args=[pk + offset], request=request)
+          for offset in (1, -1, 0, 0, 0, 0)),
+        *(reverse(LIST, request=request) for _ in range(4)),
+    ]
+
+
+def links_with_templates(request, pk):
+    """
+    The same URLs, built from precompiled templates.
+    """
+    links = get_link_builder(request)
+    return [
+        *(links.url(DETAIL, pk + offset) for offset in (1, -1, 0, 0, 0, 0)),
+        *(links.url(LIST) for _ in range(4)),
+    ]
+
+
+def per_row(build, request) -> float:
+    """
+    Best per-row time, in seconds, of building the links of ROWS rows.
+    """
+    def page():
+        for pk in range(1, ROWS + 1):
+            build(request, pk)
+
+    return min(timeit.repeat(page, number=1, repeat=REPEAT)) / ROWS
+
+
+class TestHATEOASLinkBenchmark:
+    """
+    tba
+    """
+
+    @pytest.mark.parametrize("secure", [False, True])
+    def test_links_identical(self, secure):
+        """
+        Templates produce byte-identical URLs to `reverse()`.
+        """
+        request = APIRequestFactory().get(
+            "/api/sales/sales-territories",
+            secure=secure
+        )
+        for pk in (1, 42, 10**12):
+            assert links_with_templates(request, pk) == links_with_reverse(
+                request, pk
+            )
+
+    def test_links_format_override(self):
+        """
+        `?format=` is carried into links exactly as `reverse()` does.
+        """
+        request = APIRequestFactory().get(
+            "/api/sales/sales-territories",
+            {"format": "json"}
+        )
+        links = links_with_templates(request, 7)
+
+        assert links == links_with_reverse(request, 7)
+        assert all(url.endswith("?format=json") for url in links)
+        assert links[2].startswith("http://testserver/")
+        assert "/7" in links[2]
+
+    def test_links_per_row_cost(self):
+        """
+        Per-row cost before (`reverse()`) and after (templates); timings
+        are printed, not asserted.
+        """
+        request = APIRequestFactory().get("/api/sales/sales-territories")
+        before = per_row(links_with_reverse, request)
+        after = per_row(links_with_templates, request)
+
+        print(
+            f"\nHATEOAS links per row ({ROWS} rows, best of {REPEAT}): "
+            f"reverse() {before * 1e6:.1f} us, "
+            f"templates {after * 1e6:.1f} us "
+            f"({before / after:.1f}x)"
+        )
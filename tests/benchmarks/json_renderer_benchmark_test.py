@@ -0,0 +1,140 @@
+"""
+Benchmark of the JSON renderers on a 10k-row sales territory list: DRF's
+`JSONRenderer` against `ORJSONRenderer`, plus byte-for-byte parity checks.
+
+Not part of the default test paths; run with:
+
+    pytest tests/benchmarks/json_renderer_benchmark_test.py -s
+"""
+
+import datetime
+import io
+import timeit
+import uuid
+from decimal import Decimal
+
+import pytest
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.utils.orjson_renderer import ORJSONParser, ORJSONRenderer
+
+
+ROWS = 10_000
+REPEAT = 5
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def serialized_row(pk: int) -> dict:
+    """
+    A sales territory as `SalesTerritorySerializer` renders it.
+    """
+    return {
+        "sales_territory_id": pk,
+        "name": f"Territory {pk} – Nordeste",
+        "region": "Europe",
+        "sales_ytd": f"{pk * 1234.5678:.4f}",
+        "sales_last_year": f"{pk * 987.6543:.4f}",
+        "cost_ytd": "0.0000",
+        "cost_last_year": f"{pk * 12.34:.4f}",
+        "country_region_detail": {
+            "country_region_code": "DE",
+            "name": "Germany",
+            "modified_date": "2024-05-01T10:20:30.123456Z",
+        },
+    }
+
+
+def raw_row(pk: int) -> dict:
+    """
+    The same row with unconverted Python values.
+    """
+    return {
+        "sales_territory_id": pk,
+        "sales_ytd": Decimal(pk) / 7,
+        "rowguid": uuid.uuid5(uuid.NAMESPACE_OID, str(pk)),
+        "modified_date": datetime.datetime(
+            2024, 5, 1, 10, 20, 30, pk % 1_000_000,
+            tzinfo=datetime.timezone.utc
+        ),
+        "day": datetime.date(2024, 5, 1),
+        "line": "sep arated",
+    }
+
+
+def page(build) -> dict:
+    """
+    A list response body holding ROWS rows.
+    """
+    return {
+        "count": ROWS,
+        "count_exact": True,
+        "next": None,
+        "previous": None,
+        "results": [build(pk) for pk in range(1, ROWS + 1)],
+    }
+
+
+class TestJSONRendererBenchmark:
+    """
+    tba
+    """
+
+    @pytest.mark.parametrize("build", [serialized_row, raw_row])
+    def test_render_identical(self, build):
+        """
+        Both renderers produce the same bytes.
+        """
+        data = page(build)
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    @pytest.mark.parametrize("value", [
+        float("nan"),
+        float("inf"),
+        float("-inf"),
+        Decimal("NaN"),
+    ])
+    def test_render_non_finite(self, value):
+        """
+        Non-finite numbers are refused as `STRICT_JSON` does, not written as
+        `null`; real nulls still render.
+        """
+        data = {"results": [{"id": 1, "ratio": value, "note": None}]}
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            with pytest.raises(ValueError):
+                renderer.render(data)
+
+        data["results"][0]["ratio"] = 0.5
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_parse_identical(self):
+        """
+        Both parsers read back the same data.
+        """
+        body = JSONRenderer().render(page(serialized_row))
+        parsed = ORJSONParser().parse(io.BytesIO(body))
+        assert parsed == JSONParser().parse(io.BytesIO(body))
+
+    def test_render_cost(self):
+        """
+        Render time of a 10k-row page, before and after; timings are
+        printed, not asserted.
+        """
+        data = page(serialized_row)
+        stock, fast = JSONRenderer(), ORJSONRenderer()
+
+        before = min(timeit.repeat(
+            lambda: stock.render(data), number=1, repeat=REPEAT
+        ))
+        after = min(timeit.repeat(
+            lambda: fast.render(data), number=1, repeat=REPEAT
+        ))
+
+        print(
+            f"\nJSON render of {ROWS} rows (best of {REPEAT}): "
+            f"JSONRenderer {before * 1000:.1f} ms, "
+            f"ORJSONRenderer {after * 1000:.1f} ms "
+            f"({before / after:.1f}x)"
+        )
+
@@ -0,0 +1,117 @@
+"""
+Benchmark of the per-request middleware overhead of `/api/` JSON calls:
+the full Django middleware stack against the lean chain taken through
+`PathDispatchMiddleware`, plus checks of which requests take which chain.
+
+The view is a trivial one, so the timings are the middleware cost alone.
+
+Not part of the default test paths; run with:
+
+    pytest tests/benchmarks/middleware_benchmark_test.py -s
+"""
+
+import json
+import timeit
+
+import pytest
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.http import HttpRequest, JsonResponse
+from django.test import RequestFactory
+from django.urls import path
+
+
+REQUESTS = 5_000
+REPEAT = 5
+
+DISPATCHER = "api.middleware.path_dispatch_middleware.PathDispatchMiddleware"
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.urls(__name__)]
+
+
+def ping(request: HttpRequest) -> JsonResponse:
+    """
+    A view doing no work.
+    """
+    return JsonResponse({"session": hasattr(request, "session")})
+
+
+urlpatterns = [
+    path("api/ping", ping),
+    path("admin/ping", ping),
+]
+
+
+def full_middleware() -> list:
+    """
+    `MIDDLEWARE` with the browser middleware listed directly, as before.
+    """
+    position = settings.MIDDLEWARE.index(DISPATCHER)
+    return [
+        *settings.MIDDLEWARE[:position],
+        *settings.BROWSER_MIDDLEWARE,
+        *settings.MIDDLEWARE[position + 1:],
+    ]
+
+
+@pytest.fixture
+def handler_for(settings):  # pylint: disable=redefined-outer-name
+    """
+    Build a request handler running the given middleware list.
+    """
+    def build(middleware: list) -> BaseHandler:
+        settings.MIDDLEWARE = middleware
+        handler = BaseHandler()
+        handler.load_middleware()
+        return handler
+    return build
+
+
+class TestMiddlewareBenchmark:
+    """
+    tba
+    """
+    # pylint: disable=redefined-outer-name
+
+    @pytest.mark.parametrize("url, headers, lean", [
+        ("/api/ping", {}, True),
+        ("/api/ping", {"HTTP_ACCEPT": "text/html"}, False),
+        ("/api/ping?format=api", {}, False),
+        ("/api/ping", {"HTTP_COOKIE": "sessionid=abc"}, False),
+        ("/admin/ping", {}, False),
+    ])
+    def test_chain_selection(self, handler_for, url, headers, lean):
+        """
+        Only non-browser `/api/` requests skip the browser middleware.
+        """
+        handler = handler_for(settings.MIDDLEWARE)
+        response = handler.get_response(RequestFactory().get(url, **headers))
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"session": not lean}
+        assert response.has_header("X-Frame-Options") is not lean
+
+    def test_middleware_cost(self, handler_for):
+        """
+        Per-request middleware time of an `/api/` call, before and after;
+        timings are printed, not asserted.
+        """
+        factory = RequestFactory()
+        full = handler_for(full_middleware())
+        lean = handler_for(settings.MIDDLEWARE)
+
+        def run(handler: BaseHandler) -> float:
+            return min(timeit.repeat(
+                lambda: handler.get_response(factory.get("/api/ping")),
+                number=REQUESTS,
+                repeat=REPEAT
+            )) / REQUESTS
+
+        before, after = run(full), run(lean)
+
+        print(
+            f"\n/api/ request through the middleware (best of {REPEAT}, "
+            f"{REQUESTS} requests): full stack {before * 1e6:.1f} us, "
+            f"lean chain {after * 1e6:.1f} us "
+            f"({(before - after) * 1e6:.1f} us saved per request)"
+        )
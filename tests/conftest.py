@@ -96,3 +96,6 @@ def pytest_configure(  # pylint: disable=redefined-outer-name
     config.addinivalue_line("markers", "regression: tests after code changes "
                             "to ensure that existing functionality remains "
                             "and no new defects have been introduced")
+    config.addinivalue_line("markers", "benchmark: tests timing hot paths "
+                            "before and after an optimization, printing the "
+                            "figures they measure")
@@ -0,0 +1,102 @@
+"""
+Tests for the prepared statement statistics and the database-stats endpoint.
+"""
+
+import uuid
+
+import psycopg
+import pytest
+from django.contrib.auth.models import User
+from django.db import connections
+from rest_framework.reverse import reverse
+from decouple import config
+
+from api.utils.prepared_statement_handler import (
+    get_prepared_statement_stats
+)
+
+
+DB_ALIAS = f"{config('TEST_DB_PROFILE')}"
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=[f"{DB_ALIAS}"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+
+class TestDatabaseStatsEndpoints:
+    """
+    Tests for `get_prepared_statement_stats` and `DatabaseStatsViewSet`.
+    """
+
+    def test_prepared_statement_stats(self):
+        """
+        Test the figures of a statement prepared by psycopg.
+
+        Ensures:
+        - The statement is listed with its executions.
+        - `generic_plan_rate` is `generic_plans / executions`.
+        - The totals add up the statements.
+        """
+        connection = connections[DB_ALIAS]
+        connection.ensure_connection()
+        threshold = connection.connection.prepare_threshold
+        sql = "SELECT %s::int + 0 AS prepared_stats_test"
+        # prepare on a server-side binding cursor, whatever
+        # DB_PREPARED_STATEMENTS says
+        connection.connection.prepare_threshold = 0
+        try:
+            with psycopg.Cursor(connection.connection) as cursor:
+                for value in range(6):
+                    cursor.execute(sql, [value], prepare=True)
+            stats = get_prepared_statement_stats(DB_ALIAS)
+        finally:
+            connection.connection.prepare_threshold = threshold
+
+        statement = next(
+            row for row in stats["statements"]
+            if "prepared_stats_test" in row["statement"]
+        )
+        totals = stats["totals"]
+
+        assert statement["executions"] == 6
+        assert statement["generic_plan_rate"] == round(
+            statement["generic_plans"] / statement["executions"], 3
+        )
+        assert totals["prepared"] == len(stats["statements"])
+        assert totals["executions"] == (
+            totals["generic_plans"] + totals["custom_plans"]
+        )
+
+    def test_database_stats_list(self, api_client, auth_client):
+        """
+        Test the admin-only database-stats endpoint.
+
+        Ensures:
+        - Non-admin users are refused.
+        - Admin users get every section of the report.
+        """
+        url = reverse("database-stats-list")
+
+        response = auth_client.get(url, HTTP_ACCEPT='application/json')
+        assert response.status_code == 403
+
+        admin = User.objects.create_user(
+            username=f"database_stats_admin_{uuid.uuid4().hex}",
+            password="showgirl",
+            is_staff=True
+        )
+        api_client.force_authenticate(user=admin)
+        response = api_client.get(url, HTTP_ACCEPT='application/json')
+
+        assert response.status_code == 200
+        assert set(response.data) == {
+            'pool',
+            'prepared_statements',
+            'representation_cache',
+            'reference_data',
+            'invalidation_bus',
+        }
+        assert response.data['prepared_statements']['alias'] == 'default'
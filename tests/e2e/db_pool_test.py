@@ -0,0 +1,131 @@
+"""
+Tests for the connection pool statistics and their reporting middleware.
+"""
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from api.middleware import db_pool_middleware
+from api.middleware.db_pool_middleware import DatabasePoolMiddleware
+from api.utils import db_pool_handler
+from api.utils.db_pool_handler import get_pool_stats
+
+
+pytestmark = [pytest.mark.e2e]
+
+
+class FakePool:
+    """
+    Stand-in for a psycopg3 `ConnectionPool`, with fixed counters.
+    """
+
+    def __init__(self, **stats):
+        self.stats = stats
+        self.popped = False
+
+    def get_stats(self):
+        """Return the counters."""
+        return dict(self.stats)
+
+    def pop_stats(self):
+        """Return the counters and reset them."""
+        self.popped = True
+        return dict(self.stats)
+
+
+SATURATED = {
+    "pool_size": 10,
+    "pool_max": 10,
+    "pool_available": 1,
+    "requests_waiting": 2,
+    "requests_num": 50,
+    "requests_queued": 4,
+    "requests_wait_ms": 100,
+    "requests_errors": 0,
+}
+
+
+class TestDatabasePool:
+    """
+    Tests for `get_pool_stats` and `DatabasePoolMiddleware`.
+    """
+
+    def test_pool_stats_disabled(self, monkeypatch):
+        """
+        Without a pool, there are no stats.
+        """
+        monkeypatch.setattr(db_pool_handler, "get_pool", lambda alias: None)
+
+        assert get_pool_stats("default") is None
+
+    def test_pool_stats_figures(self, monkeypatch):
+        """
+        Test the figures derived from the pool counters.
+
+        Ensures:
+        - Connections in use and saturation come from size and available.
+        - The average wait is over the queued requests only.
+        - `reset=True` pops the counters.
+        """
+        pool = FakePool(**SATURATED)
+        monkeypatch.setattr(db_pool_handler, "get_pool", lambda alias: pool)
+
+        stats = get_pool_stats("default", reset=True)
+
+        assert stats["in_use"] == 9
+        assert stats["saturation"] == 0.9
+        assert stats["avg_wait_ms"] == 25.0
+        assert stats["requests_waiting"] == 2
+        assert pool.popped
+
+    @override_settings(
+        DB_POOL_ENABLED=True,
+        DB_POOL_STATS_INTERVAL=0,
+        DB_POOL_SATURATION_WARNING=0.8
+    )
+    def test_pool_middleware_report(self, monkeypatch):
+        """
+        Test that the middleware logs saturation and the interval stats.
+
+        Ensures:
+        - A saturated pool logs a WARNING naming the request path.
+        - An elapsed interval logs the INFO stats.
+        """
+        pool = FakePool(**SATURATED)
+        monkeypatch.setattr(db_pool_handler, "get_pool", lambda alias: pool)
+        events = []
+        monkeypatch.setattr(
+            db_pool_middleware,
+            "log_event",
+            lambda level, message, **kwargs: events.append(
+                (level, message, kwargs)
+            )
+        )
+        middleware = DatabasePoolMiddleware(lambda request: HttpResponse())
+
+        middleware(RequestFactory().get("/api/sales/sales-territories"))
+
+        assert [(level, message) for level, message, _ in events] == [
+            ("WARNING", "Database pool saturated"),
+            ("INFO", "Database pool stats"),
+        ]
+        assert events[0][2]["path"] == "/api/sales/sales-territories"
+
+    def test_pool_middleware_disabled(self, monkeypatch):
+        """
+        With `DB_POOL_ENABLED` off, the middleware reads no stats.
+        """
+        monkeypatch.setattr(
+            db_pool_middleware,
+            "get_pool_stats",
+            lambda *args, **kwargs: pytest.fail("stats read")
+        )
+        with override_settings(DB_POOL_ENABLED=False):
+            middleware = DatabasePoolMiddleware(
+                lambda request: HttpResponse()
+            )
+
+        response = middleware(RequestFactory().get("/"))
+
+        assert response.status_code == 200
@@ -0,0 +1,117 @@
+"""
+Tests for the precomputed OpenAPI schema endpoint.
+"""
+
+import gzip
+import json
+
+import pytest
+from rest_framework.reverse import reverse
+from decouple import config
+
+from api.config.openapi_schema import get_schema_documents
+
+
+DB_ALIAS = f"{config('TEST_DB_PROFILE')}"
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=[f"{DB_ALIAS}"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+
+class TestOpenApiSchemaEndpoints:
+    """
+    Tests for the schema served from memory.
+    """
+
+    def test_openapi_schema_gzip(self, api_client):
+        """
+        Test that the schema is sent precompressed and revalidated by ETag.
+
+        Ensures:
+        - Clients accepting gzip get the stored gzip bytes of the schema.
+        - A request repeating the ETag is answered with a 304.
+        - The schema is built once, not per request.
+        """
+        url = reverse("schema-json", kwargs={"format": "swagger.json"})
+        documents = get_schema_documents()
+
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+
+        assert response.status_code == 200
+        assert response['Content-Encoding'] == 'gzip'
+        assert response.content == documents['json'].gzipped
+        assert 'openapi' in json.loads(gzip.decompress(response.content))
+
+        response = api_client.get(
+            url,
+            HTTP_ACCEPT_ENCODING='gzip',
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+        assert response.status_code == 304
+        assert get_schema_documents() is documents
+
+    def test_openapi_schema_formats(self, api_client):
+        """
+        Test the identity encoding and the format selection.
+
+        Ensures:
+        - Clients not accepting gzip, or refusing it with `q=0`, get the
+        plain schema.
+        - YAML is served for `.yaml` and unknown formats are 404.
+        """
+        documents = get_schema_documents()
+
+        response = api_client.get(
+            reverse("schema-json", kwargs={"format": "swagger.json"})
+        )
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response
+        assert response.content == documents['json'].content
+
+        for refused in ('gzip;q=0', 'br, gzip; q=0.0', 'identity'):
+            response = api_client.get(
+                reverse("schema-json", kwargs={"format": "swagger.json"}),
+                HTTP_ACCEPT_ENCODING=refused
+            )
+            assert 'Content-Encoding' not in response
+            assert response.content == documents['json'].content
+
+        response = api_client.get(
+            reverse("schema-json", kwargs={"format": "swagger.yaml"})
+        )
+        assert response.content == documents['yaml'].content
+
+        response = api_client.get(
+            reverse("schema-json", kwargs={"format": "swagger.txt"})
+        )
+        assert response.status_code == 404
+
+    def test_openapi_schema_links_parameters(self):
+        """
+        Test that only HATEOAS resources document the `links` options.
+
+        Ensures:
+        - Sales territory lists default to `none`, their details to `full`.
+        - Country regions, which have no links, do not document them.
+        """
+        def links_default(path, method):
+            operation = schema['paths'][path][method]
+            return {
+                parameter['name']: parameter.get('schema', {}).get('default')
+                for parameter in operation.get('parameters', [])
+            }.get('links', 'absent')
+
+        schema = json.loads(get_schema_documents()['json'].content)
+
+        assert links_default('/api/sales/sales-territories/', 'get') == 'none'
+        assert links_default(
+            '/api/sales/sales-territories/{sales_territory_id}/', 'get'
+        ) == 'full'
+        assert links_default(
+            '/api/people/country-regions/', 'get'
+        ) == 'absent'
@@ -16,11 +16,20 @@ Contributor Notes:
 - Designed for institutional review and onboarding clarity.
 """
 
+import json
 import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
 from rest_framework.reverse import reverse
 from faker import Faker
 
 from api.people.models.country_region_model import CountryRegion
+from api.utils.invalidation_bus_handler import handle_notification
+from api.utils.reference_data_handler import (
+    get_reference,
+    get_reference_table
+)
+from api.utils.representation_cache_handler import get_representation_cache
 from tests.factories.people.country_region_factory import (
     CountryRegionFactory
 )
@@ -74,6 +83,94 @@ class TestCountryRegionEndpoints:
         assert response.headers["Content-Type"] == "application/json"
         assert isinstance(response.data, dict)
 
+    def test_country_region_list_stream(
+            self,
+            auth_client,
+            country_region_factory):
+        """
+        Test for streaming the unpaginated country region list.
+
+        Ensures:
+        - Endpoint returns 200 OK as a streaming JSON response.
+        - Body contains every row and a matching count.
+        """
+        data = CountryRegion.objects.all().last()
+        if not data:
+            list(country_region_factory.create_country_regions(3))
+
+        url = reverse(f"{BASENAME}-list")
+        response = auth_client.get(
+            url,
+            {'stream': 'true'},
+            HTTP_ACCEPT='application/json'
+        )
+        body = json.loads(b"".join(response.streaming_content))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response.headers["Content-Type"] == "application/json"
+        assert body['count'] == CountryRegion.objects.count()
+        assert len(body['data']) == body['count']
+
+    def test_country_region_list_sparse_fields(
+            self,
+            auth_client,
+            country_region_factory):
+        """
+        Test for trimming the country region list with `?fields=` and
+        `?exclude=`.
+
+        Ensures:
+        - `fields` returns only the requested fields.
+        - `exclude` leaves the excluded fields out.
+        - Unknown fields are rejected with 400 Bad Request.
+        - Create ignores the fieldset and returns the full representation.
+        """
+        data = CountryRegion.objects.all().last()
+        if not data:
+            list(country_region_factory.create_country_regions(3))
+
+        url = reverse(f"{BASENAME}-list")
+
+        response = auth_client.get(
+            url,
+            {'fields': 'country_region_code,name'},
+            HTTP_ACCEPT='application/json'
+        )
+        assert response.status_code == 200
+        for row in response.data['results']:
+            assert set(row) == {'country_region_code', 'name'}
+
+        response = auth_client.get(
+            url,
+            {'exclude': 'modified_date'},
+            HTTP_ACCEPT='application/json'
+        )
+        assert response.status_code == 200
+        for row in response.data['results']:
+            assert 'modified_date' not in row
+            assert 'name' in row
+
+        response = auth_client.get(
+            url,
+            {'fields': 'name,population'},
+            HTTP_ACCEPT='application/json'
+        )
+        assert response.status_code == 400
+
+        mock = country_region_factory.mock_country_region()
+        response = auth_client.post(
+            f"{url}?fields=name",
+            data=mock,
+            format='json'
+        )
+        assert response.status_code == 201
+        assert set(response.data['data']) >= {
+            'country_region_code',
+            'name',
+            'modified_date'
+        }
+
     def test_country_region_create(self, auth_client, country_region_factory):
         """
         Test for creating a country region via DRF endpoint.
@@ -276,6 +373,112 @@ class TestCountryRegionEndpoints:
         )
         assert response.data['data']['name'] == instance['name']
 
+    def test_country_region_retrieve_cached(
+            self,
+            auth_client,
+            country_region_factory):
+        """
+        Test that unchanged rows are served from the representation cache,
+        and changed rows are not.
+
+        Ensures:
+        - A second retrieve of the same row is a cache hit.
+        - A retrieve after a partial update returns the new name.
+        """
+        instance = country_region_factory.create_country_regions(1)
+        url = reverse(
+            f"{BASENAME}-detail",
+            kwargs={"country_region_code": instance['country_region_code']}
+        )
+        cache = get_representation_cache()
+        cache.clear()
+
+        first = auth_client.get(url, HTTP_ACCEPT='application/json')
+        hits = cache.stats()['hits']
+        second = auth_client.get(url, HTTP_ACCEPT='application/json')
+
+        assert second.status_code == 200
+        assert second.data['data'] == first.data['data']
+        assert cache.stats()['hits'] == hits + 1
+
+        name = Faker().name()
+        auth_client.patch(url, data={'name': name}, format='json')
+        response = auth_client.get(url, HTTP_ACCEPT='application/json')
+
+        assert response.data['data']['name'] == name
+
+    def test_country_region_reference_data(
+            self,
+            auth_client,
+            country_region_factory):
+        """
+        Test that country regions are served from the reference data cache,
+        and that writes through the API invalidate it.
+
+        Ensures:
+        - A loaded table serves lookups without queries.
+        - A partial update bumps the table version and the next lookup
+        returns the new name.
+        """
+        instance = country_region_factory.create_country_regions(1)
+        code = instance['country_region_code']
+        table = get_reference_table(CountryRegion)
+        get_reference(CountryRegion, code)
+        version = table.version
+
+        with CaptureQueriesContext(connections['default']) as queries:
+            assert get_reference(CountryRegion, code).name == (
+                instance['name']
+            )
+        assert len(queries) == 0
+
+        name = Faker().name()
+        url = reverse(
+            f"{BASENAME}-detail",
+            kwargs={"country_region_code": code}
+        )
+        auth_client.patch(url, data={'name': name}, format='json')
+
+        assert table.version > version
+        assert get_reference(CountryRegion, code).name == name
+
+    def test_country_region_invalidation_bus(
+            self,
+            auth_client,
+            country_region_factory):
+        """
+        Test that an invalidation bus notification evicts a row changed
+        without Django noticing.
+
+        Ensures:
+        - A `QuerySet.update()` keeping `modified_date` leaves the cached
+        row in place.
+        - The notification of the trigger evicts it from the representation
+        and reference data caches.
+        """
+        instance = country_region_factory.create_country_regions(1)
+        code = instance['country_region_code']
+        url = reverse(
+            f"{BASENAME}-detail",
+            kwargs={"country_region_code": code}
+        )
+        auth_client.get(url, HTTP_ACCEPT='application/json')
+        get_reference(CountryRegion, code)
+
+        name = Faker().name()
+        CountryRegion.objects.filter(pk=code).update(name=name)
+        response = auth_client.get(url, HTTP_ACCEPT='application/json')
+        assert response.data['data']['name'] == instance['name']
+
+        handle_notification(json.dumps({
+            'table': CountryRegion._meta.db_table,
+            'pk': code
+        }))
+        response = auth_client.get(url, HTTP_ACCEPT='application/json')
+
+        assert response.data['data']['name'] == name
+        assert get_reference(CountryRegion, code).name == name
+
     def test_country_region_delete(self, auth_client, country_region_factory):
         """
         tba
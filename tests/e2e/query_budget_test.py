@@ -0,0 +1,136 @@
+"""
+Tests for the per-request query budget middleware.
+"""
+
+import pytest
+from django.test import RequestFactory, override_settings
+from rest_framework import viewsets
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from decouple import config
+
+from api.middleware import query_budget_middleware
+from api.middleware.query_budget_middleware import QueryBudgetMiddleware
+from api.people.models.country_region_model import CountryRegion
+
+
+DB_ALIAS = f"{config('TEST_DB_PROFILE')}"
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=[f"{DB_ALIAS}"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+
+class BudgetViewSet(viewsets.ViewSet):
+    """
+    Stand-in viewset running the same lookup four times per list.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+    query_budget = {'list': 2, 'retrieve': 10}
+
+    def list(self, request):
+        """Run four identical lookups."""
+        for code in ('US', 'CA', 'FR', 'DE'):
+            CountryRegion.objects.filter(country_region_code=code).exists()
+        return Response({'ok': True})
+
+
+@pytest.fixture(name="events")
+def fixture_events(monkeypatch):
+    """
+    Events logged by the middleware.
+    """
+    events = []
+    monkeypatch.setattr(
+        query_budget_middleware,
+        "log_event",
+        lambda level, message, **kwargs: events.append(
+            (level, message, kwargs)
+        )
+    )
+    return events
+
+
+def build_middleware() -> QueryBudgetMiddleware:
+    """
+    Wrap `BudgetViewSet.list` in the middleware, calling its view and
+    template response hooks the way Django's request handler does.
+    """
+    view = BudgetViewSet.as_view({'get': 'list'})
+
+    def get_response(request):
+        middleware.process_view(request, view, (), {})
+        response = view(request)
+        response = middleware.process_template_response(request, response)
+        return response.render()
+
+    middleware = QueryBudgetMiddleware(get_response)
+    return middleware
+
+
+class TestQueryBudgetMiddleware:
+    """
+    Tests for `QueryBudgetMiddleware`.
+    """
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=3)
+    def test_query_budget_exceeded(self, events):
+        """
+        Test the header and the report of a request over its budget.
+
+        Ensures:
+        - `Server-Timing` holds the db, serialize, render and total phases,
+          with the statement count.
+        - The request is logged once as over the action's budget, with the
+          repeated statement shape.
+        """
+        response = build_middleware()(RequestFactory().get("/budget"))
+        timing = response["Server-Timing"]
+
+        assert timing.startswith('db;dur=')
+        assert 'desc="4 queries"' in timing
+        for metric in ('serialize;dur=', 'render;dur=', 'total;dur='):
+            assert metric in timing
+
+        assert len(events) == 1
+        level, message, fields = events[0]
+        assert (level, message) == ("WARNING", "Query budget exceeded")
+        assert fields["view"] == "BudgetViewSet"
+        assert fields["action"] == "list"
+        assert (fields["queries"], fields["budget"]) == (4, 2)
+        assert [shape["count"] for shape in fields["repeated"]] == [4]
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=3)
+    def test_query_budget_repeated(self, events, monkeypatch):
+        """
+        Test that repeated statements are reported within the budget.
+
+        Ensures:
+        - A request within budget that repeats a statement shape is logged
+          as repeated queries.
+        """
+        monkeypatch.setattr(BudgetViewSet, "query_budget", 10)
+
+        build_middleware()(RequestFactory().get("/budget"))
+
+        assert [(level, message) for level, message, _ in events] == [
+            ("WARNING", "Repeated queries detected"),
+        ]
+
+    def test_query_budget_within(self, events, monkeypatch):
+        """
+        Test that a request within budget and below the repeat threshold is
+        not logged.
+        """
+        monkeypatch.setattr(BudgetViewSet, "query_budget", 10)
+
+        with override_settings(QUERY_REPEAT_THRESHOLD=5):
+            response = build_middleware()(RequestFactory().get("/budget"))
+
+        assert 'desc="4 queries"' in response["Server-Timing"]
+        assert not events
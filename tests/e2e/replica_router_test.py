@@ -0,0 +1,127 @@
+"""
+Tests for the read-replica router and its read-your-writes middleware.
+"""
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from api.db import replica_router
+from api.db.replica_router import (
+    ReplicaRouter,
+    use_primary,
+    use_replica_per_request
+)
+from api.middleware.replica_pin_middleware import ReplicaPinMiddleware
+from api.people.models.country_region_model import CountryRegion
+
+
+pytestmark = [
+                pytest.mark.e2e,
+                pytest.mark.usefixtures("replicas")
+             ]
+
+
+@pytest.fixture(name="replicas")
+def fixture_replicas(monkeypatch):
+    """
+    Two replicas of `default`, within the lag limit unless listed in the
+    returned set.
+    """
+    lagging = set()
+    monkeypatch.setattr(
+        replica_router,
+        "get_replica_lag",
+        lambda alias: 60.0 if alias in lagging else 0.0
+    )
+    with override_settings(
+        DATABASE_APPS_MAPPING={},
+        DATABASE_REPLICAS={"default": ["replica_0", "replica_1"]}
+    ):
+        yield lagging
+
+
+def read_alias(request) -> HttpResponse:
+    """
+    Stand-in view answering with the alias reads are routed to.
+    """
+    alias = ReplicaRouter().db_for_read(CountryRegion) or "primary"
+    return HttpResponse(alias)
+
+
+class TestReplicaRouter:
+    """
+    Tests for `ReplicaRouter` and `ReplicaPinMiddleware`.
+    """
+
+    def test_replica_per_request(self, monkeypatch):
+        """
+        Test that a request reads from a single replica.
+
+        Ensures:
+        - The replica is picked once, on the first read.
+        - Every read of the request goes to that replica.
+        """
+        picks = []
+        monkeypatch.setattr(
+            replica_router.random,
+            "choice",
+            lambda replicas: picks.append(replicas) or replicas[-1]
+        )
+        router = ReplicaRouter()
+
+        with use_replica_per_request():
+            aliases = {router.db_for_read(CountryRegion) for _ in range(5)}
+
+        assert aliases == {"replica_1"}
+        assert picks == [["replica_0", "replica_1"]]
+
+    def test_replica_lag_and_primary(self, replicas):
+        """
+        Test the cases where reads go to the primary.
+
+        Ensures:
+        - Lagging replicas are skipped; with none left, reads go to the
+          primary.
+        - Reads inside `use_primary()` go to the primary.
+        """
+        router = ReplicaRouter()
+        replicas.add("replica_0")
+
+        assert router.db_for_read(CountryRegion) == "replica_1"
+
+        replicas.add("replica_1")
+        assert router.db_for_read(CountryRegion) is None
+
+        replicas.clear()
+        with use_primary():
+            assert router.db_for_read(CountryRegion) is None
+
+    def test_replica_pin_after_write(self):
+        """
+        Test read-your-writes pinning across requests.
+
+        Ensures:
+        - A write runs on the primary and sets a signed pin cookie.
+        - A read sending the pin back runs on the primary.
+        - A read with a forged pin, or none, runs on a replica.
+        """
+        middleware = ReplicaPinMiddleware(read_alias)
+        factory = RequestFactory()
+
+        response = middleware(factory.post("/api/people/country-regions"))
+        cookie = response.cookies[middleware.cookie_name]
+
+        assert response.content == b"primary"
+        assert cookie["httponly"]
+
+        request = factory.get("/api/people/country-regions")
+        request.COOKIES[middleware.cookie_name] = cookie.value
+        assert middleware(request).content == b"primary"
+
+        request = factory.get("/api/people/country-regions")
+        request.COOKIES[middleware.cookie_name] = "1:forged:signature"
+        assert middleware(request).content.startswith(b"replica_")
+
+        request = factory.get("/api/people/country-regions")
+        assert middleware(request).content.startswith(b"replica_")
@@ -0,0 +1,87 @@
+"""
+Tests for the eviction generations and shared namespaces of the
+representation cache.
+"""
+
+import uuid
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from api.utils.representation_cache_handler import RepresentationCache
+
+
+pytestmark = [pytest.mark.unit]
+
+OWNER = ("people.countryregion", "DE")
+KEY = "rep:shape:people.countryregion:DE:2024-05-01T10:20:30"
+
+
+def build_backend() -> LocMemCache:
+    """
+    Return a shared backend of its own, as another worker would see it.
+    """
+    return LocMemCache(f"representation-{uuid.uuid4()}", {})
+
+
+class TestRepresentationCache:
+    """
+    Tests for `RepresentationCache`.
+    """
+
+    def test_representation_cache_evicted_while_serializing(self):
+        """
+        Test that an entry built before an eviction is not stored.
+
+        Ensures:
+        - `set()` is refused locally and in the shared backend when the row
+        was evicted after its generation was read.
+        - A later `set()` with a fresh generation is stored.
+        """
+        cache = RepresentationCache(10, backend=build_backend())
+
+        generation = cache.generation(OWNER)
+        cache.evict(*OWNER)
+
+        assert cache.set(KEY, {"name": "Germany"}, OWNER, generation) is False
+        assert cache.get(KEY, OWNER) is None
+
+        generation = cache.generation(OWNER)
+        assert cache.set(KEY, {"name": "Germany"}, OWNER, generation)
+        assert cache.get(KEY, OWNER) == {"name": "Germany"}
+
+    def test_representation_cache_table_eviction(self):
+        """
+        Test that a whole-model eviction reaches the generation and the
+        shared entries written by another worker.
+
+        Ensures:
+        - A generation read before the eviction is refused.
+        - Shared entries this worker never knew are no longer read.
+        """
+        backend = build_backend()
+        worker = RepresentationCache(10, backend=backend)
+        other = RepresentationCache(10, backend=backend)
+
+        generation = worker.generation(OWNER)
+        other.set(KEY, {"name": "Germany"}, OWNER)
+        worker.evict(OWNER[0])
+
+        assert not worker.set(KEY, {"name": "Stale"}, OWNER, generation)
+        assert worker.get(KEY, OWNER) is None
+
+    def test_representation_cache_clear(self):
+        """
+        Test that clearing the cache moves the shared backend to a new
+        namespace.
+        """
+        backend = build_backend()
+        worker = RepresentationCache(10, backend=backend)
+        RepresentationCache(10, backend=backend).set(
+            KEY, {"name": "Germany"}, OWNER
+        )
+        assert worker.get(KEY, OWNER) == {"name": "Germany"}
+
+        worker.clear()
+
+        assert worker.get(KEY, OWNER) is None
@@ -0,0 +1,109 @@
+"""
+Tests for the per-request database deadlines.
+"""
+
+import pytest
+from django.db import connections
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from decouple import config
+
+from api.people.models.country_region_model import CountryRegion
+from api.utils.request_deadline_mixin import RequestDeadlineMixin
+from tests.factories.people.country_region_factory import (
+    CountryRegionFactory
+)
+
+
+DB_ALIAS = f"{config('TEST_DB_PROFILE')}"
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=[f"{DB_ALIAS}"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+
+def show_statement_timeout(alias: str) -> str:
+    """
+    Return the `statement_timeout` of an alias's session.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute("SHOW statement_timeout")
+        return cursor.fetchone()[0]
+
+
+class DeadlineViewSet(RequestDeadlineMixin, viewsets.GenericViewSet):
+    """
+    Stand-in viewset with a 200 ms deadline.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+    queryset = CountryRegion.objects.all()
+    request_deadline = 200
+
+    def list(self, request):
+        """Report the deadline in force; sleep past it on `?sleep=true`."""
+        alias = self.deadline_alias
+        if request.query_params.get('sleep'):
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT pg_sleep(1)")
+        return Response({
+            'atomic': connections[alias].in_atomic_block,
+            'timeout': show_statement_timeout(alias),
+        })
+
+    def create(self, request):
+        """Write a country region, then fail validation."""
+        self.get_queryset().create(**request.data)
+        raise ValidationError("Refused after the write.")
+
+
+class TestRequestDeadline:
+    """
+    Tests for `RequestDeadlineMixin`.
+    """
+
+    def test_request_deadline_read(self):
+        """
+        Test the deadline of safe requests.
+
+        Ensures:
+        - The timeout is in force without opening a transaction.
+        - A statement overrunning the deadline is answered with a 504.
+        - The session's timeout is reset after the request.
+        """
+        view = DeadlineViewSet.as_view({'get': 'list'})
+        factory = APIRequestFactory()
+        before = show_statement_timeout(DB_ALIAS)
+
+        response = view(factory.get("/deadline"))
+
+        assert response.data == {'atomic': False, 'timeout': '200ms'}
+
+        response = view(factory.get("/deadline", {'sleep': 'true'}))
+
+        assert response.status_code == 504
+        assert response.data['error_type'] == 'DatabaseTimeout'
+        assert show_statement_timeout(DB_ALIAS) == before
+
+    def test_request_deadline_rollback(self):
+        """
+        Test that a write answered with an error status is rolled back.
+        """
+        view = DeadlineViewSet.as_view({'post': 'create'})
+        data = CountryRegionFactory().mock_country_region()
+
+        response = view(
+            APIRequestFactory().post("/deadline", data, format='json')
+        )
+
+        assert response.status_code == 400
+        assert not CountryRegion.objects.filter(
+            country_region_code=data['country_region_code']
+        ).exists()
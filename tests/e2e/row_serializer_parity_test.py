@@ -0,0 +1,135 @@
+"""
+Parity tests for the compiled `values()` read path.
+
+`RowSerializer` must render exactly what the model serializers render: the
+same keys, in the same order, with the same value formatting (Decimal
+strings, datetimes, UUIDs, nested country regions).
+"""
+
+import json
+
+import pytest
+from model_bakery import baker
+from rest_framework.utils.encoders import JSONEncoder
+
+from api.people.models.address_type_model import AddressType
+from api.people.models.country_region_model import CountryRegion
+from api.people.models.state_province_model import StateProvince
+from api.people.serializers.address_type_serializer import (
+    AddressTypeSerializer
+)
+from api.people.serializers.country_region_serializer import (
+    CountryRegionSerializer
+)
+from api.people.serializers.state_province_serializer import (
+    StateProvinceSerializer
+)
+from api.sales.models.sales_territory_model import SalesTerritory
+from api.sales.serializers.sales_territory_serializer import (
+    SalesTerritorySerializer
+)
+from api.utils.row_serializer_handler import RowSerializer
+from api.utils.sparse_fieldset_mixin import include_fields, parse_field_tree
+from tests.factories.people.address_type_factory import AddressTypeFactory
+from tests.factories.people.country_region_factory import (
+    CountryRegionFactory
+)
+from tests.factories.sales.sales_territory_factory import (
+    SalesTerritoryFactory
+)
+
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=["default"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+SERIALIZERS = [
+    (AddressType, AddressTypeSerializer, 'address_type_id'),
+    (CountryRegion, CountryRegionSerializer, 'country_region_code'),
+    (StateProvince, StateProvinceSerializer, 'state_province_id'),
+    (SalesTerritory, SalesTerritorySerializer, 'sales_territory_id'),
+]
+
+
+@pytest.fixture
+def populated():
+    """
+    Make sure every model has rows to compare.
+    """
+    # pylint: disable=no-member
+    if AddressType.objects.count() < 3:
+        AddressTypeFactory().create_address_types(3)
+    if CountryRegion.objects.count() < 3:
+        CountryRegionFactory().create_country_regions(3)
+    if SalesTerritory.objects.count() < 3:
+        SalesTerritoryFactory().create_sales_territories(3)
+    if StateProvince.objects.count() < 3:
+        baker.make(StateProvince, _quantity=3)
+
+
+def render(data) -> str:
+    """
+    Encode like the JSON renderer, keeping key order.
+    """
+    return json.dumps(data, cls=JSONEncoder)
+
+
+class TestRowSerializerParity:
+    """
+    Compiled rows render exactly like the model serializers.
+    """
+    # pylint: disable=no-member,redefined-outer-name,unused-argument
+
+    @pytest.mark.parametrize("model, serializer_class, ordering", SERIALIZERS)
+    def test_row_serializer_parity(
+            self,
+            populated,
+            model,
+            serializer_class,
+            ordering):
+        """
+        Every row renders identically.
+        """
+        queryset = model.objects.all().order_by(ordering)
+        rows = RowSerializer(serializer_class())
+
+        expected = serializer_class(queryset, many=True).data
+        actual = rows.serialize(rows.values(queryset))
+
+        assert len(actual) == len(expected)
+        for row, instance in zip(actual, expected):
+            assert list(row) == list(instance)
+            assert render(row) == render(instance)
+
+    @pytest.mark.parametrize("model, serializer_class, fields", [
+        (StateProvince, StateProvinceSerializer, 'name,country_region__name'),
+        (SalesTerritory, SalesTerritorySerializer,
+         'sales_ytd,country_region_detail__country_region_code'),
+    ])
+    def test_row_serializer_parity_sparse(
+            self,
+            populated,
+            model,
+            serializer_class,
+            fields):
+        """
+        Trimmed serializers render identically too.
+        """
+        tree = parse_field_tree(fields)
+        queryset = model.objects.all().order_by('pk')
+
+        serializer = serializer_class(queryset, many=True)
+        include_fields(serializer.child, tree)
+        trimmed = serializer_class()
+        include_fields(trimmed, tree)
+        rows = RowSerializer(trimmed)
+
+        expected = serializer.data
+        actual = rows.serialize(rows.values(queryset))
+
+        assert [render(row) for row in actual] == [
+            render(instance) for instance in expected
+        ]
@@ -2,14 +2,25 @@
 tba
 """
 
+import uuid
+
+import cbor2
+import msgpack
 import pytest
+from django.db import connections
 from django.forms.models import model_to_dict
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
 
+from api.people.models.country_region_model import CountryRegion
 from api.sales.models.sales_territory_model import SalesTerritory
 from api.sales.serializers.sales_territory_serializer import (
     SalesTerritorySerializer
 )
+from api.sales.views.sales_territory_viewset import SalesTerritoryViewSet
+from api.utils.reference_data_handler import get_reference
 from tests.factories.people.country_region_factory import (
     CountryRegionFactory
 )
@@ -69,6 +80,129 @@ class TestSalesTerritoryEndpoints:
         assert response.headers["Content-Type"] == "application/json"
         assert isinstance(response.data, dict)
 
+    def test_sales_territory_list_keyset(
+            self,
+            auth_client,
+            sales_territory_factory):
+        """
+        Test for walking the sales territory list with keyset cursors.
+
+        Ensures:
+        - Pages are linked through opaque `next` cursors.
+        - Pages do not overlap and come back in `sales_territory_id` order.
+        """
+        if SalesTerritory.objects.count() < 3:
+            sales_territory_factory.create_sales_territories(3)
+
+        url = reverse(f"{BASENAME}-list")
+        response = auth_client.get(
+            url,
+            {'page_size': 2},
+            HTTP_ACCEPT='application/json'
+        )
+        first_page = response.data['results']
+
+        assert response.status_code == 200
+        assert isinstance(response.data['count_exact'], bool)
+        assert response.data['previous'] is None
+        assert response.data['next'] is not None
+
+        response = auth_client.get(
+            response.data['next'],
+            HTTP_ACCEPT='application/json'
+        )
+        second_page = response.data['results']
+        ids = [row['sales_territory_id'] for row in first_page + second_page]
+
+        assert response.status_code == 200
+        assert response.data['previous'] is not None
+        assert ids == sorted(set(ids))
+
+    def test_sales_territory_list_query_count(
+            self,
+            auth_client,
+            sales_territory_factory):
+        """
+        Test that the nested country regions are loaded with the territories.
+
+        Ensures:
+        - The number of queries does not grow with the page size.
+        - Each row carries its nested `country_region_detail`.
+        """
+        sales_territory_factory.create_sales_territories(5)
+        url = reverse(f"{BASENAME}-list")
+        # the first request loads the reference tables
+        auth_client.get(url, HTTP_ACCEPT='application/json')
+
+        counts = []
+        for page_size in (1, 5):
+            with CaptureQueriesContext(connections["default"]) as queries:
+                response = auth_client.get(
+                    url,
+                    {'page_size': page_size},
+                    HTTP_ACCEPT='application/json'
+                )
+            results = response.data['results']
+
+            assert response.status_code == 200
+            assert len(results) == page_size
+            assert all(row['country_region_detail'] for row in results)
+            counts.append(len(queries))
+
+        assert counts[0] == counts[1]
+
+    def test_sales_territory_list_count(
+            self,
+            auth_client,
+            sales_territory_factory):
+        """
+        Test that keyset pages only count on request.
+
+        Ensures:
+        - Without `?count=`, no COUNT(*) query runs and `count` is null.
+        - `?count=exact` counts exactly.
+        - `?count=estimate` estimates above the threshold read from the
+          settings at request time, and counts exactly below it.
+        """
+        if SalesTerritory.objects.count() < 3:
+            sales_territory_factory.create_sales_territories(3)
+        with connections["default"].cursor() as cursor:
+            cursor.execute(f"ANALYZE {SalesTerritory._meta.db_table}")
+
+        url = reverse(f"{BASENAME}-list")
+        with CaptureQueriesContext(connections["default"]) as queries:
+            response = auth_client.get(url, HTTP_ACCEPT='application/json')
+
+        assert response.data['count'] is None
+        assert not any(
+            'COUNT(*)' in query['sql'].upper() for query in queries
+        )
+
+        response = auth_client.get(
+            url,
+            {'count': 'exact'},
+            HTTP_ACCEPT='application/json'
+        )
+        assert response.data['count'] == SalesTerritory.objects.count()
+        assert response.data['count_exact'] is True
+
+        with override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=0):
+            response = auth_client.get(
+                url,
+                {'count': 'estimate'},
+                HTTP_ACCEPT='application/json'
+            )
+        assert isinstance(response.data['count'], int)
+        assert response.data['count_exact'] is False
+
+        with override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=10**9):
+            response = auth_client.get(
+                url,
+                {'count': 'estimate'},
+                HTTP_ACCEPT='application/json'
+            )
+        assert response.data['count_exact'] is True
+
     def test_sales_territory_create(
             self,
             auth_client,
@@ -146,6 +280,191 @@ class TestSalesTerritoryEndpoints:
         assert response.headers["Content-Type"] == "application/json"
         assert isinstance(response.data, dict)
 
+    def test_sales_territory_links_neighbors(self, sales_territory_factory):
+        """
+        The next/previous links of a list are looked up in a single query.
+        """
+        if SalesTerritory.objects.count() < 3:
+            sales_territory_factory.create_sales_territories(3)
+
+        territories = list(
+            SalesTerritory.objects.select_related('country_region')
+            .order_by('sales_territory_id')
+        )
+        request = APIRequestFactory().get('/')
+        # nested regions come from the (loaded) reference data cache
+        get_reference(CountryRegion, territories[0].country_region_id)
+
+        with CaptureQueriesContext(connections['default']) as queries:
+            data = SalesTerritorySerializer(
+                territories,
+                many=True,
+                context={'request': request}
+            ).data
+
+        assert len(queries) == 1
+        assert data[0]['_links']['previous'] is None
+        assert data[0]['_links']['next'] == data[1]['_links']['self']['href']
+        assert data[-1]['_links']['next'] is None
+
+    def test_sales_territory_nested_identity_map(
+            self,
+            sales_territory_factory):
+        """
+        Rows pointing at the same country region share one region instance
+        and one serialized region.
+        """
+        if SalesTerritory.objects.count() < 3:
+            sales_territory_factory.create_sales_territories(3)
+
+        territories = list(
+            SalesTerritory.objects.prefetch_related('country_region')
+            .order_by('sales_territory_id')[:3]
+        )
+        for territory in territories:
+            territory.country_region = territories[0].country_region
+        request = APIRequestFactory().get('/', {'links': 'none'})
+        get_reference(CountryRegion, territories[0].country_region_id)
+
+        with CaptureQueriesContext(connections['default']) as queries:
+            data = SalesTerritorySerializer(
+                territories,
+                many=True,
+                context={'request': request}
+            ).data
+
+        assert len(queries) == 0
+        first = data[0]['country_region_detail']
+        assert all(row['country_region_detail'] is first for row in data)
+
+    @pytest.mark.parametrize(
+        "mode, row_links",
+        [(None, None), ("none", None), ("compact", ["self"])]
+    )
+    def test_sales_territory_list_links_mode(
+            self,
+            auth_client,
+            sales_territory_factory,
+            mode,
+            row_links):
+        """
+        `?links=` trims the per-row links; collection links appear once per
+        page. Without it, lists have no links (`HATEOAS_LIST_LINKS_DEFAULT`).
+        """
+        if not SalesTerritory.objects.exists():
+            sales_territory_factory.create_sales_territories(3)
+
+        response = auth_client.get(
+            reverse(f"{BASENAME}-list"),
+            {"links": mode} if mode else {},
+            HTTP_ACCEPT='application/json'
+        )
+
+        assert response.status_code == 200
+        for row in response.data['results']:
+            assert sorted(row.get('_links', {})) == sorted(row_links or [])
+        if mode in (None, "none"):
+            assert '_links' not in response.data
+        else:
+            assert response.data['_links']['list']['method'] == 'GET'
+
+    @pytest.mark.parametrize("media_type, decode", [
+        ("application/msgpack", msgpack.unpackb),
+        ("application/cbor", cbor2.loads),
+    ])
+    def test_sales_territory_list_binary(
+            self,
+            auth_client,
+            sales_territory_factory,
+            media_type,
+            decode):
+        """
+        Binary renderers carry the same page, links and envelope as JSON.
+        """
+        if not SalesTerritory.objects.exists():
+            sales_territory_factory.create_sales_territories(3)
+        url = reverse(f"{BASENAME}-list")
+
+        expected = auth_client.get(url, HTTP_ACCEPT='application/json')
+        response = auth_client.get(url, HTTP_ACCEPT=media_type)
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == media_type
+        assert decode(response.content) == expected.json()
+
+    @pytest.mark.parametrize("action", ["list", "detail"])
+    def test_sales_territory_conditional_get(
+            self,
+            auth_client,
+            sales_territory_factory,
+            monkeypatch,
+            action):
+        """
+        A matching `If-None-Match` is answered with 304 after one aggregate
+        query on the table, without serializing anything; a change to the
+        row gives a new ETag. Lists carry no `Last-Modified`.
+        """
+        if not SalesTerritory.objects.exists():
+            sales_territory_factory.create_sales_territories(1)
+        territory = SalesTerritory.objects.order_by('sales_territory_id')[0]
+        kwargs = (
+            {"sales_territory_id": territory.sales_territory_id}
+            if action == "detail" else {}
+        )
+        url = reverse(f"{BASENAME}-{action}", kwargs=kwargs)
+
+        response = auth_client.get(url, HTTP_ACCEPT='application/json')
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+        assert ("Last-Modified" in response.headers) == (action == "detail")
+        if action == "list":
+            territory = SalesTerritory.objects.get(
+                pk=response.data['results'][0]['sales_territory_id']
+            )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("serialized on a 304")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(SalesTerritorySerializer, "to_representation", fail)
+            patch.setattr(SalesTerritoryViewSet, "serialize_page", fail)
+            with CaptureQueriesContext(connections['default']) as queries:
+                response = auth_client.get(
+                    url,
+                    HTTP_ACCEPT='application/json',
+                    HTTP_IF_NONE_MATCH=etag
+                )
+        table_queries = [
+            query['sql'] for query in queries
+            if 'sales_territories' in query['sql']
+        ]
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers["ETag"] == etag
+        assert len(table_queries) == 1
+        assert 'MAX(' in table_queries[0]
+
+        territory.name = f"Territory {uuid.uuid4().hex}"
+        territory.save()
+        response = auth_client.get(
+            url,
+            HTTP_ACCEPT='application/json',
+            HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_sales_territory_list_links_invalid(self, auth_client):
+        """
+        Unknown link modes are rejected.
+        """
+        response = auth_client.get(
+            reverse(f"{BASENAME}-list"),
+            {"links": "verbose"},
+            HTTP_ACCEPT='application/json'
+        )
+        assert response.status_code == 400
+
     def test_sales_territory_update(
             self,
             auth_client,
@@ -0,0 +1,71 @@
+"""
+Tests for the per-domain schema router and its cross-database join guard.
+"""
+
+import pytest
+from django.test import override_settings
+
+from api.db import schema_router
+from api.db.schema_router import CrossDatabaseJoinError, get_server
+from api.people.models.address_type_model import AddressType
+from api.people.models.state_province_model import StateProvince
+
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=["default", "people", "sales"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+
+@pytest.fixture(name="sales_server")
+def fixture_sales_server(monkeypatch):
+    """
+    Route each domain to its alias, with `sales` on a server of its own.
+    """
+    monkeypatch.setattr(
+        schema_router,
+        "get_server",
+        lambda alias: (
+            ("sales.internal", "5432", "sales") if alias == "sales"
+            else get_server(alias)
+        )
+    )
+    with override_settings(
+        DATABASE_APPS_MAPPING={"people": "people", "sales": "sales"}
+    ):
+        yield
+
+
+class TestSchemaRouter:
+    """
+    Tests for `CrossDatabaseJoinError`.
+    """
+
+    def test_cross_server_join(self, sales_server):
+        """
+        Test that a join spanning database servers is refused.
+
+        Ensures:
+        - `select_related` across servers raises before the query is sent.
+        - Filters across servers raise too.
+        """
+        with pytest.raises(CrossDatabaseJoinError):
+            list(StateProvince.objects.select_related("sales_territory"))
+
+        with pytest.raises(CrossDatabaseJoinError):
+            StateProvince.objects.filter(
+                sales_territory__name="Northwest"
+            ).exists()
+
+    def test_same_server_join(self, sales_server):
+        """
+        Test that queries within one server are unaffected, on any model.
+
+        Ensures:
+        - Joins within the `people` server run.
+        - Models with their default manager are checked and run.
+        """
+        list(StateProvince.objects.select_related("country_region")[:1])
+        AddressType.objects.exists()
@@ -0,0 +1,95 @@
+"""
+Tests for the shared token-bucket throttles.
+"""
+
+import uuid
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+from decouple import config
+
+from api.utils.throttle_handler import (
+    execute,
+    get_throttle_scope,
+    take_token
+)
+
+
+DB_ALIAS = f"{config('TEST_DB_PROFILE')}"
+
+pytestmark = [
+                pytest.mark.django_db(
+                    databases=[f"{DB_ALIAS}"],
+                    transaction=True),
+                pytest.mark.e2e
+             ]
+
+
+class TestTokenBucketThrottle:
+    """
+    Tests for the buckets kept in `api_throttle_buckets`.
+    """
+
+    def test_token_bucket_take(self):
+        """
+        Test that a bucket allows a burst of `capacity` requests, then
+        throttles until a token is refilled.
+
+        Ensures:
+        - The first `capacity` requests are allowed without waiting.
+        - The next one is refused, with the time to the next token.
+        """
+        key = f"throttle_test_{uuid.uuid4().hex}"
+
+        results = [take_token(key, 3, 0.01) for _ in range(4)]
+
+        assert [allowed for allowed, _ in results] == [True] * 3 + [False]
+        assert results[0][1] == 0.0
+        assert 0 < results[-1][1] <= 100
+
+    def test_token_bucket_outside_transaction(self):
+        """
+        Test that a token taken during a transaction is not rolled back
+        with it.
+        """
+        key = f"throttle_test_{uuid.uuid4().hex}"
+
+        with transaction.atomic(using=DB_ALIAS):
+            assert take_token(key, 1, 0.01)[0]
+            transaction.set_rollback(True, using=DB_ALIAS)
+
+        assert not take_token(key, 1, 0.01)[0]
+
+    def test_token_bucket_create_table(self):
+        """
+        Test that `create_throttle_table` can be run on an existing table.
+        """
+        call_command("create_throttle_table")
+        call_command("create_throttle_table")
+
+        assert execute(
+            "SELECT to_regclass('public.api_throttle_buckets') IS NOT NULL"
+        ) == (True,)
+
+    def test_token_bucket_scope(self):
+        """
+        Test the per-viewset and per-action scopes.
+
+        Ensures:
+        - A string scope applies to every action.
+        - A dict scope applies to the actions it lists only.
+        """
+        class View:
+            """Stand-in viewset."""
+            action = 'create'
+            throttle_scope = 'reads'
+
+        view = View()
+        assert get_throttle_scope(view) == 'reads'
+
+        view.throttle_scope = {'create': 'writes'}
+        assert get_throttle_scope(view) == 'writes'
+
+        view.action = 'list'
+        assert get_throttle_scope(view) is None